@@ -23,6 +23,29 @@
 # SOFTWARE.
 
 
-from .client import Client
+import sys
+import types
+
 
 __all__ = ['Client', ]
+
+
+class _Package(types.ModuleType):
+    """
+    The `batfish` package, importing the client, and requests, on first
+    use so that importing a submodule such as batfish.cli stays cheap.
+    """
+
+    def __getattr__(self, name):
+        if name == 'Client':
+            from .client import Client
+            return Client
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(
+            self.__name__, name))
+
+
+if sys.version_info >= (3, 5):
+    # modules only accept a new class from Python 3.5
+    sys.modules[__name__].__class__ = _Package
+else:
+    from .client import Client
@@ -0,0 +1,555 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .client import (Client, droplet_actions, droplet_image_actions,
+                     read_token_from_conf, valid_chars, write_token_to_conf)
+from .jsonstream import loads
+from .models import Droplet, Image, Region, Size
+
+
+class AsyncClient(object):
+    """
+    A Digital Ocean V2 client for asyncio, mirroring
+    `batfish.client.Client` with coroutines. Requires Python 3.6 or later
+    and `aiohttp`.
+
+        >>> async with batfish.aio.AsyncClient() as cli:
+        ...     await cli.droplets()
+        [<Droplet droplet-1>, <Droplet droplet-2>, <Droplet droplet-3>]
+
+    :param limit: Maximum number of simultaneous connections.
+    :param limit_per_host: Maximum number of simultaneous connections to the
+                           API host, `0` for no limit.
+    """
+
+    token = None
+    """API authentication token."""
+    api_base = Client.api_base
+    """API URL."""
+    ua = Client.ua
+    """Default User-Agent header."""
+    per_page = Client.per_page
+    """Number of items requested per page from paginated listings."""
+
+    def __init__(self, limit=100, limit_per_host=0):
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp, install it with "
+                              "`pip install batfish[async]`.")
+        token = read_token_from_conf()
+        if token is not None:
+            self.token = token
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @property
+    def session(self):
+        """An `aiohttp.ClientSession`, created on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _url(self, url):
+        if url.startswith(self.api_base):
+            return url
+        return "{0}{1}".format(self.api_base, url)
+
+    def _headers(self, payload=False):
+        headers = {'Authorization': "Bearer {0}".format(self.token),
+                   'User-Agent': self.ua}
+        if payload:
+            headers['Content-Type'] = "application/json"
+        return headers
+
+    async def get(self, url, headers=None):
+        """
+        Send a GET request to the specified URL.
+
+        :param url: URI part to query.
+        :param headers: Dictionary of headers to send.
+        :rtype: Dictionary of the JSON response.
+        """
+        if headers is None:
+            headers = self._headers()
+        headers['User-Agent'] = self.ua
+        async with self.session.get(self._url(url), headers=headers) as r:
+            r.raise_for_status()
+            return loads(await r.read())
+
+    async def post(self, url, payload):
+        """
+        Send a POST request to the specified URL with the payload.
+
+        :param url: URI part to query.
+        :param payload: Dictionary of payload data.
+        :rtype: Dictionary of the JSON response.
+        """
+        async with self.session.post(self._url(url),
+                                     headers=self._headers(payload=True),
+                                     data=json.dumps(payload)) as r:
+            r.raise_for_status()
+            return loads(await r.read())
+
+    async def put(self, url, payload):
+        """
+        Send a PUT request to the specified URL with the payload.
+
+        :param url: URI part to query.
+        :param payload: Dictionary of payload data.
+        :rtype: Dictionary of the JSON response.
+        """
+        async with self.session.put(self._url(url),
+                                    headers=self._headers(payload=True),
+                                    data=json.dumps(payload)) as r:
+            r.raise_for_status()
+            return loads(await r.read())
+
+    async def delete(self, url):
+        """
+        Send a DELETE request to the specified URL.
+
+        :param url: URI part to query.
+        """
+        async with self.session.delete(self._url(url),
+                                       headers=self._headers()) as r:
+            r.raise_for_status()
+
+    async def authorize(self, token):
+        """
+        Authorize the provided API token with the server.
+
+        :param token: String token
+        :rtype: String "OK" or raise an exception on error.
+        """
+        await self.get('actions',
+                       headers={'Authorization': "Bearer {0}".format(token)})
+        write_token_to_conf(token)
+        self.token = token
+        return "OK"
+
+    async def paginate(self, url, key, model=None, per_page=None):
+        """
+        Asynchronously iterate over every item of a paginated listing,
+        following the `links.pages.next` cursor.
+
+        :param url: URI part to query.
+        :param key: The key of the item list in each page.
+        :param model: Optional callable each item is passed through.
+        :param per_page: Number of items per page, defaults to
+                         `AsyncClient.per_page`.
+        :rtype: An asynchronous generator of items.
+        """
+        if per_page is None:
+            per_page = self.per_page
+        sep = '&' if '?' in url else '?'
+        url = "{0}{1}per_page={2}".format(url, sep, per_page)
+        async for item in self._follow_pages(url, key, model):
+            yield item
+
+    async def _follow_pages(self, url, key, model):
+        while url is not None:
+            j = await self.get(url)
+            if key not in j:
+                return
+            for item in j[key]:
+                yield item if model is None else model(item)
+            url = j.get('links', {}).get('pages', {}).get('next')
+
+    async def _list(self, key, model):
+        j = await self.get("{0}?per_page={1}".format(key, self.per_page))
+        if key not in j:
+            return None
+        items = [model(i) for i in j[key]]
+        url = j.get('links', {}).get('pages', {}).get('next')
+        if url is not None:
+            items.extend([i async for i in self._follow_pages(url, key,
+                                                              model)])
+        return items
+
+    async def _find(self, key, field, value, model):
+        async for item in self.paginate(key, key):
+            if item[field].lower().startswith(value.lower()):
+                return model(item)
+        return None
+
+    def iter_droplets(self, per_page=None):
+        """
+        Iterate over all droplets, one page at a time.
+
+        :param per_page: Number of droplets requested per page.
+        :rtype: An asynchronous generator of `batfish.models.Droplet`.
+        """
+        return self.paginate('droplets', 'droplets', Droplet, per_page)
+
+    async def droplets(self):
+        """
+        Get a list of `batfish.models.Droplet` objects.
+
+        :rtype: List of `batfish.models.Droplet` objects.
+        """
+        return await self._list('droplets', Droplet)
+
+    async def droplet_from_id(self, droplet_id):
+        """
+        Get an instance `batfish.models.Droplet` for the provided droplet ID.
+
+        :param droplet_id: Integer represenation of the droplet ID.
+        :rtype: Instance of `batfish.models.Droplet` or None.
+        """
+        try:
+            j = await self.get("droplets/{0}".format(droplet_id))
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return None
+            raise
+        if 'droplet' not in j:
+            return None
+        return Droplet(j['droplet'])
+
+    async def droplet_from_name(self, name):
+        """
+        Get an instance `batfish.models.Droplet` for the provided droplet name.
+
+        :param name: Name of the droplet to query.
+        :rtype: Instance of `batfish.models.Droplet` or None.
+        """
+        return await self._find('droplets', 'name', name, Droplet)
+
+    async def simple_droplet_image_action(self, action, droplet, image):
+        """
+        Send an API request to modify a droplet based on an image.
+
+        :param action: The action to perform (restore, rebuild)
+        :param droplet: A droplet ID or `batfish.models.Droplet`.
+        :param image: An image ID or `batfish.models.Image`.
+        :rtype: Dictionary of the JSON response.
+        """
+        if action not in droplet_image_actions:
+            raise NotImplementedError(action)
+        if isinstance(droplet, Droplet):
+            droplet = droplet.id
+        if isinstance(image, Image):
+            image = image.id
+        return await self.post('droplets/{0}/actions'.format(droplet),
+                               {'type': action, 'image': image})
+
+    async def simple_droplet_action(self, action, droplet):
+        """
+        Send an API request to modify a droplet based on the action.
+
+        :param action: The action to perform, see
+                       `batfish.client.Client.simple_droplet_action`.
+        :param droplet: A droplet ID or `batfish.models.Droplet`.
+        :rtype: Dictionary of the JSON response.
+        """
+        if action not in droplet_actions:
+            raise NotImplementedError(action)
+        if isinstance(droplet, Droplet):
+            droplet = droplet.id
+        return await self.post('droplets/{0}/actions'.format(droplet),
+                               {'type': action})
+
+    async def droplet_rename(self, droplet, name):
+        """
+        Send an API request to rename a droplet.
+
+        :param droplet: A droplet ID or `batfish.models.Droplet`.
+        :param name: A string of the new name.
+        :rtype: Dictionary of the JSON response.
+        """
+        if isinstance(droplet, Droplet):
+            droplet = droplet.id
+        if not valid_chars.match(name):
+            raise ValueError("""Only valid characters are allowed. """
+                             """(a-z, A-Z, 0-9, . and -)""")
+        return await self.post('droplets/{0}/actions'.format(droplet),
+                               {'type': 'rename', 'name': name})
+
+    async def droplet_snapshot(self, droplet, name):
+        """
+        Send an API request to snapshot a droplet.
+
+        :param droplet: A droplet ID or `batfish.models.Droplet`.
+        :param name: A string of the snapshot name.
+        :rtype: Dictionary of the JSON response.
+        """
+        if isinstance(droplet, Droplet):
+            droplet = droplet.id
+        if not valid_chars.match(name):
+            raise ValueError("""Only valid characters are allowed. """
+                             """(a-z, A-Z, 0-9, . and -)""")
+        return await self.post('droplets/{0}/actions'.format(droplet),
+                               {'type': 'snapshot', 'name': name})
+
+    async def droplet_resize(self, droplet, size):
+        """
+        Send an API request to resize a droplet.
+
+        :param droplet: A droplet ID or `batfish.models.Droplet`.
+        :param size: A size slug or `batfish.models.Size`.
+        :rtype: Dictionary of the JSON response.
+        """
+        if isinstance(droplet, Droplet):
+            droplet = droplet.id
+        if isinstance(size, Size):
+            size = size.slug
+        return await self.post('droplets/{0}/actions'.format(droplet),
+                               {'type': 'resize', 'size': size})
+
+    async def droplet_restore(self, droplet, image):
+        """Send an API request to restore a droplet from an image."""
+        return await self.simple_droplet_image_action('restore', droplet,
+                                                      image)
+
+    async def droplet_rebuild(self, droplet, image):
+        """Send an API request to rebuild a droplet from an image."""
+        return await self.simple_droplet_image_action('rebuild', droplet,
+                                                      image)
+
+    async def droplet_enable_ipv6(self, droplet):
+        """Send an API request to enable IPv6 on a droplet."""
+        return await self.simple_droplet_action('enable_ipv6', droplet)
+
+    async def droplet_disable_backups(self, droplet):
+        """Send an API request to disable backups for a droplet."""
+        return await self.simple_droplet_action('disable_backups', droplet)
+
+    async def droplet_enable_private_networking(self, droplet):
+        """Send an API request to enable private networking on a droplet."""
+        return await self.simple_droplet_action('enable_private_networking',
+                                                droplet)
+
+    async def droplet_reboot(self, droplet):
+        """Send an API request to reboot a droplet."""
+        return await self.simple_droplet_action('reboot', droplet)
+
+    async def droplet_power_cycle(self, droplet):
+        """Send an API request to power cycle a droplet."""
+        return await self.simple_droplet_action('power_cycle', droplet)
+
+    async def droplet_power_off(self, droplet):
+        """Send an API request to power off a droplet."""
+        return await self.simple_droplet_action('power_off', droplet)
+
+    async def droplet_power_on(self, droplet):
+        """Send an API request to power on a droplet."""
+        return await self.simple_droplet_action('power_on', droplet)
+
+    async def droplet_password_reset(self, droplet):
+        """Send an API request to reset the root password of a droplet."""
+        return await self.simple_droplet_action('password_reset', droplet)
+
+    async def droplet_shutdown(self, droplet):
+        """Send an API request to shutdown a droplet."""
+        return await self.simple_droplet_action('shutdown', droplet)
+
+    async def droplet_delete(self, droplet):
+        """
+        Send an API request to delete a droplet.
+
+        :param droplet: A droplet ID or `batfish.models.Droplet`.
+        """
+        if isinstance(droplet, Droplet):
+            droplet = droplet.id
+        await self.delete('droplets/{0}'.format(droplet))
+
+    async def droplet_create(self, name, region, size, image):
+        """
+        Send an API request to create a droplet.
+
+        :param name: The name of the new droplet.
+        :param region: A region slug or `batfish.models.Region`.
+        :param size: A size slug or `batfish.models.Size`.
+        :param image: An image ID, slug or `batfish.models.Image`.
+        :rtype: Dictionary of the JSON response.
+        """
+        if isinstance(size, Size):
+            size = size.slug
+        if isinstance(image, Image):
+            image = image.id
+        if isinstance(region, Region):
+            region = region.slug
+        if not str(image).isdigit():
+            image = image.lower()
+        if not valid_chars.match(name):
+            raise ValueError("""Only valid characters are allowed. """
+                             """(a-z, A-Z, 0-9, . and -)""")
+        d = {'name': name, 'size': size.lower(), 'image': image,
+             'region': region}
+        return await self.post('droplets', d)
+
+    def iter_images(self, per_page=None):
+        """
+        Iterate over all images, one page at a time.
+
+        :param per_page: Number of images requested per page.
+        :rtype: An asynchronous generator of `batfish.models.Image`.
+        """
+        return self.paginate('images', 'images', Image, per_page)
+
+    async def images(self):
+        """
+        Get a list of images from the API.
+
+        :rtype: List of `batfish.models.Image` objects.
+        """
+        return await self._list('images', Image)
+
+    async def image_from_id(self, image_id):
+        """
+        Get an instance of `batfish.models.Image` for the provided image ID.
+
+        :param image_id: An integer ID of an image.
+        :rtype: An instance of `batfish.models.Image`.
+        """
+        j = await self.get("images/{0}".format(image_id))
+        if 'image' not in j:
+            return None
+        return Image(j['image'])
+
+    async def image_from_name(self, name):
+        """
+        Get an instance of `batfish.models.Image` for the provided image name.
+
+        :param name: A string name of an image.
+        :rtype: An instance of `batfish.models.Image`.
+        """
+        return await self._find('images', 'name', name, Image)
+
+    async def image_from_slug(self, slug):
+        """
+        Get an instance of `batfish.models.Image` for the provided image slug.
+
+        :param slug: A string slug of an image.
+        :rtype: An instance of `batfish.models.Image`.
+        """
+        j = await self.get("images/{0}".format(slug.lower()))
+        if 'image' not in j:
+            return None
+        return Image(j['image'])
+
+    async def image_delete(self, image):
+        """
+        Send an API request to delete an image.
+
+        :param image: An image ID or `batfish.models.Image`.
+        """
+        if isinstance(image, Image):
+            image = image.id
+        await self.delete('images/{0}'.format(image))
+
+    async def image_rename(self, image, name):
+        """
+        Send an API request to rename an image.
+
+        :param image: An image ID or `batfish.models.Image`.
+        :param name: A string of the new name.
+        :rtype: Dictionary of the JSON response.
+        """
+        if isinstance(image, Image):
+            image = image.id
+        if not valid_chars.match(name):
+            raise ValueError("""Only valid characters are allowed. """
+                             """(a-z, A-Z, 0-9, . and -)""")
+        return await self.put("images/{0}".format(image), {'name': name})
+
+    async def image_transfer(self, image, region):
+        """
+        Send an API request to transfer an image to another region.
+
+        :param image: An image ID or `batfish.models.Image`.
+        :param region: A region slug or `batfish.models.Region`.
+        :rtype: Dictionary of the JSON response.
+        """
+        if isinstance(image, Image):
+            image = image.id
+        if isinstance(region, Region):
+            region = region.slug
+        d = {'type': 'transfer', 'region': region}
+        return await self.post("images/{0}/actions".format(image), d)
+
+    async def regions(self):
+        """
+        Get a list of regions from the API.
+
+        :rtype: List of `batfish.models.Region` objects.
+        """
+        return await self._list('regions', Region) or []
+
+    async def region_from_name(self, name):
+        """
+        Get an instance of `batfish.models.Region` for a region name.
+
+        :param name: A string name of a region.
+        :rtype: An instance of `batfish.models.Region` or `None`.
+        """
+        return await self._find('regions', 'name', name, Region)
+
+    async def region_from_slug(self, slug):
+        """
+        Get an instance of `batfish.models.Region` for a region slug.
+
+        :param slug: A string slug of a region.
+        :rtype: An instance of `batfish.models.Region` or `None`.
+        """
+        return await self._find('regions', 'slug', slug, Region)
+
+    async def sizes(self):
+        """
+        Get a list of sizes from the API.
+
+        :rtype: List of `batfish.models.Size` objects.
+        """
+        return await self._list('sizes', Size) or []
+
+    async def size_from_slug(self, slug):
+        """
+        Get an instance of `batfish.models.Size` for a size slug.
+
+        :param slug: A string slug of a size.
+        :rtype: An instance of `batfish.models.Size` or `None`.
+        """
+        return await self._find('sizes', 'slug', slug, Size)
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import namedtuple, OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+Validators = namedtuple('Validators', 'etag last_modified body')
+
+
+class ConditionalCache(object):
+    """
+    A bounded, thread-safe store of the `ETag` and `Last-Modified`
+    validators and parsed JSON body of GET responses, keyed by URL.
+
+    The least recently used URL is dropped once `max_entries` is reached.
+    Bodies are shared between callers and must not be modified.
+
+    :param max_entries: The maximum number of URLs remembered.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, url):
+        """
+        Get the validators stored for a URL.
+
+        :param url: The full URL of the request.
+        :rtype: `batfish.cache.Validators` or `None`.
+        """
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is not None:
+                self._entries[url] = entry
+            return entry
+
+    def store(self, url, headers, body):
+        """
+        Remember the validators of a response, if it has any.
+
+        :param url: The full URL of the request.
+        :param headers: The response headers.
+        :param body: The parsed JSON body of the response.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        with self._lock:
+            self._entries.pop(url, None)
+            if etag is None and last_modified is None:
+                return
+            self._entries[url] = Validators(etag, last_modified, body)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget all stored responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+def conditional_headers(validators):
+    """
+    Build the headers of a conditional request.
+
+    :param validators: An instance of `batfish.cache.Validators`.
+    :rtype: `dictionary`.
+    """
+    headers = {}
+    if validators.etag is not None:
+        headers['If-None-Match'] = validators.etag
+    if validators.last_modified is not None:
+        headers['If-Modified-Since'] = validators.last_modified
+    return headers
+
+
+class DiskCache(object):
+    """
+    A persistent cache of JSON documents, one file per key, that outlives
+    the process. Used to keep the slow changing catalogs (regions, sizes
+    and images) between `batfish` invocations.
+
+    Files are written atomically and the oldest files are removed once the
+    cache grows past `max_bytes`.
+
+        >>> cache = DiskCache()
+        >>> cli = batfish.Client(cache=cache)
+        >>> cli.regions  # downloaded
+        >>> cli.regions  # read from ~/.batfish.cache
+
+    :param path: The cache directory, `~/.batfish.cache` by default.
+    :param ttls: A dictionary of endpoint to time to live in seconds,
+                 merged over `DiskCache.ttls`.
+    :param max_bytes: The maximum total size of the cache.
+    """
+
+    ttls = {'regions': 86400, 'sizes': 86400, 'images': 3600}
+    """Default time to live in seconds of each endpoint."""
+    default_ttl = 300
+    """Time to live in seconds of endpoints not in `ttls`."""
+
+    def __init__(self, path=None, ttls=None, max_bytes=10 * 1024 * 1024):
+        if path is None:
+            path = os.path.expanduser('~/.batfish.cache')
+        self.path = path
+        self.ttls = dict(DiskCache.ttls)
+        if ttls is not None:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+
+    def _filename(self, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, "{0}.json".format(digest))
+
+    def ttl(self, endpoint):
+        """
+        The time to live of an endpoint.
+
+        :param endpoint: The endpoint name, i.e. `regions`.
+        :rtype: Seconds as an `integer`.
+        """
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key, ttl):
+        """
+        Read a value if it was written less than `ttl` seconds ago.
+
+        :param key: A string key.
+        :param ttl: The maximum age in seconds.
+        :rtype: The cached value or `None`.
+        """
+        filename = self._filename(key)
+        try:
+            if time.time() - os.path.getmtime(filename) > ttl:
+                return None
+            with open(filename) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def set(self, key, value):
+        """
+        Atomically write a value.
+
+        :param key: A string key.
+        :param value: A JSON serialisable value.
+        """
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(value, f)
+            getattr(os, 'replace', os.rename)(tmp, self._filename(key))
+        except Exception:
+            os.remove(tmp)
+            raise
+        self._evict()
+
+    def delete(self, key):
+        """
+        Remove a value.
+
+        :param key: A string key.
+        """
+        try:
+            os.remove(self._filename(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove every cached value."""
+        for filename, _, _ in self._files():
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+
+    def _files(self):
+        if not os.path.isdir(self.path):
+            return []
+        files = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.json'):
+                continue
+            filename = os.path.join(self.path, name)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                continue
+            files.append((filename, st.st_mtime, st.st_size))
+        return files
+
+    def _evict(self):
+        files = sorted(self._files(), key=lambda f: f[1])
+        total = sum(f[2] for f in files)
+        for filename, _, size in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            total -= size
+
+
+class NameCache(object):
+    """
+    Remembers which ID a droplet or image name resolved to, in a
+    `batfish.cache.DiskCache`, so repeated commands skip the listing.
+    Each entry expires `ttl` seconds after it was stored.
+
+        >>> names = NameCache(DiskCache())
+        >>> names.set('droplets', 'web-1', 1234)
+        >>> names.get('droplets', 'web-1')
+        1234
+
+    Collections are named by the caller, `batfish.client.Client` scopes
+    them to its API base and token.
+
+    :param cache: A `batfish.cache.DiskCache`.
+    :param ttl: Seconds a resolution is trusted.
+    """
+
+    ttl = 3600
+    """Default number of seconds a resolution is trusted."""
+
+    def __init__(self, cache, ttl=None):
+        self.cache = cache
+        if ttl is not None:
+            self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _key(self, collection):
+        return "names:{0}".format(collection)
+
+    def _load(self, collection):
+        return self.cache.get(self._key(collection), self.ttl) or {}
+
+    def get(self, collection, name):
+        """
+        The ID `name` resolved to, if it did less than `ttl` seconds ago.
+
+        :param collection: The collection name, such as `droplets`.
+        :param name: The name or slug that was resolved.
+        :rtype: `integer` or `None`.
+        """
+        entry = self._load(collection).get(name)
+        if entry is None or time.time() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def set(self, collection, name, resource_id):
+        """
+        Remember that `name` resolved to `resource_id`.
+
+        :param collection: The collection name, such as `droplets`.
+        :param name: The name or slug that was resolved.
+        :param resource_id: The ID it resolved to.
+        """
+        with self._lock:
+            names = self._load(collection)
+            now = time.time()
+            names = dict((k, v) for k, v in names.items()
+                         if now - v[1] <= self.ttl)
+            names[name] = [resource_id, now]
+            self.cache.set(self._key(collection), names)
+
+    def forget(self, collection, resource_id=None):
+        """
+        Forget every name resolving to `resource_id`, or every name of
+        the collection.
+
+        :param collection: The collection name, such as `droplets`.
+        :param resource_id: The ID that no longer exists, or `None`.
+        """
+        with self._lock:
+            if resource_id is None:
+                self.cache.delete(self._key(collection))
+                return
+            names = self._load(collection)
+            kept = dict((k, v) for k, v in names.items()
+                        if v[0] != resource_id)
+            if len(kept) != len(names):
+                self.cache.set(self._key(collection), kept)
@@ -23,16 +23,219 @@
 # SOFTWARE.
 
 
+import sys
+
 import click
 
-from .client import Client
+try:
+    from click import shell_completion
+except ImportError:
+    shell_completion = None
+
+from . import output
+from .cache import DiskCache, NameCache
+from .completion import CompletionIndex
+from .exceptions import AmbiguousName
 from .models import Region, Size
 
 
+class LazyClient(object):
+    """
+    Stands in for a `batfish.client.Client`, only importing and building
+    it when a command first uses it, so commands that never touch the API
+    do not pay for it.
+
+    :param kwargs: Keyword arguments for `batfish.client.Client`.
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._client = None
+
+    def configure(self, **kwargs):
+        """
+        Update the arguments of the client if it has not been built yet.
+
+        :param kwargs: Keyword arguments for `batfish.client.Client`.
+        """
+        if self._client is None:
+            self._kwargs.update(kwargs)
+
+    def __getattr__(self, name):
+        if self._client is None:
+            from .client import Client
+            self._client = Client(**self._kwargs)
+        return getattr(self._client, name)
+
+
+def output_options(columns):
+    """
+    Add `--format` and `--fields` options to a listing command, passed to
+    it as `fmt` and `fields`.
+
+    :param columns: The columns the listing provides.
+    """
+    def parse(ctx, param, value):
+        try:
+            return output.parse_fields(value, columns)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+
+    def decorator(f):
+        f = click.option('--fields', callback=parse,
+                         help="Comma separated columns for --format: {0}"
+                              "".format(", ".join(columns)))(f)
+        f = click.option('--format', 'fmt', default='text',
+                         type=click.Choice(('text', ) + output.formats),
+                         help="Output format")(f)
+        return f
+    return decorator
+
+
+def write_output(items, columns, fields, fmt):
+    output.write(items, columns, fields, fmt, sys.stdout)
+
+
+def complete(collection):
+    """
+    The `click.option` keyword arguments adding a `shell_complete`
+    callback answering from the completion snapshot, that starts a
+    background refresh of the snapshot when it is stale. Empty before
+    click 8, which has no `shell_complete`.
+
+    :param collection: `droplets`, `images` or `regions`.
+    """
+    def callback(ctx, param, incomplete):
+        index = CompletionIndex(DiskCache())
+        try:
+            index.refresh_in_background()
+        except (IOError, OSError):
+            pass
+        return index.complete(collection, incomplete)
+    if shell_completion is None:
+        return {}
+    return {'shell_complete': callback}
+
+
+def droplet_targets(f):
+    """
+    Add the `--droplet`, `--from-file` and `--jobs` options of commands
+    that act on one or more droplets.
+    """
+    def pool_size(ctx, param, value):
+        # size the connection pool before the client is built
+        ctx.obj.configure(pool_maxsize=max(value, 10))
+        return value
+
+    f = click.option('--jobs', default=10, show_default=True,
+                     type=click.IntRange(1), callback=pool_size,
+                     help="Number of droplets acted on at the same time")(f)
+    f = click.option('--from-file', type=click.File('r'),
+                     help="File of droplet names or IDs, one per line, "
+                          "- for stdin")(f)
+    f = click.option('--droplet', multiple=True,
+                     help="Droplet name or ID, can be repeated",
+                     **complete('droplets'))(f)
+    return f
+
+
+def resolve_droplet(ctx, droplet, verify=False):
+    if droplet.isdigit():
+        return int(droplet)
+    try:
+        droplet_id = ctx.droplet_id_from_name(droplet, verify)
+    except AmbiguousName as e:
+        raise click.BadParameter(str(e), param_hint='--droplet')
+    if droplet_id is None:
+        raise click.BadParameter("No droplet named {0}".format(droplet),
+                                 param_hint='--droplet')
+    return droplet_id
+
+
+def resolve_image(ctx, image, verify=False):
+    if image.isdigit():
+        return int(image)
+    # assume name first, then try slug
+    try:
+        image_id = ctx.image_id_from_name(image, verify)
+    except AmbiguousName as e:
+        raise click.BadParameter(str(e), param_hint='--image')
+    if image_id is None:
+        raise click.BadParameter("No image named {0}".format(image),
+                                 param_hint='--image')
+    return image_id
+
+
+def run_bulk(ctx, droplets, from_file, jobs, func, verify=False):
+    """
+    Resolve every droplet target, names from a single droplet listing,
+    call `func` with each droplet ID, `jobs` at a time, and print a
+    summary. A single target prints the result of `func` instead.
+    Destructive commands `verify` remembered names before acting.
+    """
+    targets = list(droplets)
+    if from_file is not None:
+        targets.extend(line.strip() for line in from_file
+                       if line.strip() and not line.startswith('#'))
+    if not targets:
+        raise click.UsageError("Missing option '--droplet' or "
+                               "'--from-file'.")
+    resolved = []
+    for target in targets:
+        try:
+            if target.isdigit():
+                droplet = int(target)
+            else:
+                droplet = ctx.droplet_id_from_name(target, verify)
+            error = None if droplet is not None else "not found"
+        except AmbiguousName as e:
+            droplet, error = None, "ambiguous: {0}".format(
+                ", ".join(e.candidates))
+        resolved.append((target, droplet, error))
+    results = ctx.bulk(func, set(d for _, d, e in resolved if e is None),
+                       max_workers=jobs)
+    if len(targets) == 1 and resolved[0][2] is None:
+        result = results[resolved[0][1]]
+        if result.error is not None:
+            raise result.error
+        click.echo(result.result)
+        return
+    rows = []
+    for target, droplet, error in resolved:
+        if error is None and results[droplet].error is not None:
+            error = str(results[droplet].error)
+        rows.append((target, '' if droplet is None else str(droplet),
+                     error))
+    width = max(len(r[0]) for r in rows)
+    id_width = max(len(r[1]) for r in rows)
+    for target, droplet, error in rows:
+        if error is None:
+            status = click.style("ok", fg='green')
+        else:
+            status = click.style("failed: {0}".format(error), fg='red')
+        click.echo("{0}  {1}  {2}".format(target.ljust(width),
+                                          droplet.ljust(id_width), status))
+    failed = sum(1 for r in rows if r[2] is not None)
+    click.echo("{0} succeeded, {1} failed".format(len(rows) - failed,
+                                                  failed))
+    if failed:
+        sys.exit(1)
+
+
 @click.group()
+@click.option('--no-cache', is_flag=True, default=False,
+              help="Do not use the on-disk region, size and image cache")
+@click.option('--refresh', is_flag=True, default=False,
+              help="Refresh the on-disk region, size and image cache")
 @click.pass_context
-def cli(ctx):
-    ctx.obj = Client()
+def cli(ctx, no_cache, refresh):
+    cache = None
+    if not no_cache:
+        cache = DiskCache()
+        if refresh:
+            cache.clear()
+    ctx.obj = LazyClient(cache=cache,
+                         name_cache=cache and NameCache(cache))
 
 
 @cli.command()
@@ -60,8 +263,13 @@ def print_droplet(name, cpu, memory, disk, ip, status, region, did):
 
 
 @cli.command()
+@output_options(output.droplet_columns)
 @click.pass_obj
-def droplets(ctx):
+def droplets(ctx, fmt, fields):
+    if fmt != 'text':
+        write_output(ctx.paginate('droplets', 'droplets', stream=True),
+                     output.droplet_columns, fields, fmt)
+        return
     for droplet in ctx.droplets:
         print_droplet(droplet.name, droplet.cpus, droplet.memory,
                       droplet.disk_size, droplet.networks['ipv4'][0].ip,
@@ -70,13 +278,11 @@ def droplets(ctx):
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@click.option('--droplet', help="Droplet name or ID", required=True,
+              **complete('droplets'))
 @click.pass_obj
 def droplet(ctx, droplet):
-    if droplet.isdigit():
-        droplet = ctx.droplet_from_id(droplet)
-    else:
-        droplet = ctx.droplet_from_name(droplet)
+    droplet = ctx.droplet_from_id(resolve_droplet(ctx, droplet))
     print_droplet(droplet.name, droplet.cpus, droplet.memory,
                   droplet.disk_size, droplet.networks['ipv4'][0].ip,
                   droplet.status, droplet.region_name,
@@ -84,125 +290,101 @@ def droplet(ctx, droplet):
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_password_reset(ctx, droplet, accept):
+def droplet_password_reset(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_password_reset(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_password_reset(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_power_cycle(ctx, droplet, accept):
+def droplet_power_cycle(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_power_cycle(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_power_cycle(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_power_off(ctx, droplet, accept):
+def droplet_power_off(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_power_off(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_power_off(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.pass_obj
-def droplet_power_on(ctx, droplet):
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_power_on(droplet)
+def droplet_power_on(ctx, droplet, from_file, jobs):
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_power_on(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_reboot(ctx, droplet, accept):
+def droplet_reboot(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_reboot(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_reboot(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_shutdown(ctx, droplet, accept):
+def droplet_shutdown(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_shutdown(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_shutdown(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
-@click.option('--image', help="Droplet name, slug or ID", required=True)
+@droplet_targets
+@click.option('--image', help="Droplet name, slug or ID", required=True,
+              **complete('images'))
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_restore(ctx, droplet, image, accept):
+def droplet_restore(ctx, droplet, from_file, jobs, image, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    if not image.isdigit():
-        # assume name first, then try slug
-        image = ctx.image_from_name(image)
-        if image is None:
-            image = ctx.image_from_slug(image)
-        image = image.id
-    ctx.droplet_restore(droplet, image)
+    image = resolve_image(ctx, image, verify=True)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_restore(d, image), verify=True)
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
-@click.option('--image', help="Droplet name, slug or ID", required=True)
+@droplet_targets
+@click.option('--image', help="Droplet name, slug or ID", required=True,
+              **complete('images'))
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_rebuild(ctx, droplet, image, accept):
+def droplet_rebuild(ctx, droplet, from_file, jobs, image, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    if not image.isdigit():
-        # assume name first, then try slug
-        image = ctx.image_from_name(image)
-        if image is None:
-            image = ctx.image_from_slug(image)
-        image = image.id
-    ctx.droplet_rebuild(droplet, image)
+    image = resolve_image(ctx, image, verify=True)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_rebuild(d, image), verify=True)
 
 
 @cli.command()
@@ -210,80 +392,70 @@ def droplet_rebuild(ctx, droplet, image, accept):
 @click.option('--region', type=click.Choice(sorted(Region.mapping.keys())),
               required=True)
 @click.option('--size', type=click.Choice(Size.mapping), required=True)
-@click.option('--image', help="Image name, slug or ID", required=True)
+@click.option('--image', help="Image name, slug or ID", required=True,
+              **complete('images'))
 @click.pass_obj
 def droplet_create(ctx, name, region, size, image):
-    ctx.droplet_create(name, region, size, image)
+    click.echo(ctx.droplet_create(name, region, size, image))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@click.option('--droplet', help="Droplet name or ID", required=True,
+              **complete('droplets'))
 @click.option('--name', help="New droplet name", required=True)
 @click.pass_obj
 def droplet_rename(ctx, droplet, name):
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_rename(droplet, name)
+    droplet = resolve_droplet(ctx, droplet)
+    click.echo(ctx.droplet_rename(droplet, name))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_delete(ctx, droplet, accept):
+def droplet_delete(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_delete(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_delete(d), verify=True)
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--size', type=click.Choice(Size.mapping), required=True)
 @click.pass_obj
-def droplet_resize(ctx, droplet, size):
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_resize(droplet, size)
+def droplet_resize(ctx, droplet, from_file, jobs, size):
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_resize(d, size))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.pass_obj
-def droplet_enabled_ipv6(ctx, droplet):
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_enable_ipv6(droplet)
+def droplet_enabled_ipv6(ctx, droplet, from_file, jobs):
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_enable_ipv6(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
-def droplet_disable_backups(ctx, droplet, accept):
+def droplet_disable_backups(ctx, droplet, from_file, jobs, accept):
     if accept is False:
         return
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_disable_backups(droplet)
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_disable_backups(d))
 
 
 @cli.command()
-@click.option('--droplet', help="Droplet name or ID", required=True)
+@droplet_targets
 @click.pass_obj
-def droplet_enable_private_networking(ctx, droplet):
-    if not droplet.isdigit():
-        droplet = ctx.droplet_from_name(droplet)
-        droplet = droplet.id
-    ctx.droplet_enable_private_networking(droplet)
+def droplet_enable_private_networking(ctx, droplet, from_file, jobs):
+    run_bulk(ctx, droplet, from_file, jobs,
+             lambda d: ctx.droplet_enable_private_networking(d))
 
 
 def print_image(iid, name, slug, distribution, regions):
@@ -293,75 +465,60 @@ def print_image(iid, name, slug, distribution, regions):
 
 
 @cli.command()
+@output_options(output.image_columns)
 @click.pass_obj
-def images(ctx):
+def images(ctx, fmt, fields):
+    if fmt != 'text':
+        write_output(ctx.catalog('images') or [], output.image_columns,
+                     fields, fmt)
+        return
     for image in ctx.images:
         print_image(image.id, image.name, image.slug, image.distribution,
                     image.region_names)
 
 
 @cli.command()
-@click.option('--images', help="Image name, slug or ID", required=True)
+@click.option('--image', help="Image name, slug or ID", required=True,
+              **complete('images'))
 @click.pass_obj
 def image(ctx, image):
-    if image.isdigit():
-        image = ctx.image_from_id(image)
-    else:
-        # assume name first, then try slug
-        image = ctx.image_from_name(image)
-        if image is None:
-            image = ctx.image_from_slug(image)
+    image = ctx.image_from_id(resolve_image(ctx, image))
     print_image(image.id, image.name, image.slug, image.distribution,
                 image.region_names)
 
 
 @cli.command()
-@click.option('--image', help="Image name, slug or ID", required=True)
+@click.option('--image', help="Image name, slug or ID", required=True,
+              **complete('images'))
 @click.option('--accept', is_flag=True,
               prompt="Are you sure you want to do this?")
 @click.pass_obj
 def image_delete(ctx, image, accept):
     if accept is False:
         return
-    if image.isdigit():
-        image = ctx.image_from_id(image)
-    else:
-        # assume name first, then try slug
-        image = ctx.image_from_name(image)
-        if image is None:
-            image = ctx.image_from_slug(image)
-    ctx.image_delete(image)
+    image = resolve_image(ctx, image, verify=True)
+    click.echo(ctx.image_delete(image))
 
 
 @cli.command()
-@click.option('--image', help="Image name, slug or ID", required=True)
+@click.option('--image', help="Image name, slug or ID", required=True,
+              **complete('images'))
 @click.option('--name', required=True)
 @click.pass_obj
 def image_rename(ctx, image, name):
-    if image.isdigit():
-        image = ctx.image_from_id(image)
-    else:
-        # assume name first, then try slug
-        image = ctx.image_from_name(image)
-        if image is None:
-            image = ctx.image_from_slug(image)
-    ctx.image_rename(image, name)
+    image = resolve_image(ctx, image)
+    click.echo(ctx.image_rename(image, name))
 
 
 @cli.command()
-@click.option('--image', help="Image name, slug or ID", required=True)
+@click.option('--image', help="Image name, slug or ID", required=True,
+              **complete('images'))
 @click.option('--region', type=click.Choice(sorted(Region.mapping.keys())),
               required=True)
 @click.pass_obj
 def image_transfer(ctx, image, region):
-    if image.isdigit():
-        image = ctx.image_from_id(image)
-    else:
-        # assume name first, then try slug
-        image = ctx.image_from_name(image)
-        if image is None:
-            image = ctx.image_from_slug(image)
-    ctx.image_transfer(image, region)
+    image = resolve_image(ctx, image)
+    click.echo(ctx.image_transfer(image, region))
 
 
 def print_size(name, cpus, disk_size, price, regions):
@@ -374,8 +531,13 @@ def print_size(name, cpus, disk_size, price, regions):
 @cli.command()
 @click.option('--detailed', is_flag=True, default=False,
               help="Displays a detailed view of sizes")
+@output_options(output.size_columns)
 @click.pass_obj
-def sizes(ctx, detailed):
+def sizes(ctx, detailed, fmt, fields):
+    if fmt != 'text':
+        write_output(ctx.catalog('sizes') or [], output.size_columns,
+                     fields, fmt)
+        return
     if not detailed:
         for size in Size.mappings():
             click.echo(size)
@@ -23,17 +23,62 @@
 # SOFTWARE.
 
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
 import json
+import math
 import os
 import re
+import time
 
 import requests
 
 from batfish.__about__ import __title__, __version__
-from .models import Droplet, Image, Region, Size
+from .cache import ConditionalCache, conditional_headers
+from .completion import CompletionIndex
+from .exceptions import ActionTimeout, AmbiguousName
+from .feed import ActionFeed
+from .identity import IdentityMap
+from .jsonstream import iter_items, loads
+from .models import Action, Droplet, Image, Region, Size
+from .models.base import Model
+from .ratelimit import RateLimiter
+from .resolver import Resolver
+from .scope import Scope
+from .sync import FleetSync
 
 
 valid_chars = re.compile(r"^[a-zA-Z0-9\.\-]*$")
+droplet_actions = ('reboot', 'power_cycle', 'power_off', 'enable_ipv6',
+                   'power_on', 'password_reset', 'shutdown',
+                   'disable_backups', 'enable_private_networking', )
+droplet_image_actions = ('restore', 'rebuild', )
+missing_resource = re.compile(r'(droplets|images)/(\d+)(?:[/?]|$)')
+later_page = re.compile(r'[?&]page=')
+action_done = ('completed', 'errored', )
+
+
+BulkResult = namedtuple('BulkResult', 'droplet result error')
+"""The outcome of a bulk request for a single droplet."""
+
+
+def action_ids(response):
+    """
+    The IDs of the actions started by an API call, from its response.
+
+        >>> action_ids({'action': {'id': 36805022, 'status': 'in-progress'}})
+        [36805022]
+
+    :param response: The value returned by a `batfish.client.Client` call.
+    :rtype: `list` of `integer`.
+    """
+    if not isinstance(response, dict):
+        return []
+    if isinstance(response.get('action'), dict):
+        return [response['action']['id']]
+    links = response.get('links') or {}
+    return [a['id'] for a in links.get('actions') or [] if 'id' in a]
 
 
 def read_token_from_conf():
@@ -49,7 +94,32 @@ def write_token_to_conf(token):
 
 
 class Client(object):
-    """A Digital Ocean V2 client wrapper."""
+    """
+    A Digital Ocean V2 client wrapper.
+
+    All requests share a single pooled, keep-alive HTTP session.
+
+    :param pool_connections: Number of host connection pools to cache.
+    :param pool_maxsize: Maximum number of connections kept open per host.
+    :param keep_alive: Reuse connections between requests, `False` sends
+                       `Connection: close` with every request.
+    :param rate_limiter: A `batfish.ratelimit.RateLimiter` used to pace
+                         requests, shared by every thread using the client.
+                         Defaults to a new limiter per client.
+    :param retry: A `batfish.retry.RetryPolicy` for transient failures, or
+                  `None` to never retry.
+    :param conditional: Remember the `ETag` and `Last-Modified` validators
+                        of GET responses and revalidate instead of
+                        downloading unchanged bodies again. Only the first
+                        page of a listing is remembered.
+    :param cache: A `batfish.cache.DiskCache` used to persist the regions,
+                  sizes and images catalogs between processes.
+    :param identity_map: Return the same model instance, refreshed in
+                         place, every time a resource is fetched.
+    :param name_cache: A `batfish.cache.NameCache` remembering the IDs
+                       droplet and image names resolve to between
+                       processes.
+    """
 
     token = None
     """API authentication token."""
@@ -57,16 +127,121 @@ class Client(object):
     """API URL."""
     ua = "{0} ({1})".format(__title__.title(), __version__)
     """Default User-Agent header."""
-
-    def __init__(self):
+    per_page = 200
+    """Number of items requested per page from paginated listings."""
+    chunk_size = 65536
+    """Number of bytes read at a time from streamed listings."""
+    session = None
+    """A `requests.Session` shared by all requests made by the client."""
+    rate_limiter = None
+    """A `batfish.ratelimit.RateLimiter` pacing all requests."""
+    retry = None
+    """A `batfish.retry.RetryPolicy` or `None`."""
+    conditional_cache = None
+    """A `batfish.cache.ConditionalCache` of GET responses or `None`."""
+    cache = None
+    """A `batfish.cache.DiskCache` of catalog endpoints or `None`."""
+    resolver = None
+    """A `batfish.resolver.Resolver` used for name and slug lookups."""
+    identity_map = None
+    """A `batfish.identity.IdentityMap` of the models returned or `None`."""
+    name_cache = None
+    """A `batfish.cache.NameCache` of resolved names or `None`."""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, keep_alive=True,
+                 rate_limiter=None, retry=None, conditional=True, cache=None,
+                 identity_map=False, name_cache=None):
         token = read_token_from_conf()
         if token is not None:
             self.token = token
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = "close"
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        if conditional:
+            self.conditional_cache = ConditionalCache()
+        self.cache = cache
+        if identity_map:
+            self.identity_map = IdentityMap()
+        self.name_cache = name_cache
+        self.resolver = Resolver({
+            'droplets': lambda: self.paginate('droplets', 'droplets'),
+            'images': lambda: self.catalog('images'),
+            'regions': lambda: self.catalog('regions'),
+            'sizes': lambda: self.catalog('sizes'),
+        })
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close all pooled connections.
+
+            >>> cli = batfish.Client()
+            >>> cli.close()
+        """
+        self.session.close()
+
+    def _url(self, url):
+        if url.startswith(self.api_base):
+            return url
+        return "{0}{1}".format(self.api_base, url)
+
+    def _request(self, method, url, headers, data=None, stream=False):
+        url = self._url(url)
+        attempt = 1
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                r = self.session.request(method, url, headers=headers,
+                                         data=data, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if self.retry is None or not self.retry.should_retry(
+                        method, attempt, error=e):
+                    raise
+                self.retry.backoff(method, url, attempt, error=e)
+                attempt += 1
+                continue
+            self.rate_limiter.update(r.headers)
+            if self.retry is not None and self.retry.should_retry(
+                    method, attempt, response=r):
+                # hand a streamed connection back to the pool first
+                r.close()
+                self.retry.backoff(method, url, attempt, response=r)
+                attempt += 1
+                continue
+            if r.status_code == 404 and self.name_cache is not None:
+                self._forget_missing(url)
+            r.raise_for_status()
+            return r
+
+    def _forget_missing(self, url):
+        m = missing_resource.match(url[len(self.api_base):])
+        if m is not None:
+            self.name_cache.forget(self._cache_key(m.group(1)),
+                                   int(m.group(2)))
 
     def get(self, url, headers=None):
         """
         Send a GET request to the specified URL.
 
+        Requests made with the default headers are conditional when the
+        client has a `conditional_cache`, a `304 Not Modified` response
+        returns the previously parsed body, which must not be modified.
+        Later pages of a listing (`page=` URLs) are not kept, so walking a
+        large listing does not leave it in memory.
+
             >>> cli = batfish.Client()
             >>> cli.get("droplets", {'Custom-Header': "Something, something"})
             {'response': "Nothing", 'reason': "Meh."}
@@ -75,12 +250,25 @@ class Client(object):
         :param headers: Dictionary of headers to send.
         :rtype: Dictionary of the JSON response.
         """
+        cache = None
         if headers is None:
             headers = {'Authorization': "Bearer {0}".format(self.token)}
+            if later_page.search(url) is None:
+                cache = self.conditional_cache
         headers['User-Agent'] = self.ua
-        r = requests.get("{0}{1}".format(self.api_base, url), headers=headers)
-        r.raise_for_status()
-        return json.loads(r.text)
+        cached = None
+        if cache is not None:
+            url = self._url(url)
+            cached = cache.lookup(url)
+            if cached is not None:
+                headers.update(conditional_headers(cached))
+        r = self._request('GET', url, headers)
+        if r.status_code == 304 and cached is not None:
+            return cached.body
+        j = loads(r.content)
+        if cache is not None:
+            cache.store(url, r.headers, j)
+        return j
 
     def post(self, url, payload):
         """
@@ -97,10 +285,8 @@ class Client(object):
         headers = {'Authorization': "Bearer {0}".format(self.token),
                    'User-Agent': self.ua,
                    'Content-Type': "application/json"}
-        r = requests.post("{0}{1}".format(self.api_base, url),
-                          headers=headers, data=json.dumps(payload))
-        r.raise_for_status()
-        return json.loads(r.text)
+        r = self._request('POST', url, headers, json.dumps(payload))
+        return loads(r.content)
 
     def put(self, url, payload):
         """
@@ -117,10 +303,8 @@ class Client(object):
         headers = {'Authorization': "Bearer {0}".format(self.token),
                    'User-Agent': self.ua,
                    'Content-Type': "application/json"}
-        r = requests.put("{0}{1}".format(self.api_base, url),
-                         headers=headers, data=json.dumps(payload))
-        r.raise_for_status()
-        return json.loads(r.text)
+        r = self._request('PUT', url, headers, json.dumps(payload))
+        return loads(r.content)
 
     def delete(self, url):
         """
@@ -133,9 +317,7 @@ class Client(object):
         """
         headers = {'Authorization': "Bearer {0}".format(self.token),
                    'User-Agent': self.ua}
-        r = requests.delete("{0}{1}".format(self.api_base, url),
-                            headers=headers)
-        r.raise_for_status()
+        self._request('DELETE', url, headers)
 
     def authorize(self, token):
         """
@@ -155,8 +337,225 @@ class Client(object):
             raise e
         write_token_to_conf(token)
         self.token = token
+        if self.conditional_cache is not None:
+            self.conditional_cache.clear()
+        if self.cache is not None:
+            CompletionIndex(self.cache).clear()
         return "OK"
 
+    def paginate(self, url, key, model=None, per_page=None, stream=False):
+        """
+        Iterate over every item of a paginated listing, following the
+        `links.pages.next` cursor. Pages are only requested as the
+        previous page is consumed.
+
+            >>> cli = batfish.Client()
+            >>> for d in cli.paginate('droplets', 'droplets', Droplet):
+            ...     print(d)
+            <Droplet droplet-1>
+            <Droplet droplet-2>
+
+        :param url: URI part to query.
+        :param key: The key of the item list in each page.
+        :param model: Optional callable each item is passed through.
+        :param per_page: Number of items per page, defaults to
+                         `Client.per_page`.
+        :param stream: Decode each page incrementally from the response
+                       body, one item at a time, instead of as a whole.
+                       Streamed pages are never conditional.
+        :rtype: A generator of items, `None` if the first page does not
+                contain `key`. Streamed listings always return a
+                generator.
+        """
+        if per_page is None:
+            per_page = self.per_page
+        sep = '&' if '?' in url else '?'
+        url = "{0}{1}per_page={2}".format(url, sep, per_page)
+        if stream:
+            return self._stream_pages(url, key, model)
+        j = self.get(url)
+        if key not in j:
+            return None
+        return self._follow_pages(j, key, model)
+
+    def scope(self):
+        """
+        Start a unit of work that fetches related resources in bulk and
+        keeps them until it ends. Pass it to model helpers such as
+        `Droplet.region` or `Image.regions` in place of the client.
+
+            >>> cli = batfish.Client()
+            >>> with cli.scope() as scope:
+            ...     regions = [d.region(scope) for d in cli.droplets]
+
+        :rtype: An instance of `batfish.scope.Scope`.
+        """
+        return Scope(self)
+
+    def _model(self, model):
+        if self.identity_map is None:
+            return model
+        return self.identity_map.model(model)
+
+    def _cache_key(self, endpoint):
+        return "{0}:{1}:{2}".format(self.api_base, self.token, endpoint)
+
+    def catalog(self, endpoint, refresh=False):
+        """
+        Get every item of a catalog endpoint (`regions`, `sizes` or
+        `images`), from the disk cache when a fresh copy is available.
+
+            >>> cli = batfish.Client(cache=DiskCache())
+            >>> cli.catalog('regions')
+            [{'slug': 'nyc1', 'name': 'New York', ...}, ...]
+
+        :param endpoint: The endpoint name, also the key of the item list.
+        :param refresh: Ignore the cached copy and download a new one.
+        :rtype: List of dictionaries, `None` if the response does not
+                contain `endpoint`.
+        """
+        if self.cache is not None and not refresh:
+            items = self.cache.get(self._cache_key(endpoint),
+                                   self.cache.ttl(endpoint))
+            if items is not None:
+                return items
+        items = self.paginate(endpoint, endpoint)
+        if items is None:
+            return None
+        items = list(items)
+        if self.cache is not None:
+            self.cache.set(self._cache_key(endpoint), items)
+        return items
+
+    def invalidate(self, endpoint, resource_id=None):
+        """
+        Drop the cached copy and name index of an endpoint, and the names
+        remembered for a renamed or deleted resource.
+
+        :param endpoint: The endpoint name, i.e. `images`.
+        :param resource_id: The ID of the resource whose names are stale.
+        """
+        self.resolver.invalidate(endpoint)
+        if self.cache is not None:
+            self.cache.delete(self._cache_key(endpoint))
+        if self.name_cache is not None and resource_id is not None:
+            self.name_cache.forget(self._cache_key(endpoint), resource_id)
+
+    def resolve(self, endpoint, field, value):
+        """
+        Resolve a name or slug prefix using an index of the endpoint that is
+        built once and reused until it expires or is invalidated.
+
+            >>> cli = batfish.Client()
+            >>> match = cli.resolve('droplets', 'name', 'web')
+            >>> match.ambiguous
+            True
+            >>> [d['name'] for d in match.candidates]
+            ['web-1', 'web-2']
+
+        :param endpoint: `droplets`, `images`, `regions` or `sizes`.
+        :param field: The field to match, i.e. `name` or `slug`.
+        :param value: The name or slug, or a prefix of it.
+        :rtype: `batfish.resolver.Match`.
+        """
+        return self.resolver.resolve(endpoint, field, value)
+
+    def _resolve_one(self, endpoint, field, value, model):
+        match = self.resolve(endpoint, field, value)
+        if match.ambiguous:
+            raise AmbiguousName(value, [c[field] for c in match.candidates])
+        if match.item is None:
+            return None
+        return self._model(model)(match.item)
+
+    def _get_or_none(self, url, key, model):
+        try:
+            j = self.get(url)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+        if key not in j:
+            return None
+        return model(j[key])
+
+    def _from_ids(self, endpoint, key, model, ids, max_workers):
+        pending = set(i.id if isinstance(i, Model) else i for i in ids)
+        results = dict.fromkeys(pending)
+        model = self._model(model)
+        if len(pending) > 1:
+            per_page = self.per_page
+            j = self.get("{0}?per_page={1}".format(endpoint, per_page))
+            seen = 0
+            while pending:
+                items = j.get(endpoint, [])
+                seen += len(items)
+                for item in items:
+                    if item['id'] in pending:
+                        results[item['id']] = model(item)
+                        pending.discard(item['id'])
+                url = j.get('links', {}).get('pages', {}).get('next')
+                if url is None:
+                    return results
+                total = j.get('meta', {}).get('total')
+                if total is not None and len(pending) <= math.ceil(
+                        (total - seen) / float(per_page)):
+                    break
+                j = self.get(url)
+
+        def fetch(i):
+            return self._get_or_none("{0}/{1}".format(endpoint, i), key,
+                                     model)
+
+        for i, r in self.bulk(fetch, pending, max_workers).items():
+            if r.error is not None:
+                raise r.error
+            results[i] = r.result
+        return results
+
+    def _follow_pages(self, j, key, model):
+        while True:
+            for item in j[key]:
+                yield item if model is None else model(item)
+            url = j.get('links', {}).get('pages', {}).get('next')
+            if url is None:
+                return
+            j = self.get(url)
+            if key not in j:
+                return
+
+    def _stream_pages(self, url, key, model):
+        headers = {'Authorization': "Bearer {0}".format(self.token),
+                   'User-Agent': self.ua}
+        while url is not None:
+            r = self._request('GET', url, headers, stream=True)
+            rest = {}
+            try:
+                for item in iter_items(r.iter_content(self.chunk_size), key,
+                                       rest):
+                    yield item if model is None else model(item)
+            finally:
+                r.close()
+            url = rest.get('links', {}).get('pages', {}).get('next')
+
+    def iter_droplets(self, per_page=None, stream=False):
+        """
+        Iterate over all droplets, one page at a time.
+
+            >>> cli = batfish.Client()
+            >>> for droplet in cli.iter_droplets(per_page=200):
+            ...     print(droplet)
+            <Droplet droplet-1>
+            <Droplet droplet-2>
+
+        :param per_page: Number of droplets requested per page.
+        :param stream: Decode droplets one at a time from each response
+                       instead of whole pages.
+        :rtype: A generator of `batfish.models.Droplet` objects.
+        """
+        return self.paginate('droplets', 'droplets', self._model(Droplet),
+                             per_page, stream) or iter([])
+
     @property
     def droplets(self):
         """
@@ -168,10 +567,47 @@ class Client(object):
 
         :rtype: List of `batfish.models.Droplet` objects.
         """
-        j = self.get('droplets')
-        if 'droplets' not in j:
+        droplets = self.paginate('droplets', 'droplets',
+                                 self._model(Droplet))
+        if droplets is None:
             return None
-        return [Droplet(d) for d in j['droplets']]
+        return list(droplets)
+
+    def sync_droplets(self, state=None, per_page=None):
+        """
+        List the droplets and report the ones added, removed or changed
+        since the listing `state` was taken from.
+
+            >>> cli = batfish.Client()
+            >>> changes = cli.sync_droplets()
+            >>> changes = cli.sync_droplets(changes.state)
+            >>> changes.removed
+            [1234]
+
+        :param state: The `state` of a previous `batfish.sync.ChangeSet`,
+                      `None` reports every droplet as added.
+        :param per_page: Number of droplets requested per page.
+        :rtype: An instance of `batfish.sync.ChangeSet`.
+        """
+        return FleetSync(self, state).sync(per_page)
+
+    def droplet_table(self, per_page=None):
+        """
+        Get every droplet as a column oriented table for fleet wide
+        filtering and aggregation. Requires `numpy`.
+
+            >>> cli = batfish.Client()
+            >>> table = cli.droplet_table()
+            >>> table.count_by('region')
+            {'ams2': 120, 'nyc3': 80}
+
+        :param per_page: Number of droplets requested per page.
+        :rtype: An instance of `batfish.table.DropletTable`.
+        """
+        from .table import DropletTable
+        return DropletTable.from_dicts(
+            self.paginate('droplets', 'droplets', per_page=per_page,
+                          stream=True))
 
     def droplet_from_id(self, droplet_id):
         """
@@ -184,17 +620,83 @@ class Client(object):
         :param droplet_id: Integer represenation of the droplet ID.
         :rtype: Instance of `batfish.models.Droplet` or None.
         """
-        url = "droplets/{0}".format(droplet_id)
-        try:
-            j = self.get(url)
-        except requests.HTTPError as e:
-            if e.message.startswith('404'):
+        return self._get_or_none("droplets/{0}".format(droplet_id),
+                                 'droplet', self._model(Droplet))
+
+    def droplets_from_ids(self, droplet_ids, max_workers=10):
+        """
+        Get several droplets by ID with as few requests as possible.
+
+        The droplet listing is paged through while that is cheaper than
+        requesting the droplets still missing one by one, the rest are
+        requested with at most `max_workers` concurrent requests.
+
+            >>> cli = batfish.Client()
+            >>> cli.droplets_from_ids([123456, 123457, 123456])
+            {123456: <Droplet droplet-1>, 123457: None}
+
+        :param droplet_ids: An iterable of droplet IDs or instances of
+                            `batfish.models.Droplet`, duplicates are only
+                            fetched once.
+        :param max_workers: The maximum number of concurrent requests.
+        :rtype: Dictionary of droplet ID to `batfish.models.Droplet`,
+                `None` for droplets that do not exist.
+        """
+        return self._from_ids('droplets', 'droplet', Droplet, droplet_ids,
+                              max_workers)
+
+    @staticmethod
+    def _named(item, name):
+        names = [getattr(item, f, None) for f in ('name', 'slug')]
+        return name.lower() in [n.lower() for n in names if n]
+
+    def _id_from_name(self, collection, name, lookups, fetch, verify=False):
+        key = self._cache_key(collection)
+        if self.name_cache is not None:
+            resource_id = self.name_cache.get(key, name)
+            if resource_id is not None and not verify:
+                return resource_id
+            if resource_id is not None:
+                # the resource may have been renamed and the name reused
+                item = fetch(resource_id)
+                if item is not None and self._named(item, name):
+                    return resource_id
+                self.name_cache.forget(key, resource_id)
+        for lookup in lookups:
+            item = lookup(name)
+            if item is not None:
+                break
+        else:
+            # a catalog from the disk cache may predate the resource, i.e.
+            # a new snapshot, so read a fresh listing once
+            if self.cache is None or collection == 'droplets':
                 return None
-            else:
-                raise
-        if 'droplet' not in j:
-            return None
-        return Droplet(j['droplet'])
+            self.invalidate(collection)
+            item = lookups[0](name)
+            if item is None:
+                return None
+        # a prefix stops being unique when a new resource matches it
+        if self.name_cache is not None and self._named(item, name):
+            self.name_cache.set(key, name, item.id)
+        return item.id
+
+    def droplet_id_from_name(self, name, verify=False):
+        """
+        Get the ID of the droplet called `name`, from the client's
+        `name_cache` when it has resolved it recently.
+
+            >>> cli = batfish.Client(name_cache=NameCache(DiskCache()))
+            >>> cli.droplet_id_from_name("kura-test")
+            123456
+
+        :param name: The name, or unique name prefix, of a droplet.
+        :param verify: Check with one request that a remembered droplet is
+                       still called `name`, before destructive actions.
+        :rtype: `integer` or `None`.
+        """
+        return self._id_from_name('droplets', name,
+                                  (self.droplet_from_name, ),
+                                  self.droplet_from_id, verify)
 
     def droplet_from_name(self, name):
         """
@@ -204,16 +706,12 @@ class Client(object):
             >>> cli.droplet_from_name("droplet-1")
             <Droplet droplet-1>
 
-        :param droplet_id: Name of the droplet to query.
+        :param name: Name of the droplet to query, or a unique prefix of it.
         :rtype: Instance of `batfish.models.Droplet` or None.
+        :raises: `batfish.exceptions.AmbiguousName` if more than one droplet
+                 matches.
         """
-        j = self.get('droplets')
-        if 'droplets' not in j:
-            return None
-        for d in j['droplets']:
-            if d['name'].lower().startswith(name.lower()):
-                return Droplet(d)
-        return None
+        return self._resolve_one('droplets', 'name', name, Droplet)
 
     def simple_droplet_image_action(self, action, droplet, image):
         """
@@ -230,14 +728,14 @@ class Client(object):
                       instance of `batfish.models.Image`.
         :rtype: Dictionary of the JSON response.
         """
-        if action not in ['restore', 'rebuild', ]:
-            raise NotImplemented
+        if action not in droplet_image_actions:
+            raise NotImplementedError(action)
         if isinstance(droplet, Droplet):
             droplet = droplet.id
         if isinstance(image, Image):
             image = image.id
-        print(self.post('droplets/{0}/actions'.format(droplet),
-                        {'type': action, 'image': image}))
+        return self.post('droplets/{0}/actions'.format(droplet),
+                         {'type': action, 'image': image})
 
     def simple_droplet_action(self, action, droplet):
         """
@@ -255,14 +753,194 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        if action not in ['reboot', 'power_cycle', 'power_off', 'enable_ipv6',
-                          'power_on', 'password_reset', 'shutdown',
-                          'disable_backups', 'enable_private_networking', ]:
-            raise NotImplemented()
+        if action not in droplet_actions:
+            raise NotImplementedError(action)
         if isinstance(droplet, Droplet):
             droplet = droplet.id
-        print(self.post('droplets/{0}/actions'.format(droplet),
-                        {'type': action}))
+        return self.post('droplets/{0}/actions'.format(droplet),
+                         {'type': action})
+
+    def bulk(self, func, droplets, max_workers=10):
+        """
+        Call `func` once for each droplet, running at most `max_workers`
+        calls at the same time. Errors are collected rather than raised.
+
+            >>> cli = batfish.Client()
+            >>> cli.bulk(cli.droplet_reboot, [123456, 123457])
+            {123456: BulkResult(droplet=123456, result={...}, error=None),
+             123457: BulkResult(droplet=123457, result=None,
+                                error=HTTPError(...))}
+
+        `max_workers` should not exceed the client's `pool_maxsize`, or
+        connections will be opened and thrown away instead of reused.
+
+        :param func: A callable accepting a droplet ID.
+        :param droplets: An iterable of droplet IDs or instances of
+                         `batfish.models.Droplet`.
+        :param max_workers: The maximum number of concurrent requests.
+        :rtype: Dictionary of droplet ID to `batfish.client.BulkResult`.
+        """
+        ids = []
+        for droplet in droplets:
+            if isinstance(droplet, Droplet):
+                droplet = droplet.id
+            ids.append(droplet)
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = dict((pool.submit(func, d), d) for d in ids)
+            for future in as_completed(futures):
+                d = futures[future]
+                try:
+                    results[d] = BulkResult(d, future.result(), None)
+                except Exception as e:
+                    results[d] = BulkResult(d, None, e)
+        return results
+
+    def bulk_droplet_action(self, action, droplets, max_workers=10,
+                            image=None):
+        """
+        Send the same action to many droplets concurrently.
+
+            >>> cli = batfish.Client()
+            >>> cli.bulk_droplet_action("reboot", [123456, 123457])
+            {123456: BulkResult(droplet=123456, result={...}, error=None),
+             123457: BulkResult(droplet=123457, result={...}, error=None)}
+
+        :param action: Any action accepted by `simple_droplet_action` or
+                       `simple_droplet_image_action`.
+        :param droplets: An iterable of droplet IDs or instances of
+                         `batfish.models.Droplet`.
+        :param max_workers: The maximum number of concurrent requests.
+        :param image: The image to use for image actions, either an image ID
+                      or an instance of `batfish.models.Image`.
+        :rtype: Dictionary of droplet ID to `batfish.client.BulkResult`.
+        """
+        if action in droplet_image_actions:
+            func = functools.partial(self.simple_droplet_image_action, action,
+                                     image=image)
+        elif action in droplet_actions:
+            func = functools.partial(self.simple_droplet_action, action)
+        else:
+            raise NotImplementedError(action)
+        return self.bulk(func, droplets, max_workers)
+
+    def action_from_id(self, action_id):
+        """
+        Get an instance of `batfish.models.Action` for the provided action ID.
+
+            >>> cli = batfish.Client()
+            >>> cli.action_from_id(36804636)
+            <Action reboot>
+
+        :param action_id: An integer ID of an action.
+        :rtype: An instance of `batfish.models.Action` or `None`.
+        """
+        j = self.get("actions/{0}".format(action_id))
+        if 'action' not in j:
+            return None
+        return self._model(Action)(j['action'])
+
+    def action_feed(self, cursor=None, per_page=None):
+        """
+        Get an incremental feed of the account's actions.
+
+            >>> cli = batfish.Client()
+            >>> feed = cli.action_feed(cursor=36805022)
+            >>> list(feed.poll())
+            [<Action reboot>]
+
+        :param cursor: The highest action ID already seen.
+        :param per_page: Number of actions requested per page.
+        :rtype: An instance of `batfish.feed.ActionFeed`.
+        """
+        return ActionFeed(self, 'actions', cursor, per_page)
+
+    def wait_for_action(self, action, timeout=300, interval=1,
+                        max_interval=15):
+        """
+        Wait until an action is completed or errored.
+
+            >>> cli = batfish.Client()
+            >>> cli.wait_for_action(cli.droplet_reboot(123456))
+            <Action reboot>
+
+        :param action: An action ID, an instance of `batfish.models.Action`
+                       or the response of a method that started an action.
+        :param timeout: Seconds to wait before giving up.
+        :param interval: Seconds to wait before the first poll, grows by
+                         half after each poll.
+        :param max_interval: The maximum number of seconds between polls.
+        :rtype: An instance of `batfish.models.Action`.
+        :raises: `batfish.exceptions.ActionTimeout` on timeout.
+        """
+        ids = self._action_ids(action)
+        if not ids:
+            raise ValueError("No action to wait for in {0!r}".format(action))
+        return self.wait_for_actions(ids[:1], timeout, interval,
+                                     max_interval)[ids[0]]
+
+    def wait_for_actions(self, actions, timeout=300, interval=1,
+                         max_interval=15):
+        """
+        Wait until every action is completed or errored.
+
+        All pending actions are checked together each round by reading the
+        account's action history, newest first, only as far back as the
+        oldest pending action.
+
+            >>> cli = batfish.Client()
+            >>> cli.wait_for_actions([36804636, 36804637])
+            {36804636: <Action reboot>, 36804637: <Action reboot>}
+
+        :param actions: An iterable of action IDs, instances of
+                        `batfish.models.Action` or responses of methods that
+                        started an action.
+        :param timeout: Seconds to wait before giving up.
+        :param interval: Seconds to wait before the first poll, grows by
+                         half after each poll.
+        :param max_interval: The maximum number of seconds between polls.
+        :rtype: Dictionary of action ID to `batfish.models.Action`.
+        :raises: `batfish.exceptions.ActionTimeout` on timeout.
+        """
+        pending = set()
+        for a in actions:
+            pending.update(self._action_ids(a))
+        done = {}
+        deadline = time.time() + timeout
+        while True:
+            for a in self._poll_actions(pending):
+                if a.status in action_done:
+                    done[a.id] = a
+                    pending.discard(a.id)
+            if not pending:
+                return done
+            if time.time() + interval > deadline:
+                raise ActionTimeout(pending, done)
+            time.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
+
+    def _poll_actions(self, pending):
+        if len(pending) == 1:
+            action = self.action_from_id(next(iter(pending)))
+            return [action] if action is not None else []
+        found = []
+        oldest = min(pending)
+        for a in self.paginate('actions', 'actions') or []:
+            if a['id'] in pending:
+                found.append(self._model(Action)(a))
+                if len(found) == len(pending):
+                    break
+            elif a['id'] < oldest:
+                break
+        return found
+
+    @staticmethod
+    def _action_ids(action):
+        if isinstance(action, Action):
+            return [action.id]
+        if isinstance(action, dict):
+            return action_ids(action)
+        return [int(action)]
 
     def droplet_rename(self, droplet, name):
         """
@@ -282,8 +960,9 @@ class Client(object):
         if not valid_chars.match(name):
             raise ValueError("""Only valid characters are allowed. """
                              """(a-z, A-Z, 0-9, . and -)""")
-        print(self.post('droplets/{0}/actions'.format(droplet),
-                        {'type': 'rename', 'name': name}))
+        self.invalidate('droplets', droplet)
+        return self.post('droplets/{0}/actions'.format(droplet),
+                         {'type': 'rename', 'name': name})
 
     def droplet_snapshot(self, droplet, name):
         """
@@ -303,8 +982,9 @@ class Client(object):
         if not valid_chars.match(name):
             raise ValueError("""Only valid characters are allowed. """
                              """(a-z, A-Z, 0-9, . and -)""")
-        print(self.post('droplets/{0}/actions'.format(droplet),
-                        {'type': 'snapshot', 'name': name}))
+        self.invalidate('images')
+        return self.post('droplets/{0}/actions'.format(droplet),
+                         {'type': 'snapshot', 'name': name})
 
     def droplet_resize(self, droplet, size):
         """
@@ -324,8 +1004,8 @@ class Client(object):
             droplet = droplet.id
         if isinstance(size, Size):
             size = size.slug
-        print(self.post('droplets/{0}/actions'.format(droplet),
-                        {'type': 'resize', 'size': size}))
+        return self.post('droplets/{0}/actions'.format(droplet),
+                         {'type': 'resize', 'size': size})
 
     def droplet_restore(self, droplet, image):
         """
@@ -341,7 +1021,7 @@ class Client(object):
                       `batfish.models.Image`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_image_action('restore', droplet, image)
+        return self.simple_droplet_image_action('restore', droplet, image)
 
     def droplet_rebuild(self, droplet, image):
         """
@@ -357,7 +1037,7 @@ class Client(object):
                       `batfish.models.Image`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_image_action('rebuild', droplet, image)
+        return self.simple_droplet_image_action('rebuild', droplet, image)
 
     def droplet_enable_ipv6(self, droplet):
         """
@@ -371,7 +1051,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('enable_ipv6', droplet)
+        return self.simple_droplet_action('enable_ipv6', droplet)
 
     def droplet_disable_backups(self, droplet):
         """
@@ -385,7 +1065,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('disable_backups', droplet)
+        return self.simple_droplet_action('disable_backups', droplet)
 
     def droplet_enable_private_networking(self, droplet):
         """
@@ -399,7 +1079,8 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('enable_private_networking', droplet)
+        return self.simple_droplet_action('enable_private_networking',
+                                          droplet)
 
     def droplet_reboot(self, droplet):
         """
@@ -413,7 +1094,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('reboot', droplet)
+        return self.simple_droplet_action('reboot', droplet)
 
     def droplet_power_cycle(self, droplet):
         """
@@ -427,7 +1108,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('power_cycle', droplet)
+        return self.simple_droplet_action('power_cycle', droplet)
 
     def droplet_power_off(self, droplet):
         """
@@ -441,7 +1122,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('power_off', droplet)
+        return self.simple_droplet_action('power_off', droplet)
 
     def droplet_power_on(self, droplet):
         """
@@ -455,7 +1136,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('power_on', droplet)
+        return self.simple_droplet_action('power_on', droplet)
 
     def droplet_password_reset(self, droplet):
         """
@@ -469,7 +1150,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('password_reset', droplet)
+        return self.simple_droplet_action('password_reset', droplet)
 
     def droplet_shutdown(self, droplet):
         """
@@ -483,7 +1164,7 @@ class Client(object):
                         instance of `batfish.models.Droplet`.
         :rtype: Dictionary of the JSON response.
         """
-        self.simple_droplet_action('shutdown', droplet)
+        return self.simple_droplet_action('shutdown', droplet)
 
     def droplet_delete(self, droplet):
         """
@@ -499,7 +1180,8 @@ class Client(object):
         """
         if isinstance(droplet, Droplet):
             droplet = droplet.id
-        print(self.delete('droplets/{0}'.format(droplet)))
+        self.invalidate('droplets', droplet)
+        return self.delete('droplets/{0}'.format(droplet))
 
     def droplet_create(self, name, region, size, image):
         """
@@ -531,7 +1213,26 @@ class Client(object):
                              """(a-z, A-Z, 0-9, . and -)""")
         d = {'name': name, 'size': size.lower(), 'image': image,
              'region': region}
-        print(self.post('droplets', d))
+        self.invalidate('droplets')
+        return self.post('droplets', d)
+
+    def iter_images(self, per_page=None, stream=False):
+        """
+        Iterate over all images, one page at a time.
+
+            >>> cli = batfish.Client()
+            >>> for image in cli.iter_images(per_page=200):
+            ...     print(image)
+            <Image test1>
+            <Image test2>
+
+        :param per_page: Number of images requested per page.
+        :param stream: Decode images one at a time from each response
+                       instead of whole pages.
+        :rtype: A generator of `batfish.models.Image` objects.
+        """
+        return self.paginate('images', 'images', self._model(Image), per_page,
+                             stream) or iter([])
 
     @property
     def images(self):
@@ -544,10 +1245,25 @@ class Client(object):
 
         :rtype: List of `batfish.models.Image` objects.
         """
-        j = self.get('images')
-        if 'images' not in j:
+        images = self.catalog('images')
+        if images is None:
             return None
-        return [Image(i) for i in j['images']]
+        model = self._model(Image)
+        return [model(i) for i in images]
+
+    def image_table(self):
+        """
+        Get every image as a column oriented table. Requires `numpy`.
+
+            >>> cli = batfish.Client()
+            >>> table = cli.image_table()
+            >>> table.count_by('distribution')
+            {'CentOS': 12, 'Ubuntu': 30}
+
+        :rtype: An instance of `batfish.table.ImageTable`.
+        """
+        from .table import ImageTable
+        return ImageTable.from_dicts(self.catalog('images') or [])
 
     def image_from_id(self, image_id):
         """
@@ -558,13 +1274,47 @@ class Client(object):
             <Image test1>
 
         :param image_id: An integer ID of an image.
-        :rtype: An instance of `batfish.models.Image`.
+        :rtype: An instance of `batfish.models.Image` or None.
         """
-        url = "images/{0}".format(image_id)
-        j = self.get(url)
-        if 'image' not in j:
-            return None
-        return Image(j['image'])
+        return self._get_or_none("images/{0}".format(image_id), 'image',
+                                 self._model(Image))
+
+    def images_from_ids(self, image_ids, max_workers=10):
+        """
+        Get several images by ID with as few requests as possible, see
+        `Client.droplets_from_ids`.
+
+            >>> cli = batfish.Client()
+            >>> cli.images_from_ids([12345, 12346])
+            {12345: <Image test1>, 12346: None}
+
+        :param image_ids: An iterable of image IDs or instances of
+                          `batfish.models.Image`.
+        :param max_workers: The maximum number of concurrent requests.
+        :rtype: Dictionary of image ID to `batfish.models.Image`, `None`
+                for images that do not exist.
+        """
+        return self._from_ids('images', 'image', Image, image_ids,
+                              max_workers)
+
+    def image_id_from_name(self, name, verify=False):
+        """
+        Get the ID of the image with the name, or else the slug, `name`,
+        from the client's `name_cache` when it has resolved it recently.
+
+            >>> cli = batfish.Client(name_cache=NameCache(DiskCache()))
+            >>> cli.image_id_from_name("ubuntu-14-04-x64")
+            3240036
+
+        :param name: The name or slug of an image.
+        :param verify: Check with one request that a remembered image is
+                       still called `name`, before destructive actions.
+        :rtype: `integer` or `None`.
+        """
+        return self._id_from_name('images', name,
+                                  (self.image_from_name,
+                                   self.image_from_slug),
+                                  self.image_from_id, verify)
 
     def image_from_name(self, name):
         """
@@ -574,16 +1324,12 @@ class Client(object):
             >>> cli.image_from_name('test1')
             <Image test1>
 
-        :param name: A string name of an image.
+        :param name: A string name of an image, or a unique prefix of it.
         :rtype: An instance of `batfish.models.Image`.
+        :raises: `batfish.exceptions.AmbiguousName` if more than one image
+                 matches.
         """
-        j = self.get('images')
-        if 'images' not in j:
-            return None
-        for i in j['images']:
-            if i['name'].lower().startswith(name.lower()):
-                return Image(i)
-        return None
+        return self._resolve_one('images', 'name', name, Image)
 
     def image_from_slug(self, slug):
         """
@@ -594,13 +1340,10 @@ class Client(object):
             <Image test1>
 
         :param slug: A string slug of an image.
-        :rtype: An instance of `batfish.models.Image`.
+        :rtype: An instance of `batfish.models.Image` or None.
         """
-        url = "images/{0}".format(slug.lower())
-        j = self.get(url)
-        if 'image' not in j:
-            return None
-        return Image(j['image'])
+        return self._get_or_none("images/{0}".format(slug.lower()), 'image',
+                                 self._model(Image))
 
     def image_delete(self, image):
         """
@@ -614,7 +1357,8 @@ class Client(object):
         """
         if isinstance(image, Image):
             image = image.id
-        print(self.delete('images/{0}'.format(image)))
+        self.invalidate('images', image)
+        return self.delete('images/{0}'.format(image))
 
     def image_rename(self, image, name):
         """
@@ -634,7 +1378,8 @@ class Client(object):
         if not valid_chars.match(name):
             raise ValueError("""Only valid characters are allowed. """
                              """(a-z, A-Z, 0-9, . and -)""")
-        print(self.put("images/{0}".format(image), {'name': name}))
+        self.invalidate('images', image)
+        return self.put("images/{0}".format(image), {'name': name})
 
     def image_transfer(self, image, region):
         if isinstance(image, Image):
@@ -642,35 +1387,53 @@ class Client(object):
         if isinstance(region, Region):
             region = region.slug
         d = {'type': 'transfer', 'region': region}
-        print(self.post("images/{0}/actions".format(image), d))
+        self.invalidate('images')
+        return self.post("images/{0}/actions".format(image), d)
+
+    def iter_regions(self, per_page=None):
+        return self.paginate('regions', 'regions', self._model(Region),
+                             per_page) or iter([])
 
     @property
     def regions(self):
-        j = self.get('regions')
-        return [Region(r) for r in j['regions']]
+        model = self._model(Region)
+        return [model(r) for r in self.catalog('regions') or []]
 
     def region_from_name(self, name):
-        j = self.get('regions')
-        for r in j['regions']:
-            if r['name'].lower().startswith(name.lower()):
-                return Region(r)
-        return None
+        return self._resolve_one('regions', 'name', name, Region)
 
     def region_from_slug(self, slug):
-        j = self.get('regions')
-        for r in j['regions']:
-            if r['slug'].lower().startswith(slug.lower()):
-                return Region(r)
-        return None
+        return self._resolve_one('regions', 'slug', slug, Region)
+
+    def regions_from_slugs(self, slugs):
+        """
+        Get the regions of several exact slugs from the client's slug index
+        of the `regions` listing, which is shared between calls.
+
+            >>> cli = batfish.Client()
+            >>> cli.regions_from_slugs(['ams1', 'nyc2'])
+            [<Region Amsterdam 1>, <Region New York 2>]
+
+        :param slugs: An iterable of region slugs.
+        :rtype: `list` of `batfish.models.Region` instances, `None` for
+                unknown slugs.
+        """
+        index = self.resolver.index('regions', 'slug')
+        model = self._model(Region)
+        regions = []
+        for slug in slugs:
+            found = index.exact(slug)
+            regions.append(model(found[0]) if found else None)
+        return regions
+
+    def iter_sizes(self, per_page=None):
+        return self.paginate('sizes', 'sizes', self._model(Size),
+                             per_page) or iter([])
 
     @property
     def sizes(self):
-        j = self.get('sizes')
-        return [Size(s) for s in j['sizes']]
+        model = self._model(Size)
+        return [model(s) for s in self.catalog('sizes') or []]
 
     def size_from_slug(self, slug):
-        j = self.get('sizes')
-        for s in j['sizes']:
-            if s['slug'].lower().startswith(slug.lower()):
-                return Size(s)
-        return None
+        return self._resolve_one('sizes', 'slug', slug, Size)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from bisect import bisect_left
+import os
+import subprocess
+import sys
+import time
+
+from .cache import DiskCache
+
+
+def names(items, fields):
+    """
+    The distinct values of `fields` across API dictionaries.
+
+    :param items: An iterable of dictionaries.
+    :param fields: The fields holding names or slugs.
+    :rtype: `set` of strings.
+    """
+    found = set()
+    for item in items:
+        for field in fields:
+            if item.get(field):
+                found.add(item[field])
+    return found
+
+
+class CompletionIndex(object):
+    """
+    A snapshot of droplet names, image names and slugs and region slugs,
+    kept in a `batfish.cache.DiskCache` and searched by prefix with a
+    binary search, so shell and console completion never wait on the API.
+
+    The snapshot is rewritten by `refresh`, by a console inventory refresh
+    or, once it is older than `max_age`, by a detached `python -m
+    batfish.completion` process that `refresh_in_background` starts.
+
+        >>> index = CompletionIndex(DiskCache())
+        >>> index.complete('droplets', 'web')
+        ['web-1', 'web-2']
+
+    :param cache: A `batfish.cache.DiskCache`.
+    :param max_age: Seconds after which the snapshot is refreshed.
+    """
+
+    key = 'completion'
+    """Cache key of the snapshot."""
+    collections = {'droplets': ('name', ),
+                   'images': ('name', 'slug'),
+                   'regions': ('slug', )}
+    """Collection name to the fields completed."""
+    max_age = 300
+    """Default number of seconds before the snapshot is refreshed."""
+    refresh_timeout = 60
+    """Seconds before a background refresh that did not finish is retried."""
+
+    def __init__(self, cache, max_age=None):
+        self.cache = cache
+        if max_age is not None:
+            self.max_age = max_age
+        self._snapshot = None
+
+    @classmethod
+    def snapshot(cls, **collections):
+        """
+        Build a snapshot from API dictionaries.
+
+        :param collections: Collection name to an iterable of dictionaries.
+        :rtype: `dictionary`, sorted lower case keys and names by collection.
+        """
+        snapshot = {'updated': time.time()}
+        for collection, items in collections.items():
+            found = sorted((n.lower(), n) for n in
+                           names(items, cls.collections[collection]))
+            snapshot[collection] = [[k for k, _ in found],
+                                    [n for _, n in found]]
+        return snapshot
+
+    def load(self):
+        """
+        Read the snapshot, once.
+
+        :rtype: `dictionary`, empty if there is none.
+        """
+        if self._snapshot is None:
+            self._snapshot = self.cache.get(self.key, float('inf')) or {}
+        return self._snapshot
+
+    def save(self, snapshot):
+        """
+        Replace the snapshot.
+
+        :param snapshot: A snapshot built by `CompletionIndex.snapshot`.
+        """
+        self.cache.set(self.key, snapshot)
+        self.cache.delete('{0}:refresh'.format(self.key))
+        self._snapshot = snapshot
+
+    def clear(self):
+        """Remove the snapshot, i.e. after switching accounts."""
+        self.cache.delete(self.key)
+        self._snapshot = None
+
+    def refresh(self, client):
+        """
+        Download the droplets, images and regions now and save them.
+
+        :param client: An instance of `batfish.client.Client`.
+        """
+        self.save(self.snapshot(
+            droplets=client.paginate('droplets', 'droplets') or [],
+            images=client.catalog('images') or [],
+            regions=client.catalog('regions') or []))
+
+    @property
+    def age(self):
+        """
+        Seconds since the snapshot was built.
+
+        :rtype: `float` or `None` if there is no snapshot.
+        """
+        updated = self.load().get('updated')
+        if updated is None:
+            return None
+        return time.time() - updated
+
+    @property
+    def stale(self):
+        """`True` if there is no snapshot or it is older than `max_age`."""
+        age = self.age
+        return age is None or age > self.max_age
+
+    def refresh_in_background(self):
+        """
+        Start a detached process refreshing the snapshot if it is stale
+        and no other refresh started in the last `refresh_timeout` seconds.
+
+        :rtype: `True` if a process was started.
+        """
+        marker = '{0}:refresh'.format(self.key)
+        if not self.stale or \
+                self.cache.get(marker, self.refresh_timeout) is not None:
+            return False
+        self.cache.set(marker, time.time())
+        kwargs = {}
+        if hasattr(os, 'setsid'):
+            kwargs['preexec_fn'] = os.setsid
+        with open(os.devnull, 'r+') as devnull:
+            subprocess.Popen([sys.executable, '-m', 'batfish.completion'],
+                             stdin=devnull, stdout=devnull, stderr=devnull,
+                             close_fds=True, **kwargs)
+        return True
+
+    def complete(self, collection, prefix=''):
+        """
+        The names of a collection starting with `prefix`, ignoring case.
+
+        :param collection: `droplets`, `images` or `regions`.
+        :param prefix: The start of the name.
+        :rtype: Sorted `list` of strings.
+        """
+        keys, values = self.load().get(collection, ([], []))
+        prefix = prefix.lower()
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + u'\uffff', start)
+        return values[start:end]
+
+
+def main():
+    from .client import Client
+    cache = DiskCache()
+    CompletionIndex(cache).refresh(Client(cache=cache))
+
+
+if __name__ == '__main__':
+    main()
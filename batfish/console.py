@@ -1,23 +1,225 @@
 from cmd import Cmd
+import functools
+import threading
 
+from .cache import DiskCache, NameCache
 from .client import Client
+from .completion import CompletionIndex
+from .exceptions import AmbiguousName, NotFound
+from .inventory import Inventory
+from .jobs import JobManager
+
+try:
+    input = raw_input
+except NameError:
+    pass
 # from .models.region import Region
 from .models.size import Size
 
 
+def staleness(inventory):
+    """A short description of how old the inventory is, for the prompt."""
+    age = inventory.age
+    if age is None:
+        return "loading"
+    if age < 60:
+        text = "{0}s".format(int(age))
+    else:
+        text = "{0}m".format(int(age // 60))
+    if age > 2 * inventory.interval:
+        text = "stale {0}".format(text)
+    return text
+
+
+def confirm(func):
+    """
+    Ask for confirmation before running a command, or before putting it
+    in the background.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        if getattr(self.local, 'outputs', None) is None and \
+                not self.ask():
+            return
+        return func(self, *args)
+    wrapper.confirm = True
+    return wrapper
+
+
 class Batfish(Cmd):
-    ctx = Client()
+    cache = DiskCache()
+    ctx = Client(cache=cache, name_cache=NameCache(cache))
+    refresh_interval = 60
+    completion = CompletionIndex(cache)
+    completions = {'droplet_create': (None, 'regions', None, 'images'),
+                   'droplet_restore': ('droplets', 'images'),
+                   'image_transfer': ('images', 'regions')}
+    inventory = None
+    jobs = None
+    local = threading.local()
+
+    def preloop(self):
+        self.inventory = Inventory(self.ctx, self.refresh_interval,
+                                   completion=self.completion)
+        self.inventory.start()
+        self.jobs = JobManager(self.ctx)
+        self.update_prompt()
+
+    def postloop(self):
+        self.jobs.shutdown()
+        self.inventory.stop()
+
+    def precmd(self, line):
+        if line.rstrip().endswith('&'):
+            self.background(line.rstrip()[:-1].strip())
+            return ''
+        return line
+
+    def postcmd(self, stop, line):
+        self.notify()
+        self.update_prompt()
+        return stop
+
+    def emptyline(self):
+        pass
+
+    def ask(self):
+        accept = input("Are you sure you want to do this? [y/N]: ")
+        return accept.lower() == 'y'
+
+    def output(self, value):
+        outputs = getattr(self.local, 'outputs', None)
+        if outputs is None:
+            print(value)
+        else:
+            outputs.append(value)
+
+    def background(self, line):
+        command, args, line = self.parseline(line)
+        method = getattr(self, 'do_{0}'.format(command), None)
+        if not command or method is None:
+            return self.default(line)
+        if getattr(method, 'confirm', False) and not self.ask():
+            return
+
+        def run():
+            self.local.outputs = []
+            try:
+                method(args)
+                return self.local.outputs
+            finally:
+                self.local.outputs = None
+
+        job = self.jobs.submit(line, run)
+        print("[{0}] {1}".format(job.id, line))
+
+    def print_job(self, job, outputs=False):
+        line = "[{0}] {1:<9} {2}".format(job.id, job.status, job.command)
+        if job.error is not None:
+            line = "{0}: {1}".format(line, job.error)
+        print(line)
+        if outputs:
+            for output in job.outputs:
+                print("    {0}".format(output))
+        for action in job.actions.values():
+            print("    action {0} {1}".format(action.id, action.status))
+
+    def notify(self):
+        for job in self.jobs.finished():
+            self.print_job(job, outputs=True)
+
+    def do_jobs(self, *args):
+        """Lists background jobs."""
+        for job in self.jobs.jobs:
+            self.print_job(job)
+
+    def job_from_args(self, args):
+        if not args.strip().isdigit() or \
+                self.jobs.get(int(args)) is None:
+            print("No such job: {0}".format(args))
+            return None
+        return int(args)
+
+    def do_wait(self, args):
+        """wait <job>, waits for a background job to finish."""
+        job_id = self.job_from_args(args)
+        if job_id is not None:
+            self.jobs.wait(job_id)
+
+    def do_cancel(self, args):
+        """cancel <job>, stops a background job waiting for its actions."""
+        job_id = self.job_from_args(args)
+        if job_id is not None and not self.jobs.cancel(job_id):
+            print("Job {0} already finished".format(job_id))
+
+    def update_prompt(self):
+        self.prompt = "batfish [{0}] > ".format(staleness(self.inventory))
+
+    def loaded_inventory(self):
+        if not self.inventory.wait(self.refresh_interval):
+            self.inventory.refresh()
+        if self.inventory.error is not None:
+            self.output("Refresh failed, showing data from {0} ago: "
+                        "{1}".format(staleness(self.inventory),
+                                     self.inventory.error))
+        return self.inventory
+
+    def do_refresh(self, *args):
+        """Refreshes the droplet and image inventory now."""
+        self.inventory.refresh()
+        self.output("{0} droplets, {1} images".format(
+            len(self.inventory.items('droplets')),
+            len(self.inventory.items('images'))))
+
+    def completedefault(self, text, line, begidx, endidx):
+        words = line[:begidx].split()
+        command, position = words[0], len(words) - 1
+        collections = self.completions.get(command)
+        if collections is None:
+            collections = [c for c in ('droplets', 'images')
+                           if command.startswith(c[:-1])]
+        if position >= len(collections) or collections[position] is None:
+            return []
+        collection = collections[position]
+        # the snapshot answers until the first inventory refresh
+        if collection != 'regions' and self.inventory.loaded:
+            return self.inventory.names(collection, text)
+        return self.completion.complete(collection, text)
+
+    def onecmd(self, line):
+        try:
+            return Cmd.onecmd(self, line)
+        except (AmbiguousName, NotFound) as e:
+            print(e)
+
+    def droplet_id(self, droplet, verify=False):
+        if droplet.isdigit():
+            return int(droplet)
+        droplet_id = self.ctx.droplet_id_from_name(droplet, verify)
+        if droplet_id is None:
+            raise NotFound("No droplet named {0}".format(droplet))
+        return droplet_id
+
+    def image_id(self, image, verify=False):
+        if image.isdigit():
+            return int(image)
+        # assume name first, then try slug
+        image_id = self.ctx.image_id_from_name(image, verify)
+        if image_id is None:
+            raise NotFound("No image named {0}".format(image))
+        return image_id
 
     def do_authorize(self, token):
-        print(self.ctx.authorize(token))
+        self.output(self.ctx.authorize(token))
 
     def print_droplet(self, name, cpu, memory, disk, ip, status, region, did):
-        print("""{0} [id: {1}] (cpu(s): {2}, mem: {3}MB, disk: {4}, """
-              """ip: {5}, status: {6}, region: {7})"""
-              """""".format(name, did, cpu, memory, disk, ip, status, region))
+        self.output("""{0} [id: {1}] (cpu(s): {2}, mem: {3}MB, """
+                    """disk: {4}, ip: {5}, status: {6}, region: {7})"""
+                    """""".format(name, did, cpu, memory, disk, ip, status,
+                                  region))
 
     def do_droplets(self, *args):
-        for droplet in self.ctx.droplets:
+        for droplet in self.loaded_inventory().items('droplets'):
             self.print_droplet(droplet.name, droplet.cpus, droplet.memory,
                                droplet.disk_size,
                                droplet.networks['ipv4'][0].ip,
@@ -25,187 +227,145 @@ class Batfish(Cmd):
                                droplet.id)
 
     def do_droplet(self, droplet):
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_id(droplet)
+        found = self.loaded_inventory().droplet(droplet)
+        if found is not None:
+            droplet = found
         else:
-            droplet = self.ctx.droplet_from_name(droplet)
+            droplet = self.ctx.droplet_from_id(self.droplet_id(droplet))
+            if droplet is None:
+                raise NotFound("No such droplet")
         self.print_droplet(droplet.name, droplet.cpus, droplet.memory,
                            droplet.disk_size,
                            droplet.networks['ipv4'][0].ip,
                            droplet.status, droplet.region_name,
                            droplet.id)
 
+    @confirm
     def do_droplet_password_reset(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_password_reset(droplet)
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_password_reset(droplet))
 
+    @confirm
     def do_droplet_power_cycle(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_power_cycle(droplet)
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_power_cycle(droplet))
 
+    @confirm
     def do_droplet_power_off(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_power_off(droplet)
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_power_off(droplet))
 
     def do_droplet_power_on(self, droplet):
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_power_on(droplet)
-
-    def droplet_reboot(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_reboot(droplet)
-
-    def droplet_shutdown(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_shutdown(droplet)
-
-    def do_droplet_restore(self, droplet, image):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        if not image.isdigit():
-            # assume name first, then try slug
-            image = self.ctx.image_from_name(image)
-            if image is None:
-                image = self.ctx.image_from_slug(image)
-            image = image.id
-        self.ctx.droplet_rebuild(droplet, image)
-
-    def do_droplet_create(self, name, region, size, image):
-        self.ctx.droplet_create(name, region, size, image)
-
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_power_on(droplet))
+
+    @confirm
+    def do_droplet_reboot(self, droplet):
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_reboot(droplet))
+
+    @confirm
+    def do_droplet_shutdown(self, droplet):
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_shutdown(droplet))
+
+    @confirm
+    def do_droplet_restore(self, args):
+        """droplet_restore <droplet> <image>"""
+        droplet, image = args.split()
+        droplet = self.droplet_id(droplet, verify=True)
+        image = self.image_id(image, verify=True)
+        self.output(self.ctx.droplet_restore(droplet, image))
+
+    def do_droplet_snapshot(self, args):
+        """droplet_snapshot <droplet> <name>"""
+        droplet, name = args.split()
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_snapshot(droplet, name))
+
+    def do_droplet_create(self, args):
+        """droplet_create <name> <region> <size> <image>"""
+        name, region, size, image = args.split()
+        self.output(self.ctx.droplet_create(name, region, size, image))
+
+    @confirm
     def do_droplet_delete(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_delete(droplet)
+        droplet = self.droplet_id(droplet, verify=True)
+        self.output(self.ctx.droplet_delete(droplet))
 
-    def do_droplet_rename(self, droplet, name):
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_rename(droplet, name)
+    def do_droplet_rename(self, args):
+        """droplet_rename <droplet> <name>"""
+        droplet, name = args.split()
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_rename(droplet, name))
 
-    def do_droplet_resize(self, droplet, size):
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_resize(droplet, size)
+    def do_droplet_resize(self, args):
+        """droplet_resize <droplet> <size>"""
+        droplet, size = args.split()
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_resize(droplet, size))
 
     def do_droplet_enabled_ipv6(self, droplet):
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_enabled_ipv6(droplet)
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_enable_ipv6(droplet))
 
+    @confirm
     def do_droplet_disable_backups(self, droplet):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_disable_backups(droplet)
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_disable_backups(droplet))
 
     def do_droplet_enable_private_networking(self, droplet):
-        if droplet.isdigit():
-            droplet = self.ctx.droplet_from_name(droplet)
-            droplet = droplet.id
-        self.ctx.droplet_enable_private_networking(droplet)
+        droplet = self.droplet_id(droplet)
+        self.output(self.ctx.droplet_enable_private_networking(droplet))
 
     def print_image(self, iid, name, slug, distribution, regions):
-        print("""{0} [id: {1}] (slug: {2}, distribution: {3}, """
-              """regions: [{4}])""".format(name, iid, slug,
-                                           distribution, ", ".join(regions)))
+        self.output("""{0} [id: {1}] (slug: {2}, distribution: {3}, """
+                    """regions: [{4}])""".format(name, iid, slug, distribution,
+                                                 ", ".join(regions)))
 
     def do_images(self, *args):
-        for image in self.ctx.images:
+        for image in self.loaded_inventory().items('images'):
             self.print_image(image.id, image.name, image.slug,
                              image.distribution, image.region_names)
 
     def do_image(self, image):
-        if image.isdigit():
-            image = self.ctx.image_from_id(image)
+        found = self.loaded_inventory().image(image)
+        if found is not None:
+            image = found
         else:
-            image = self.ctx.image_from_name(image)
+            image = self.ctx.image_from_id(self.image_id(image))
             if image is None:
-                image = self.ctx.image_from_slug(image)
+                raise NotFound("No such image")
         self.print_image(image.id, image.name, image.slug,
                          image.distribution, image.region_names)
 
+    @confirm
     def do_image_delete(self, image):
-        accept = raw_input("Are you sure you want to do this? [y/N]: ")
-        if accept.lower() != 'y':
-            return
-        if image.isdigit():
-            image = self.ctx.image_from_name(image)
-        else:
-            if image is None:
-                image = self.ctx.image_from_slug(image)
-            image = image.id
-        self.ctx.image_delete(image)
+        image = self.image_id(image, verify=True)
+        self.output(self.ctx.image_delete(image))
 
-    def do_image_rename(self, image, name):
-        if image.isdigit():
-            image = self.ctx.image_from_name(image)
-        else:
-            if image is None:
-                image = self.ctx.image_from_slug(image)
-            image = image.id
-        self.ctx.image_rename(image, name)
+    def do_image_rename(self, args):
+        """image_rename <image> <name>"""
+        image, name = args.split()
+        image = self.image_id(image)
+        self.output(self.ctx.image_rename(image, name))
 
-    def do_image_transfer(self, image, region):
-        if image.isdigit():
-            image = self.ctx.image_from_name(image)
-        else:
-            if image is None:
-                image = self.ctx.self.image_from_slug(image)
-            image = image.id
-        self.ctx.image_transfer(image, region)
+    def do_image_transfer(self, args):
+        """image_transfer <image> <region>"""
+        image, region = args.split()
+        image = self.image_id(image)
+        self.output(self.ctx.image_transfer(image, region))
 
     def print_size(self, name, cpus, disk_size, price, regions):
-        print("""{0} (cpu(s): {1}, memory: {0}, disk: {2}) """
-              """(price: {3}/hour {4}/month) regions: [{5}]"""
-              """""".format(name, cpus, disk_size, price.hourly,
-                            price.monthly, ", ".join(regions)))
+        self.output("""{0} (cpu(s): {1}, memory: {0}, disk: {2}) """
+                    """(price: {3}/hour {4}/month) regions: [{5}]"""
+                    """""".format(name, cpus, disk_size, price.hourly,
+                                  price.monthly, ", ".join(regions)))
 
     def do_sizes(self, detailed=False):
         if not detailed:
             for size in Size.mappings():
-                print(size)
+                self.output(size)
             return
         for size in self.ctx.sizes():
             self.print_size(size.slug.upper(), size.cpus, size.disk_size,
@@ -219,7 +379,6 @@ class Batfish(Cmd):
 def shell():
     try:
         prompt = Batfish()
-        prompt.prompt = 'batfish > '
         prompt.cmdloop()
     except KeyboardInterrupt:
         raise SystemExit
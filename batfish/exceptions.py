@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+class BatfishError(Exception):
+    """Base class of all Batfish errors."""
+
+
+class AmbiguousName(BatfishError, LookupError):
+    """
+    Raised when a name or slug prefix matches more than one resource.
+
+    :param query: The name or slug that was looked up.
+    :param candidates: The names or slugs of every matching resource.
+    """
+
+    def __init__(self, query, candidates):
+        self.query = query
+        self.candidates = candidates
+        super(AmbiguousName, self).__init__(
+            "{0!r} is ambiguous, it matches: {1}".format(
+                query, ", ".join(candidates)))
+
+
+class NotFound(BatfishError, LookupError):
+    """
+    Raised when no resource matches a name, slug or ID.
+    """
+
+
+class ActionTimeout(BatfishError):
+    """
+    Raised when actions do not finish before a timeout.
+
+    :param pending: The IDs of the actions still in progress.
+    :param done: A dictionary of action ID to `batfish.models.Action` of the
+                 actions that did finish.
+    """
+
+    def __init__(self, pending, done):
+        self.pending = pending
+        self.done = done
+        super(ActionTimeout, self).__init__(
+            "Timed out waiting for actions: {0}".format(
+                ", ".join(str(a) for a in sorted(pending))))
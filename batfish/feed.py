@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from .models import Action
+
+
+class ActionFeed(object):
+    """
+    An incremental feed of the actions of an account or of one droplet.
+
+    Each poll pages through the listing newest first and stops at the
+    first action already seen, so a quiet account costs a single request.
+    `cursor`, the highest action ID seen, only moves once a poll has been
+    read to the end and can be persisted to resume the feed later.
+
+        >>> feed = cli.action_feed()
+        >>> for action in feed.poll():
+        ...     print(action)
+        <Action power_cycle>
+        >>> feed.cursor
+        36805022
+
+    Actions are reported once, when first listed, whatever their status.
+
+    :param client: An instance of `batfish.client.Client`.
+    :param url: URI part of the action listing.
+    :param cursor: The highest action ID already seen, `None` reports the
+                   whole history on the first poll.
+    :param per_page: Number of actions requested per page.
+    """
+
+    def __init__(self, client, url='actions', cursor=None, per_page=None):
+        self.client = client
+        self.url = url
+        self.cursor = cursor
+        self.per_page = per_page
+
+    def __iter__(self):
+        return self.poll()
+
+    def poll(self):
+        """
+        Iterate over the actions newer than `cursor`, newest first.
+
+        :rtype: A generator of `batfish.models.Action` instances.
+        """
+        highest = self.cursor
+        items = self.client.paginate(self.url, 'actions',
+                                     per_page=self.per_page) or []
+        model = self.client._model(Action)
+        for item in items:
+            if self.cursor is not None and item['id'] <= self.cursor:
+                break
+            if highest is None or item['id'] > highest:
+                highest = item['id']
+            yield model(item)
+        self.cursor = highest
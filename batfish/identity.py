@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+import weakref
+
+
+class IdentityMap(object):
+    """
+    Keeps at most one model instance per resource type and key, so the
+    same droplet fetched twice is the same object, refreshed in place
+    with the newer data.
+
+    Instances are held weakly and are dropped once nothing else refers
+    to them.
+
+        >>> identity_map = IdentityMap()
+        >>> d1 = identity_map.get(Droplet, {'id': 1, 'status': 'new'})
+        >>> d2 = identity_map.get(Droplet, {'id': 1, 'status': 'active'})
+        >>> d1 is d2, d1.status
+        (True, 'active')
+    """
+
+    def __init__(self):
+        self._objects = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(self, model, data, keep_raw=False):
+        """
+        Get the instance of `model` for `data`, creating it or refreshing
+        the existing one.
+
+        :param model: A `batfish.models.base.Model` subclass.
+        :param data: A dictionary of data from the API.
+        :param keep_raw: Keep `data`, available as `raw`.
+        :rtype: An instance of `model`.
+        """
+        key = data.get(model.key_field)
+        if key is None:
+            return model(data, keep_raw)
+        with self._lock:
+            obj = self._objects.get((model, key))
+            if obj is None:
+                obj = model(data, keep_raw)
+                self._objects[(model, key)] = obj
+            else:
+                obj.refresh(data, keep_raw)
+        return obj
+
+    def model(self, model):
+        """
+        A callable creating instances of `model` through the map, for use
+        as the `model` argument of `batfish.client.Client.paginate`.
+
+        :param model: A `batfish.models.base.Model` subclass.
+        :rtype: A callable taking a dictionary of data from the API.
+        """
+        return lambda data: self.get(model, data)
+
+    def clear(self):
+        """Forget every instance."""
+        with self._lock:
+            self._objects.clear()
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+import time
+
+from .models import Droplet, Image
+from .resolver import Index
+
+
+class Inventory(object):
+    """
+    An in-memory copy of the droplets and images of an account, that a
+    background thread keeps up to date, for answering listings, lookups
+    and completions without waiting on the API.
+
+    Refreshes go through the client, so unchanged listings only cost a
+    conditional request and the images catalog can come from the disk
+    cache.
+
+        >>> inventory = Inventory(cli, interval=30)
+        >>> inventory.start()
+        >>> inventory.droplet('web')
+        <Droplet web-1>
+        >>> inventory.age
+        12.5
+
+    :param client: An instance of `batfish.client.Client`.
+    :param interval: Seconds between background refreshes.
+    :param completion: A `batfish.completion.CompletionIndex` whose
+                       snapshot is rewritten after each refresh.
+    """
+
+    collections = {'droplets': (Droplet, ('name', )),
+                   'images': (Image, ('name', 'slug'))}
+    """Collection name to model and the fields it can be looked up by."""
+
+    def __init__(self, client, interval=60, completion=None):
+        self.client = client
+        self.interval = interval
+        self.completion = completion
+        self.updated = None
+        self.error = None
+        self._state = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._attempted = threading.Event()
+        self._thread = None
+
+    def _load(self, collection):
+        if collection == 'droplets':
+            return list(self.client.paginate('droplets', 'droplets') or [])
+        return self.client.catalog(collection) or []
+
+    def refresh(self):
+        """
+        Download the droplets and images now.
+        """
+        with self._lock:
+            state = {}
+            for collection, (_, fields) in self.collections.items():
+                items = self._load(collection)
+                state[collection] = (
+                    items, dict((i['id'], i) for i in items),
+                    dict((f, Index(items, f)) for f in fields))
+            self._state = state
+            self.updated = time.time()
+            self.error = None
+        if self.completion is not None:
+            self.completion.save(self.completion.snapshot(
+                regions=self.client.catalog('regions') or [],
+                **dict((c, s[0]) for c, s in state.items())))
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.error = e
+            self._attempted.set()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start refreshing in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name="batfish-inventory")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def wait(self, timeout=None):
+        """
+        Wait for the background thread's first refresh attempt.
+
+        :param timeout: Maximum number of seconds to wait.
+        :rtype: `True` if the inventory is loaded.
+        """
+        self._attempted.wait(timeout)
+        return self.loaded
+
+    @property
+    def loaded(self):
+        """`True` once the inventory has been downloaded."""
+        return self.updated is not None
+
+    @property
+    def age(self):
+        """
+        Seconds since the last successful refresh.
+
+        :rtype: `float` or `None` if never refreshed.
+        """
+        if self.updated is None:
+            return None
+        return time.time() - self.updated
+
+    def _model(self, collection):
+        return self.client._model(self.collections[collection][0])
+
+    def items(self, collection):
+        """
+        Every resource of a collection, as of the last refresh.
+
+        :param collection: `droplets` or `images`.
+        :rtype: `list` of models.
+        """
+        items = self._state.get(collection, ([], ))[0]
+        model = self._model(collection)
+        return [model(i) for i in items]
+
+    def find(self, collection, value):
+        """
+        Look a resource up by ID, then by each of the collection's fields,
+        an exact match or a unique prefix.
+
+        :param collection: `droplets` or `images`.
+        :param value: An ID, name or slug.
+        :rtype: A model or `None`.
+        """
+        if collection not in self._state:
+            return None
+        _, by_id, indexes = self._state[collection]
+        item = None
+        if str(value).isdigit():
+            item = by_id.get(int(value))
+        for field in self.collections[collection][1]:
+            if item is not None:
+                break
+            item = indexes[field].resolve(str(value)).item
+        return None if item is None else self._model(collection)(item)
+
+    def droplet(self, value):
+        """
+        Look a droplet up by ID or name.
+
+        :rtype: An instance of `batfish.models.Droplet` or `None`.
+        """
+        return self.find('droplets', value)
+
+    def image(self, value):
+        """
+        Look an image up by ID, name or slug.
+
+        :rtype: An instance of `batfish.models.Image` or `None`.
+        """
+        return self.find('images', value)
+
+    def names(self, collection, prefix=''):
+        """
+        The names, and slugs, of a collection starting with `prefix`,
+        ignoring case.
+
+        :param collection: `droplets` or `images`.
+        :param prefix: The start of the name.
+        :rtype: Sorted `list` of strings.
+        """
+        if collection not in self._state:
+            return []
+        names = set()
+        for field, index in self._state[collection][2].items():
+            names.update(i[field] for i in index.prefix(prefix))
+        return sorted(names)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
+import time
+
+from .client import action_done, action_ids
+
+
+class Job(object):
+    """
+    A command running in the background.
+
+    `status` is one of `queued`, `running`, `waiting` (for its actions to
+    complete), `done`, `failed` or `cancelled`.
+    """
+
+    def __init__(self, job_id, command):
+        self.id = job_id
+        self.command = command
+        self.status = 'queued'
+        self.outputs = []
+        self.actions = {}
+        self.error = None
+        self.started = time.time()
+        self.finished = None
+        self.future = None
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    def __repr__(self):
+        return "<Job {0} {1}>".format(self.id, self.status)
+
+    @property
+    def done(self):
+        """`True` once the job has finished, whatever the outcome."""
+        return self.status in ('done', 'failed', 'cancelled')
+
+
+class JobManager(object):
+    """
+    Runs commands in a pool of worker threads, then follows the actions
+    they start from a single poller thread, which checks the pending
+    actions of every job together each round, with a growing interval.
+
+        >>> jobs = JobManager(cli)
+        >>> job = jobs.submit("snapshot web-1",
+        ...                   lambda: [cli.droplet_snapshot(1234, "web-1")])
+        >>> jobs.wait(job.id).status
+        'done'
+
+    :param client: An instance of `batfish.client.Client`.
+    :param max_workers: The maximum number of commands running at once.
+    :param interval: Seconds between the first action polls.
+    :param max_interval: The longest wait between action polls.
+    """
+
+    def __init__(self, client, max_workers=4, interval=1, max_interval=15):
+        self.client = client
+        self.interval = interval
+        self.max_interval = max_interval
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._finished = deque()
+        self._waiting = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._poller = None
+
+    @property
+    def jobs(self):
+        """Every job, oldest first."""
+        return [self._jobs[k] for k in sorted(self._jobs)]
+
+    def get(self, job_id):
+        """
+        :rtype: An instance of `batfish.jobs.Job` or `None`.
+        """
+        return self._jobs.get(job_id)
+
+    def submit(self, command, func):
+        """
+        Run `func` in the background. `func` returns the values of the API
+        calls it made, the actions they started are waited for.
+
+        :param command: A description of the job.
+        :param func: A callable returning a `list` of API responses.
+        :rtype: An instance of `batfish.jobs.Job`.
+        """
+        job = Job(next(self._ids), command)
+        self._jobs[job.id] = job
+        job.future = self._pool.submit(self._run, job, func)
+        return job
+
+    def _run(self, job, func):
+        if job._cancel.is_set():
+            return self._finish(job, 'cancelled')
+        job.status = 'running'
+        try:
+            job.outputs = func() or []
+        except Exception as e:
+            job.error = e
+            return self._finish(job, 'failed')
+        if job._cancel.is_set():
+            return self._finish(job, 'cancelled')
+        pending = set()
+        for output in job.outputs:
+            pending.update(action_ids(output))
+        if not pending:
+            return self._finish(job, 'done')
+        job.status = 'waiting'
+        self._follow(job, pending)
+
+    def _follow(self, job, pending):
+        with self._lock:
+            self._waiting[job.id] = (job, pending)
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll,
+                                                name="batfish-jobs")
+                self._poller.daemon = True
+                self._poller.start()
+        self._wake.set()
+
+    def _poll(self):
+        interval = self.interval
+        while not self._stop.is_set():
+            with self._lock:
+                for job, _ in list(self._waiting.values()):
+                    if job._cancel.is_set():
+                        del self._waiting[job.id]
+                        self._finish(job, 'cancelled')
+                pending = set()
+                for _, ids in self._waiting.values():
+                    pending.update(ids)
+            if not pending:
+                self._wake.wait()
+                self._wake.clear()
+                interval = self.interval
+                continue
+            try:
+                found = self.client._poll_actions(pending)
+            except Exception:
+                # keep waiting, the next round tries again
+                found = []
+            done = dict((a.id, a) for a in found
+                        if a.status in action_done)
+            with self._lock:
+                for job, ids in list(self._waiting.values()):
+                    for action_id in ids & set(done):
+                        job.actions[action_id] = done[action_id]
+                        ids.discard(action_id)
+                    if not ids:
+                        del self._waiting[job.id]
+                        errored = any(a.status != 'completed'
+                                      for a in job.actions.values())
+                        self._finish(job, 'failed' if errored else 'done')
+            if self._wake.wait(interval):
+                # a new job is waiting, check its actions soon
+                self._wake.clear()
+                interval = self.interval
+            else:
+                interval = min(interval * 1.5, self.max_interval)
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished = time.time()
+        self._finished.append(job)
+        job._done.set()
+
+    def finished(self):
+        """
+        The jobs that finished since the last call, for notifications.
+
+        :rtype: `list` of `batfish.jobs.Job`.
+        """
+        jobs = []
+        while self._finished:
+            jobs.append(self._finished.popleft())
+        return jobs
+
+    def wait(self, job_id, timeout=None):
+        """
+        Wait for a job to finish.
+
+        :param job_id: The job ID.
+        :param timeout: Maximum number of seconds to wait.
+        :rtype: The `batfish.jobs.Job`, or `None` if there is no such job.
+        """
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job._done.wait(timeout)
+        return job
+
+    def cancel(self, job_id):
+        """
+        Cancel a job. A queued job never runs, a running job stops
+        waiting for its actions, the actions themselves carry on.
+
+        :param job_id: The job ID.
+        :rtype: `True` if the job was still running.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return False
+        job._cancel.set()
+        if job.future.cancel():
+            self._finish(job, 'cancelled')
+        self._wake.set()
+        return True
+
+    def shutdown(self):
+        """Cancel every job and stop the workers and the poller."""
+        for job in self.jobs:
+            job._cancel.set()
+        self._stop.set()
+        self._wake.set()
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import codecs
+import json
+import re
+import sys
+
+try:
+    import orjson as _backend
+except ImportError:
+    try:
+        import ujson as _backend
+    except ImportError:
+        try:
+            import simplejson as _backend
+        except ImportError:
+            _backend = json
+
+
+backend = _backend.__name__
+"""Name of the module used to decode JSON documents."""
+
+# json.loads only accepts bytes from Python 3.6
+_decode_bytes = _backend is json and (3, ) <= sys.version_info < (3, 6)
+_raw_decode = json.JSONDecoder().raw_decode
+_whitespace = re.compile(r'[ \t\n\r]*')
+_delimiters = ' \t\n\r,:]}'
+
+
+def loads(data):
+    """
+    Decode a JSON document straight from `bytes` (or a `str`) with the
+    fastest installed backend, `orjson`, `ujson` or `simplejson`, falling
+    back to the standard library.
+
+        >>> loads(b'{"droplets": []}')
+        {'droplets': []}
+
+    :param data: The JSON document.
+    :rtype: The decoded document.
+    """
+    if _decode_bytes and isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return _backend.loads(data)
+
+
+class _Reader(object):
+    """A buffered cursor over a stream of UTF-8 encoded chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Append the next chunk to the buffer, `False` at end of stream."""
+        if self.eof:
+            return False
+        text = ''
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk)
+            if text:
+                break
+        else:
+            text = self.decoder.decode(b'', final=True)
+            self.eof = True
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return not self.eof or bool(text)
+
+    def peek(self):
+        """The next non-whitespace character, `''` at end of stream."""
+        while True:
+            self.pos = _whitespace.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError("Expecting {0!r}, found {1!r}".format(
+                char, found or "end of document"))
+        self.pos += 1
+
+    def skip(self, char):
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self):
+        """Decode the next complete value from the buffer."""
+        self.peek()
+        while True:
+            try:
+                value, end = _raw_decode(self.buf, self.pos)
+            except ValueError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next
+            # chunk.
+            if end == len(self.buf) and self.fill():
+                continue
+            if end < len(self.buf) and self.buf[end] not in _delimiters:
+                raise ValueError("Unexpected {0!r} at position {1}".format(
+                    self.buf[end], end))
+            self.pos = end
+            return value
+
+
+def iter_items(chunks, key, rest=None):
+    """
+    Iterate over the `key` array of a JSON object read from `chunks`,
+    decoding one item at a time so memory use follows the largest item
+    rather than the whole document.
+
+    The other members of the object are decoded whole and, when `rest`
+    is a dictionary, stored in it once the object has been read.
+
+        >>> rest = {}
+        >>> for droplet in iter_items(r.iter_content(65536), 'droplets',
+        ...                           rest):
+        ...     print(droplet['name'])
+        >>> rest['links']
+        {'pages': {'next': "https://api.digitalocean.com/v2/..."}}
+
+    :param chunks: An iterable of `bytes`.
+    :param key: The member holding the array.
+    :param rest: Optional dictionary receiving the other members.
+    :rtype: A generator of decoded items.
+    """
+    reader = _Reader(chunks)
+    reader.expect('{')
+    if reader.skip('}'):
+        return
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name == key and reader.skip('['):
+            if not reader.skip(']'):
+                while True:
+                    yield reader.value()
+                    if not reader.skip(','):
+                        break
+                reader.expect(']')
+        else:
+            value = reader.value()
+            if rest is not None:
+                rest[name] = value
+        if not reader.skip(','):
+            break
+    reader.expect('}')
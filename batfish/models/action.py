@@ -25,22 +25,31 @@
 
 from datetime import datetime
 
+from .base import Model, parse_datetime
 from .region import Region
 
 
-class Action(object):
+class Action(Model):
     """
     A Digital Ocean action.
 
     :param action_data: A dictionary of action data from the API.
+    :param keep_raw: Keep `action_data`, available as `raw`.
     """
-    _data = None
 
-    def __init__(self, action_data):
-        self._data = action_data
+    __slots__ = ('_id', '_status', '_type', '_started', '_completed',
+                 '_resource_id', '_resource_type', '_region_slug')
 
-    def __str__(self):
-        return self.__repr__()
+    def _decode(self, data):
+        self._id = data.get('id')
+        self._status = data.get('status')
+        self._type = data.get('type')
+        # started and completed are decoded on first access
+        self._started = data.get('started_at')
+        self._completed = data.get('completed_at')
+        self._resource_id = data.get('resource_id')
+        self._resource_type = data.get('resource_type')
+        self._region_slug = (data.get('region') or {}).get('slug')
 
     def __repr__(self):
         return "<Action {0}>".format(self.type)
@@ -57,7 +66,7 @@ class Action(object):
 
         :rtype: `integer`
         """
-        return self._data['id']
+        return self._id
 
     @property
     def status(self):
@@ -71,7 +80,7 @@ class Action(object):
 
         :rtype: `string`.
         """
-        return self._data['status']
+        return self._status
 
     @property
     def type(self):
@@ -85,7 +94,7 @@ class Action(object):
 
         :rtype: `string`.
         """
-        return self._data['type']
+        return self._type
 
     @property
     def started(self):
@@ -99,8 +108,10 @@ class Action(object):
 
         :rtype: `datetime.datetime` object.
         """
-        return datetime.strptime(self._data['started_at'],
-                                 '%Y-%m-%dT%H:%M:%SZ')
+        started = self._started
+        if started is not None and not isinstance(started, datetime):
+            started = self._started = parse_datetime(started)
+        return started
 
     @property
     def completed(self):
@@ -114,10 +125,10 @@ class Action(object):
 
         :rtype: `datetime.datetime` object, `None` if not completed.
         """
-        if self._data['completed_at'] is None:
-            return None
-        return datetime.strptime(self._data['completed_at'],
-                                 '%Y-%m-%dT%H:%M:%SZ')
+        completed = self._completed
+        if completed is not None and not isinstance(completed, datetime):
+            completed = self._completed = parse_datetime(completed)
+        return completed
 
     @property
     def resource_id(self):
@@ -131,7 +142,7 @@ class Action(object):
 
         :rtype: `integer`.
         """
-        return self._data['resource_id']
+        return self._resource_id
 
     @property
     def resource_type(self):
@@ -145,7 +156,7 @@ class Action(object):
 
         :rtype: `string`.
         """
-        return self._data['resource_type']
+        return self._resource_type
 
     def region(self, client):
         """
@@ -156,9 +167,11 @@ class Action(object):
             >>> droplet.actions[0].region
             <Region Amsterdam 2>
 
+        :param client: An instance of `batfish.client.Client` or
+                       `batfish.scope.Scope`.
         :rtype: An instance `of batfish.models.region.Region`.
         """
-        return client.region_from_slug(self._data['region']['slug'])
+        return client.region_from_slug(self._region_slug)
 
     def region_name(self, client):
         """
@@ -171,4 +184,4 @@ class Action(object):
 
         :rtype: `string`.
         """
-        return Region.name_from_slug(self._data['region']['slug'])
+        return Region.name_from_slug(self._region_slug)
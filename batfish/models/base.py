@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from datetime import datetime
+
+
+def parse_datetime(value):
+    """
+    Parse an API timestamp.
+
+        >>> parse_datetime('2014-01-07T23:19:49Z')
+        datetime.datetime(2014, 1, 7, 23, 19, 49)
+
+    :param value: A timestamp string or `None`.
+    :rtype: `datetime.datetime` object or `None`.
+    """
+    if value is None:
+        return None
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ')
+
+
+class Model(object):
+    """
+    Base class of the API models.
+
+    Fields are decoded from the API dictionary once, when the model is
+    created, and stored in slots. The dictionary itself is only kept when
+    `keep_raw` is `True`.
+
+    Models compare equal, and hash, by type and `key_field`, the field
+    identifying the resource in the API.
+
+    :param data: A dictionary of data from the API.
+    :param keep_raw: Keep a reference to `data`, available as `raw`.
+    """
+
+    __slots__ = ('_raw', '__weakref__')
+
+    key_field = 'id'
+    """The field identifying a resource of this type."""
+
+    def __init__(self, data, keep_raw=False):
+        self.refresh(data, keep_raw)
+
+    def __str__(self):
+        return self.__repr__()
+
+    @property
+    def key(self):
+        """
+        The value identifying the resource, its `id` or `slug`.
+
+        :rtype: `integer`, `string` or `None`.
+        """
+        return getattr(self, self.key_field)
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        if self.key is None:
+            return self is other
+        return self.key == other.key
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __hash__(self):
+        if self.key is None:
+            return object.__hash__(self)
+        return hash((type(self).__name__, self.key))
+
+    def refresh(self, data, keep_raw=False):
+        """
+        Update the model in place from a newer API dictionary.
+
+        :param data: A dictionary of data from the API.
+        :param keep_raw: Keep a reference to `data`, available as `raw`.
+        """
+        self._raw = data if keep_raw else None
+        self._decode(data)
+
+    def _decode(self, data):
+        raise NotImplementedError
+
+    @property
+    def raw(self):
+        """
+        The API dictionary the model was created from, `None` unless the
+        model was created with `keep_raw=True`.
+
+        :rtype: `dictionary` or `None`.
+        """
+        return self._raw
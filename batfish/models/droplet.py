@@ -27,22 +27,53 @@ from collections import namedtuple
 from datetime import datetime
 
 from .action import Action
+from .base import Model, parse_datetime
 from .region import Region
 
 
-class Droplet(object):
+DropletSize = namedtuple('Size', 'name memory disk hourly monthly')
+IPv4 = namedtuple('IPv4', 'ip type gateway netmask')
+IPv6 = namedtuple('IPv6', 'ip type gateway')
+Kernel = namedtuple('Kernel', 'id name version')
+
+
+class Droplet(Model):
     """
     A Digital Ocean droplet.
 
     :param droplet_data: A dictionary of droplet data from the API.
+    :param keep_raw: Keep `droplet_data`, available as `raw`.
     """
-    _data = None
-
-    def __init__(self, droplet_data):
-        self._data = droplet_data
 
-    def __str__(self):
-        return self.__repr__()
+    __slots__ = ('_id', '_name', '_memory', '_vcpus', '_disk', '_region_slug',
+                 '_image_id', '_size', '_locked', '_created', '_status',
+                 '_networks', '_kernel', '_backups', '_snapshots', '_features')
+
+    def _decode(self, data):
+        self._id = data.get('id')
+        self._name = data.get('name')
+        self._memory = data.get('memory')
+        self._vcpus = data.get('vcpus')
+        self._disk = data.get('disk')
+        self._region_slug = (data.get('region') or {}).get('slug')
+        self._image_id = (data.get('image') or {}).get('id')
+        size = data.get('size')
+        self._size = None if size is None else DropletSize(
+            name=size['slug'].upper(), memory=size['slug'].upper(),
+            disk="{0}GB".format(self.disk_size),
+            hourly=size['price_hourly'], monthly=size['price_monthly'])
+        self._locked = data.get('locked')
+        # created and networks are decoded on first access
+        self._created = data.get('created_at')
+        self._status = data.get('status')
+        self._networks = data.get('networks')
+        kernel = data.get('kernel')
+        self._kernel = None if kernel is None else Kernel(
+            id=int(kernel['id']), name=kernel['name'],
+            version=kernel['version'])
+        self._backups = data.get('backup_ids')
+        self._snapshots = data.get('snapshot_ids')
+        self._features = data.get('features')
 
     def __repr__(self):
         return "<Droplet {0}>".format(self.name)
@@ -59,7 +90,7 @@ class Droplet(object):
 
         :rtype: `integer`.
         """
-        return self._data['id']
+        return self._id
 
     @property
     def name(self):
@@ -73,7 +104,7 @@ class Droplet(object):
 
         :rtype: `string`.
         """
-        return self._data['name']
+        return self._name
 
     @property
     def memory(self):
@@ -87,7 +118,7 @@ class Droplet(object):
 
         :rtype: `string`.
         """
-        return self._data['memory']
+        return self._memory
 
     @property
     def cpus(self):
@@ -101,7 +132,7 @@ class Droplet(object):
 
         :rtype: `integer`.
         """
-        return self._data['vcpus']
+        return self._vcpus
 
     @property
     def disk_size(self):
@@ -115,7 +146,7 @@ class Droplet(object):
 
         :rtype: `string`.
         """
-        return "{0}GB".format(self._data['disk'])
+        return "{0}GB".format(self._disk)
 
     @property
     def region_name(self):
@@ -131,27 +162,29 @@ class Droplet(object):
 
         :rtype: `string`.
         """
-        return Region.name_from_slug(self._data['region']['slug'])
+        return Region.name_from_slug(self._region_slug)
 
     def region(self, client):
         """
         Get an instance of `batfish.models.Region` from the droplet's region
         information.
 
-        :param client: An instance of `batfish.client.Client`.
+        :param client: An instance of `batfish.client.Client` or
+                       `batfish.scope.Scope`.
         :rtype: An instance of `batfish.models.Region`.
         """
-        return client.region_from_slug(self._data['region']['slug'])
+        return client.region_from_slug(self._region_slug)
 
     def image(self, client):
         """
         Get an instance of `batfish.models.Image` from the droplet's image
         information.
 
-        :param client: An instance of `batfish.client.Client`.
+        :param client: An instance of `batfish.client.Client` or
+                       `batfish.scope.Scope`.
         :rtype: An instance of `batfish.models.Image`.
         """
-        return client.image_from_id(self._data['image']['id'])
+        return client.image_from_id(self._image_id)
 
     @property
     def size(self):
@@ -166,12 +199,7 @@ class Droplet(object):
 
         :rtype: `collections.NamedTuple`.
         """
-        size = namedtuple('Size', 'name memory disk hourly monthly')
-        return size(name=self._data['size']['slug'].upper(),
-                    memory=self._data['size']['slug'].upper(),
-                    disk="{0}GB".format(self.disk_size),
-                    hourly=self._data['size']['price_hourly'],
-                    monthly=self._data['size']['price_monthly'])
+        return self._size
 
     @property
     def locked(self):
@@ -185,7 +213,7 @@ class Droplet(object):
 
         :rtype: `boolean`.
         """
-        return self._data['locked']
+        return self._locked
 
     @property
     def created(self):
@@ -199,8 +227,10 @@ class Droplet(object):
 
         :rtype: `datetime.datime` object.
         """
-        return datetime.strptime(self._data['created_at'],
-                                 '%Y-%m-%dT%H:%M:%SZ')
+        created = self._created
+        if created is not None and not isinstance(created, datetime):
+            created = self._created = parse_datetime(created)
+        return created
 
     @property
     def status(self):
@@ -214,7 +244,7 @@ class Droplet(object):
 
         :rtype: `string`.
         """
-        return self._data['status']
+        return self._status
 
     @property
     def networks(self):
@@ -232,15 +262,15 @@ class Droplet(object):
 
         :rtype: `dictionary` of `collection.NamedTuples`s.
         """
-        ipv4 = namedtuple('IPv4', 'ip type gateway netmask')
-        ipv6 = namedtuple('IPv6', 'ip type gateway')
-        networks = {}
-        networks['ipv4'] = [ipv4(ip=n['ip_address'], type=n['type'],
-                                 gateway=n['gateway'], netmask=n['netmask'])
-                            for n in self._data['networks']['v4']]
-        networks['ipv6'] = [ipv6(ip=n['ip_address'], type=n['type'],
-                                 gateway=n['gateway'])
-                            for n in self._data['networks']['v6']]
+        networks = self._networks
+        if networks is not None and 'v4' in networks:
+            networks = self._networks = {
+                'ipv4': [IPv4(ip=n['ip_address'], type=n['type'],
+                              gateway=n['gateway'], netmask=n['netmask'])
+                         for n in networks['v4']],
+                'ipv6': [IPv6(ip=n['ip_address'], type=n['type'],
+                              gateway=n['gateway'])
+                         for n in networks['v6']]}
         return networks
 
     @property
@@ -257,10 +287,7 @@ class Droplet(object):
 
         :rtype: `collections.NamedTuple`.
         """
-        kernel = namedtuple('Kernel', 'id name version')
-        return kernel(id=int(self._data['kernel']['id']),
-                      name=self._data['kernel']['name'],
-                      version=self._data['kernel']['version'])
+        return self._kernel
 
     @property
     def backups(self):
@@ -274,7 +301,7 @@ class Droplet(object):
 
         :rtype: `list` of backup IDs.
         """
-        return self._data['backup_ids']
+        return self._backups
 
     @property
     def snapshots(self):
@@ -288,7 +315,7 @@ class Droplet(object):
 
         :rtype: `list` of snapshot IDs.
         """
-        return self._data['snapshot_ids']
+        return self._snapshots
 
     def actions(self, client):
         """
@@ -302,10 +329,51 @@ class Droplet(object):
         :param client: An instance of `batfish.client.Client`.
         :rtype: A list of `batfish.models.Action` instances.
         """
-        j = client.get("droplets/{0}/actions".format(self.id))
-        if 'actions' not in j:
+        actions = client.paginate("droplets/{0}/actions".format(self.id),
+                                  'actions', Action)
+        if actions is None:
             return None
-        return [Action(a) for a in j['actions']]
+        return list(actions)
+
+    def iter_actions(self, client, per_page=None):
+        """
+        Iterate over the actions performed on the droplet, one page at a
+        time.
+
+            >>> cli = batfish.Client()
+            >>> droplet = cli.droplet_from_id(1234)
+            >>> for action in droplet.iter_actions(cli):
+            ...     print(action)
+            <Action power_cycle>
+            <Action create>
+
+        :param client: An instance of `batfish.client.Client`.
+        :param per_page: Number of actions requested per page.
+        :rtype: A generator of `batfish.models.Action` instances.
+        """
+        return client.paginate("droplets/{0}/actions".format(self.id),
+                               'actions', Action, per_page) or iter([])
+
+    def action_feed(self, client, cursor=None, per_page=None):
+        """
+        Get an incremental feed of the actions performed on the droplet.
+
+            >>> cli = batfish.Client()
+            >>> droplet = cli.droplet_from_id(1234)
+            >>> feed = droplet.action_feed(cli)
+            >>> list(feed.poll())
+            [<Action power_cycle>, <Action create>]
+            >>> list(feed.poll())
+            []
+
+        :param client: An instance of `batfish.client.Client`.
+        :param cursor: The highest action ID already seen.
+        :param per_page: Number of actions requested per page.
+        :rtype: An instance of `batfish.feed.ActionFeed`.
+        """
+        from ..feed import ActionFeed
+        return ActionFeed(client, "droplets/{0}/actions".format(self.id),
+                          cursor, per_page)
 
     @property
     def features(self):
@@ -319,4 +387,4 @@ class Droplet(object):
 
         :rtype: `list`.
         """
-        return self._data['features']
+        return self._features
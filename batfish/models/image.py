@@ -25,17 +25,30 @@
 
 from datetime import datetime
 
+from .base import Model, parse_datetime
 from .region import Region
 
 
-class Image(object):
-    _data = None
+class Image(Model):
+    """
+    A Digital Ocean image.
 
-    def __init__(self, image_data):
-        self._data = image_data
+    :param image_data: A dictionary of image data from the API.
+    :param keep_raw: Keep `image_data`, available as `raw`.
+    """
 
-    def __str__(self):
-        return self.__repr__()
+    __slots__ = ('_id', '_name', '_distribution', '_slug', '_public',
+                 '_regions', '_created')
+
+    def _decode(self, data):
+        self._id = data.get('id')
+        self._name = data.get('name')
+        self._distribution = data.get('distribution')
+        self._slug = data.get('slug')
+        self._public = data.get('public')
+        self._regions = data.get('regions') or []
+        # created is decoded on first access
+        self._created = data.get('created_at')
 
     def __repr__(self):
         return "<Image {}>".format(self.name)
@@ -52,7 +65,7 @@ class Image(object):
 
         :rtype: `integer`.
         """
-        return self._data['id']
+        return self._id
 
     @property
     def name(self):
@@ -66,7 +79,7 @@ class Image(object):
 
         :rtype: `string`.
         """
-        return self._data['name']
+        return self._name
 
     @property
     def distribution(self):
@@ -80,7 +93,7 @@ class Image(object):
 
         :rtype: `string`.
         """
-        return self._data['distribution']
+        return self._distribution
 
     @property
     def slug(self):
@@ -94,7 +107,7 @@ class Image(object):
 
         :rtype: `string` or `None`.
         """
-        return self._data['slug']
+        return self._slug
 
     @property
     def public(self):
@@ -108,7 +121,7 @@ class Image(object):
 
         :rtype: `boolean`.
         """
-        return self._data['public']
+        return self._public
 
     @property
     def region_names(self):
@@ -122,7 +135,7 @@ class Image(object):
 
         :rtype: `list`.
         """
-        return [Region.name_from_slug(r) for r in self._data['regions']]
+        return [Region.name_from_slug(r) for r in self._regions]
 
     def regions(self, client):
         """
@@ -133,9 +146,11 @@ class Image(object):
             >>> image.regions
             [<Region Amsterdam 1>, <Region Amsterdam 2>, <Region Amsterdam 3>]
 
+        :param client: An instance of `batfish.client.Client` or
+                       `batfish.scope.Scope`.
         :rtype: `list` of `batfish.models.region.Region` instances.
         """
-        return [client.region_from_slug(r) for r in self._data['regions']]
+        return client.regions_from_slugs(self._regions)
 
     @property
     def created(self):
@@ -149,5 +164,7 @@ class Image(object):
 
         :rtype: `datetime.datime` object.
         """
-        return datetime.strptime(self._data['created_at'],
-                                 '%Y-%m-%dT%H:%M:%SZ')
+        created = self._created
+        if created is not None and not isinstance(created, datetime):
+            created = self._created = parse_datetime(created)
+        return created
@@ -23,19 +23,32 @@
 # SOFTWARE.
 
 
-class Region(object):
-    _data = None
+from .base import Model
+
+
+class Region(Model):
+    """
+    A Digital Ocean region.
+
+    :param region_data: A dictionary of region data from the API.
+    :param keep_raw: Keep `region_data`, available as `raw`.
+    """
+
+    __slots__ = ('_slug', '_name', '_sizes', '_available', '_features')
     mapping = {'ams1': 'Amsterdam 1', 'ams2': 'Amsterdam 2',
                'ams3': 'Amsterdam 3', 'lon1': 'London 1',
                'nyc1': 'New York 1', 'nyc2': 'New York 2',
                'nyc3': 'New York 3', 'sfo1': 'San Fancisco 1',
                'sgp1': 'Singapore 1'}
 
-    def __init__(self, region_data):
-        self._data = region_data
+    key_field = 'slug'
 
-    def __str__(self):
-        return self.__repr__()
+    def _decode(self, data):
+        self._slug = data.get('slug')
+        self._name = data.get('name')
+        self._sizes = data.get('sizes')
+        self._available = data.get('available')
+        self._features = data.get('features')
 
     def __repr__(self):
         return "<Region {0}>".format(self.name)
@@ -65,20 +78,20 @@ class Region(object):
 
     @property
     def slug(self):
-        return self._data['slug']
+        return self._slug
 
     @property
     def name(self):
-        return self._data['name']
+        return self._name
 
     @property
     def sizes(self):
-        return self._data['sizes']
+        return self._sizes
 
     @property
     def available(self):
-        return self._data['available']
+        return self._available
 
     @property
     def features(self):
-        return self._data['features']
+        return self._features
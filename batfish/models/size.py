@@ -25,19 +25,37 @@
 
 from collections import namedtuple
 
+from .base import Model
 from .region import Region
 
 
-class Size(object):
-    _data = None
+Price = namedtuple("Price", "hourly monthly")
+
+
+class Size(Model):
+    """
+    A Digital Ocean droplet size.
+
+    :param size_data: A dictionary of size data from the API.
+    :param keep_raw: Keep `size_data`, available as `raw`.
+    """
+
+    __slots__ = ('_slug', '_memory', '_vcpus', '_disk', '_transfer', '_price',
+                 '_regions')
     mapping = ('512MB', '1GB', '2GB', '4GB', '8GB', '16GB', '32GB',
                '48GB', '64GB')
 
-    def __init__(self, size_data):
-        self._data = size_data
+    key_field = 'slug'
 
-    def __str__(self):
-        return self.__repr__()
+    def _decode(self, data):
+        self._slug = data.get('slug')
+        self._memory = data.get('memory')
+        self._vcpus = data.get('vcpus')
+        self._disk = data.get('disk')
+        self._transfer = data.get('transfer')
+        self._price = Price(hourly=data.get('price_hourly'),
+                            monthly=data.get('price_monthly'))
+        self._regions = data.get('regions') or []
 
     def __repr__(self):
         return "<Size {0}>".format(self.slug.upper())
@@ -48,33 +66,31 @@ class Size(object):
 
     @property
     def slug(self):
-        return self._data['slug']
+        return self._slug
 
     @property
     def memory(self):
-        return self._data['memory'].upper()
+        return self._memory.upper()
 
     @property
     def cpus(self):
-        return self._data['vcpus']
+        return self._vcpus
 
     @property
     def disk_size(self):
-        return "{0}GB".format(self._data['disk'])
+        return "{0}GB".format(self._disk)
 
     @property
     def transfer(self):
-        return "{0}TB".format(self._data['transfer'])
+        return "{0}TB".format(self._transfer)
 
     @property
     def price(self):
-        price = namedtuple("Price", "hourly monthly")
-        return price(hourly=self._data['price_hourly'],
-                     monthly=self._data['price_monthly'])
+        return self._price
 
     @property
     def region_names(self):
-        return [Region.name_from_slug(r) for r in self._data['regions']]
+        return [Region.name_from_slug(r) for r in self._regions]
 
     def regions(self, client):
-        return [client.region_from_slug(r) for r in self._data['regions']]
+        return client.regions_from_slugs(self._regions)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import OrderedDict
+import csv
+import json
+
+
+formats = ('json', 'ndjson', 'csv', 'tsv')
+"""Machine readable output formats."""
+
+
+def _path(*keys):
+    def get(item):
+        for key in keys:
+            if item is None:
+                return None
+            item = item.get(key)
+        return item
+    return get
+
+
+def _public_ip(droplet):
+    for network in (droplet.get('networks') or {}).get('v4') or []:
+        if network.get('type') == 'public':
+            return network.get('ip_address')
+    return None
+
+
+droplet_columns = OrderedDict([
+    ('id', _path('id')),
+    ('name', _path('name')),
+    ('status', _path('status')),
+    ('vcpus', _path('vcpus')),
+    ('memory', _path('memory')),
+    ('disk', _path('disk')),
+    ('region', _path('region', 'slug')),
+    ('size', _path('size', 'slug')),
+    ('image', _path('image', 'id')),
+    ('ip', _public_ip),
+    ('price_monthly', _path('size', 'price_monthly')),
+    ('created_at', _path('created_at')),
+])
+"""Columns of the droplet listing, computed from API dictionaries."""
+
+image_columns = OrderedDict([
+    ('id', _path('id')),
+    ('name', _path('name')),
+    ('slug', _path('slug')),
+    ('distribution', _path('distribution')),
+    ('public', _path('public')),
+    ('regions', _path('regions')),
+    ('created_at', _path('created_at')),
+])
+"""Columns of the image listing, computed from API dictionaries."""
+
+size_columns = OrderedDict([
+    ('slug', _path('slug')),
+    ('vcpus', _path('vcpus')),
+    ('memory', _path('memory')),
+    ('disk', _path('disk')),
+    ('transfer', _path('transfer')),
+    ('price_hourly', _path('price_hourly')),
+    ('price_monthly', _path('price_monthly')),
+    ('regions', _path('regions')),
+])
+"""Columns of the size listing, computed from API dictionaries."""
+
+
+def parse_fields(value, columns):
+    """
+    Parse a comma separated list of column names.
+
+        >>> parse_fields("id,name", droplet_columns)
+        ['id', 'name']
+
+    :param value: The list of names, `None` selects every column.
+    :param columns: The columns available.
+    :rtype: `list` of column names.
+    """
+    if not value:
+        return list(columns)
+    fields = [f.strip() for f in value.split(',') if f.strip()]
+    unknown = [f for f in fields if f not in columns]
+    if unknown:
+        raise ValueError("Unknown field(s) {0}, choose from {1}".format(
+            ", ".join(unknown), ", ".join(columns)))
+    return fields
+
+
+def _cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ",".join(str(v) for v in value)
+    return value
+
+
+def write(items, columns, fields, fmt, out):
+    """
+    Write `items` to `out` as they are produced, computing only the
+    requested columns.
+
+    :param items: An iterable of API dictionaries.
+    :param columns: A dictionary of column name to a callable taking an
+                    API dictionary.
+    :param fields: The column names to write, in order.
+    :param fmt: One of `batfish.output.formats`.
+    :param out: A text file object.
+    """
+    getters = [columns[f] for f in fields]
+    rows = ([get(item) for get in getters] for item in items)
+    if fmt in ('csv', 'tsv'):
+        writer = csv.writer(out, delimiter='\t' if fmt == 'tsv' else ',',
+                            lineterminator='\n')
+        writer.writerow(fields)
+        for row in rows:
+            writer.writerow([_cell(v) for v in row])
+    elif fmt == 'ndjson':
+        for row in rows:
+            out.write(json.dumps(OrderedDict(zip(fields, row))))
+            out.write('\n')
+    elif fmt == 'json':
+        sep = '[\n'
+        for row in rows:
+            out.write(sep)
+            out.write(json.dumps(OrderedDict(zip(fields, row))))
+            sep = ',\n'
+        out.write('[]\n' if sep == '[\n' else '\n]\n')
+    else:
+        raise ValueError("Unknown format {0!r}".format(fmt))
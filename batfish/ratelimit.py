@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+import time
+
+
+class RateLimiter(object):
+    """
+    A thread-safe token bucket that paces requests using the
+    `RateLimit-Limit`, `RateLimit-Remaining` and `RateLimit-Reset` headers
+    returned by the API.
+
+    Requests are sent without delay while more than a `reserve` fraction
+    of the limit remains. Below it, requests burst freely while the bucket
+    holds tokens, which are refilled at the rate that spreads the
+    remaining requests evenly until the limit resets, so a busy client
+    slows down gradually instead of running into `429 Too Many Requests`.
+
+    Share one instance between clients to make them share one budget.
+
+        >>> limiter = RateLimiter(burst=50)
+        >>> cli = batfish.Client(rate_limiter=limiter)
+
+    :param burst: The maximum number of requests sent back to back once
+                  pacing starts.
+    :param reserve: The fraction of the limit below which requests are
+                    paced.
+    """
+
+    def __init__(self, burst=100, reserve=0.1, clock=time.time,
+                 sleep=time.sleep):
+        self.burst = burst
+        self.reserve = reserve
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self._tokens = float(burst)
+        self._rate = None
+        self._updated = None
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def update(self, headers):
+        """
+        Update the bucket from the rate limit headers of a response.
+
+        :param headers: A dictionary of response headers.
+        """
+        try:
+            limit = int(headers['RateLimit-Limit'])
+            remaining = int(headers['RateLimit-Remaining'])
+            reset = float(headers['RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.limit = limit
+            self.remaining = remaining
+            self.reset = reset
+            self._pace(now)
+
+    def acquire(self):
+        """
+        Take a token from the bucket, sleeping until one is available.
+
+        :rtype: The number of seconds spent waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if self.reset is None:
+                return 0
+            if self._rate is None:
+                self.remaining -= 1
+                self._pace(now)
+                return 0
+            if self._tokens >= 1:
+                wait = 0
+            elif self._rate <= 0:
+                wait = self.reset - now
+            else:
+                wait = (1 - self._tokens) / self._rate
+            self._tokens -= 1
+            self.remaining -= 1
+        if wait > 0:
+            self._sleep(wait)
+        return max(wait, 0)
+
+    def _pace(self, now):
+        if self.reset is None or self.remaining > self.limit * self.reserve:
+            self._rate = None
+            self._tokens = float(self.burst)
+            return
+        if self._rate is None:
+            self._tokens = float(self.burst)
+        self._rate = self.remaining / max(self.reset - now, 1.0)
+        self._tokens = min(self._tokens, self.remaining, self.burst)
+
+    def _refill(self, now):
+        if self.reset is not None and now >= self.reset:
+            self.remaining = self.limit
+            self.reset = None
+            self._rate = None
+            self._tokens = float(self.burst)
+        elif self._rate is not None and self._updated is not None:
+            self._tokens = min(self._tokens + (now - self._updated) *
+                               self._rate, self.burst)
+        self._updated = now
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from bisect import bisect_left
+from collections import namedtuple
+import threading
+import time
+
+
+class Match(namedtuple('Match', 'query item candidates')):
+    """
+    The result of resolving a name or slug.
+
+    `item` is the single matching resource or `None`, `candidates` holds
+    every resource that matched.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ambiguous(self):
+        """`True` if more than one resource matched."""
+        return self.item is None and len(self.candidates) > 1
+
+
+class Index(object):
+    """
+    A case insensitive index of a collection of API dictionaries on one
+    field, with an exact match hash and a sorted key list for prefix
+    searches.
+
+        >>> index = Index([{'name': 'web-1'}, {'name': 'web-2'}], 'name')
+        >>> index.resolve('web-1').item
+        {'name': 'web-1'}
+        >>> index.resolve('web').ambiguous
+        True
+
+    :param items: An iterable of dictionaries.
+    :param field: The field to index.
+    """
+
+    def __init__(self, items, field):
+        self.field = field
+        self._exact = {}
+        for item in items:
+            value = item.get(field)
+            if value is None:
+                continue
+            self._exact.setdefault(value.lower(), []).append(item)
+        self._keys = sorted(self._exact)
+
+    def __len__(self):
+        return len(self._exact)
+
+    def exact(self, value):
+        """
+        Every item whose field equals `value`, ignoring case.
+
+        :rtype: `list`.
+        """
+        return self._exact.get(value.lower(), [])
+
+    def prefix(self, value):
+        """
+        Every item whose field starts with `value`, ignoring case, ordered
+        by field.
+
+        :rtype: `list`.
+        """
+        value = value.lower()
+        items = []
+        for key in self._keys[bisect_left(self._keys, value):]:
+            if not key.startswith(value):
+                break
+            items.extend(self._exact[key])
+        return items
+
+    def keys(self, value=''):
+        """
+        The lower case field values starting with `value`, in order.
+
+        :rtype: `list`.
+        """
+        value = value.lower()
+        keys = []
+        for key in self._keys[bisect_left(self._keys, value):]:
+            if not key.startswith(value):
+                break
+            keys.append(key)
+        return keys
+
+    def resolve(self, value):
+        """
+        Resolve `value` to one item. An exact match wins over prefix
+        matches, a prefix only resolves if it matches a single item.
+
+        :rtype: `batfish.resolver.Match`.
+        """
+        candidates = self.exact(value) or self.prefix(value)
+        item = candidates[0] if len(candidates) == 1 else None
+        return Match(value, item, candidates)
+
+
+class Resolver(object):
+    """
+    Builds and keeps one `batfish.resolver.Index` per collection and field,
+    rebuilding it at most once every `ttl` seconds or when invalidated.
+
+    :param loaders: A dictionary of collection name to a callable returning
+                    the collection's items.
+    :param ttl: Seconds an index is used before it is rebuilt.
+    """
+
+    def __init__(self, loaders, ttl=30):
+        self.loaders = loaders
+        self.ttl = ttl
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def index(self, collection, field):
+        """
+        Get the index of `collection` on `field`, building it if needed.
+
+        :rtype: `batfish.resolver.Index`.
+        """
+        key = (collection, field)
+        with self._lock:
+            entry = self._indexes.get(key)
+            if entry is not None and time.time() - entry[0] < self.ttl:
+                return entry[1]
+        index = Index(self.loaders[collection]() or [], field)
+        with self._lock:
+            self._indexes[key] = (time.time(), index)
+        return index
+
+    def resolve(self, collection, field, value):
+        """
+        Resolve a name or slug within a collection.
+
+        :rtype: `batfish.resolver.Match`.
+        """
+        return self.index(collection, field).resolve(value)
+
+    def invalidate(self, collection=None):
+        """
+        Drop the indexes of a collection, or of every collection.
+
+        :param collection: The collection name or `None`.
+        """
+        with self._lock:
+            for key in list(self._indexes):
+                if collection is None or key[0] == collection:
+                    del self._indexes[key]
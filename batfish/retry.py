@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from email.utils import mktime_tz, parsedate_tz
+import random
+import threading
+import time
+
+
+class RetryPolicy(object):
+    """
+    Retry transient failures with capped exponential backoff and full
+    jitter.
+
+    Only idempotent verbs are retried by default. A `Retry-After` header on
+    the response is honoured instead of the computed backoff.
+
+        >>> policy = RetryPolicy(max_attempts=5, backoff_cap=60)
+        >>> cli = batfish.Client(retry=policy)
+        >>> policy.retries
+        0
+
+    :param max_attempts: The maximum number of attempts, including the
+                         first request.
+    :param backoff_base: Backoff in seconds before the first retry, doubled
+                         for each attempt after that.
+    :param backoff_cap: The maximum backoff in seconds.
+    :param methods: HTTP verbs that may be retried.
+    :param statuses: HTTP status codes that are retried.
+    :param on_retry: A callable invoked before each retry as
+                     `on_retry(method, url, attempt, delay, response, error)`.
+    """
+
+    retries = 0
+    """The number of retries made with this policy."""
+
+    def __init__(self, max_attempts=3, backoff_base=0.5, backoff_cap=30,
+                 methods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+                 statuses=(429, 500, 502, 503, 504), on_retry=None,
+                 sleep=time.sleep):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = frozenset(statuses)
+        self.on_retry = on_retry
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def should_retry(self, method, attempt, response=None, error=None):
+        """
+        Whether a request should be attempted again.
+
+        :param method: The HTTP verb of the request.
+        :param attempt: The number of the attempt that just failed.
+        :param response: The response, if one was received.
+        :param error: The exception raised, if no response was received.
+        :rtype: `boolean`.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        if response is not None:
+            return response.status_code in self.statuses
+        return error is not None
+
+    def delay(self, attempt, response=None):
+        """
+        The number of seconds to wait before the next attempt.
+
+        :param attempt: The number of the attempt that just failed.
+        :param response: The response, if one was received.
+        :rtype: `float`.
+        """
+        if response is not None:
+            retry_after = parse_retry_after(
+                response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after
+        backoff = self.backoff_base * (2 ** (attempt - 1))
+        return random.uniform(0, min(self.backoff_cap, backoff))
+
+    def backoff(self, method, url, attempt, response=None, error=None):
+        """
+        Record a retry, call the `on_retry` hook and sleep before the next
+        attempt.
+
+        :param method: The HTTP verb of the request.
+        :param url: The URL of the request.
+        :param attempt: The number of the attempt that just failed.
+        :param response: The response, if one was received.
+        :param error: The exception raised, if no response was received.
+        """
+        delay = self.delay(attempt, response)
+        with self._lock:
+            self.retries += 1
+        if self.on_retry is not None:
+            self.on_retry(method, url, attempt, delay, response, error)
+        if delay > 0:
+            self._sleep(delay)
+
+
+def parse_retry_after(value):
+    """
+    Parse a `Retry-After` header, given either in seconds or as an HTTP
+    date.
+
+        >>> parse_retry_after("120")
+        120.0
+
+    :param value: The header value or `None`.
+    :rtype: Seconds to wait as a `float`, or `None`.
+    """
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(mktime_tz(date) - time.time(), 0.0)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+
+from .models import Droplet, Image, Region
+
+
+class Scope(object):
+    """
+    A unit of work over a `batfish.client.Client` that fetches related
+    resources in bulk and keeps them for its lifetime, so resolving the
+    region or image of many droplets, or the regions of many images,
+    costs one listing rather than a request per object.
+
+    A scope provides the lookup methods model helpers use, and can be
+    passed wherever they expect a client.
+
+        >>> cli = batfish.Client()
+        >>> with cli.scope() as scope:
+        ...     for image in cli.images:
+        ...         print(image.regions(scope))
+
+    :param client: An instance of `batfish.client.Client`.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._regions = None
+        self._images = None
+        self._droplets = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.clear()
+
+    def clear(self):
+        """Forget every resource fetched so far."""
+        with self._lock:
+            self._regions = None
+            self._images = None
+            self._droplets = None
+
+    def _load(self, attr, items, field, model):
+        if getattr(self, attr) is None:
+            model = self.client._model(model)
+            mapping = dict((i[field], model(i)) for i in items() or [])
+            with self._lock:
+                if getattr(self, attr) is None:
+                    setattr(self, attr, mapping)
+        return getattr(self, attr)
+
+    def _fetch(self, mapping, key, fetch):
+        if key not in mapping:
+            item = fetch(key)
+            with self._lock:
+                mapping.setdefault(key, item)
+        return mapping[key]
+
+    def region_from_slug(self, slug):
+        """
+        Get a region by its exact slug. Every region is fetched on the
+        first lookup.
+
+        :param slug: A region slug.
+        :rtype: An instance of `batfish.models.Region` or `None`.
+        """
+        regions = self._load('_regions',
+                             lambda: self.client.catalog('regions'),
+                             'slug', Region)
+        return regions.get(slug)
+
+    def regions_from_slugs(self, slugs):
+        """
+        Get the regions of several slugs.
+
+        :param slugs: An iterable of region slugs.
+        :rtype: `list` of `batfish.models.Region` instances, `None` for
+                unknown slugs.
+        """
+        return [self.region_from_slug(slug) for slug in slugs]
+
+    def image_from_id(self, image_id):
+        """
+        Get an image by ID. Every listed image is fetched on the first
+        lookup, images missing from the listing are requested once each.
+
+        :param image_id: An integer ID of an image.
+        :rtype: An instance of `batfish.models.Image` or `None`.
+        """
+        images = self._load('_images',
+                            lambda: self.client.catalog('images'),
+                            'id', Image)
+        return self._fetch(images, image_id, self.client.image_from_id)
+
+    def droplet_from_id(self, droplet_id):
+        """
+        Get a droplet by ID. Every droplet is fetched on the first lookup,
+        droplets missing from the listing are requested once each.
+
+        :param droplet_id: An integer ID of a droplet.
+        :rtype: An instance of `batfish.models.Droplet` or `None`.
+        """
+        droplets = self._load('_droplets',
+                              lambda: self.client.paginate('droplets',
+                                                           'droplets'),
+                              'id', Droplet)
+        return self._fetch(droplets, droplet_id, self.client.droplet_from_id)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import namedtuple
+import hashlib
+import json
+
+from .models import Droplet
+
+
+Change = namedtuple('Change', 'droplet fields')
+"""A changed droplet and the `set` of top level fields that changed."""
+
+
+class ChangeSet(namedtuple('ChangeSet', 'added removed changed state')):
+    """
+    The difference between two listings of the fleet.
+
+    `added` is a list of new `batfish.models.Droplet` objects, `removed`
+    a list of the IDs of droplets that are gone and `changed` a list of
+    `batfish.sync.Change`. `state` holds the fingerprints of the current
+    listing, to pass to the next sync.
+    """
+
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+def fingerprint(value):
+    """
+    A short, stable digest of a JSON value.
+
+    :rtype: `string`.
+    """
+    data = json.dumps(value, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:16]
+
+
+class FleetSync(object):
+    """
+    Tracks the droplets of an account between listings, keeping one
+    fingerprint per droplet and per droplet field rather than the droplets
+    themselves, and reports only what changed. Field fingerprints are only
+    computed for new droplets and droplets whose fingerprint changed.
+
+        >>> fleet = FleetSync(cli)
+        >>> changes = fleet.sync()
+        >>> for change in changes.changed:
+        ...     print(change.droplet, change.fields)
+        <Droplet web-1> {'status'}
+
+    The state is a dictionary of droplet ID to a `[fingerprint, fields]`
+    pair, the fingerprint of the whole droplet and a dictionary of field
+    name to fingerprint, that can be persisted as JSON and passed back in.
+
+    :param client: An instance of `batfish.client.Client`.
+    :param state: The `state` of a previous `batfish.sync.ChangeSet`.
+    :param ignore: Fields excluded from change detection.
+    """
+
+    def __init__(self, client, state=None, ignore=()):
+        self.client = client
+        self.ignore = frozenset(ignore)
+        self.state = dict((int(k), v) for k, v in (state or {}).items())
+
+    def _tracked(self, data):
+        if not self.ignore:
+            return data
+        return dict((k, v) for k, v in data.items() if k not in self.ignore)
+
+    def _fingerprints(self, data):
+        return dict((k, fingerprint(v)) for k, v in data.items()
+                    if k not in self.ignore)
+
+    def sync(self, per_page=None):
+        """
+        List the droplets and compare them with the previous listing.
+
+        :param per_page: Number of droplets requested per page.
+        :rtype: An instance of `batfish.sync.ChangeSet`.
+        """
+        model = self.client._model(Droplet)
+        items = self.client.paginate('droplets', 'droplets',
+                                     per_page=per_page, stream=True)
+        state = {}
+        added, changed = [], []
+        for data in items:
+            whole = fingerprint(self._tracked(data))
+            previous = self.state.get(data['id'])
+            if previous is not None and previous[0] == whole:
+                state[data['id']] = previous
+                continue
+            fields = self._fingerprints(data)
+            state[data['id']] = [whole, fields]
+            if previous is None:
+                added.append(model(data))
+            else:
+                previous = previous[1]
+                diff = set(k for k in set(fields) | set(previous)
+                           if fields.get(k) != previous.get(k))
+                changed.append(Change(model(data), diff))
+        removed = sorted(set(self.state) - set(state))
+        self.state = state
+        return ChangeSet(added, removed, changed, state)
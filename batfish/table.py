@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# (The MIT License)
+#
+# Copyright (c) 2014 Kura
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the 'Software'), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _datetime64(value):
+    if value is None:
+        return 'NaT'
+    return value.rstrip('Z')
+
+
+class Table(object):
+    """
+    A column oriented table of API resources, one `numpy` array per field,
+    for filtering and aggregating large collections without building a
+    model per item. Requires `numpy`.
+
+    Indexing with a column name returns the column, indexing with a boolean
+    array returns a new table of the matching rows.
+
+        >>> table = cli.droplet_table()
+        >>> active = table[table['status'] == 'active']
+        >>> active.sum_by('region', 'price_monthly')
+        {'ams2': 25.0, 'nyc3': 10.0}
+
+    :param columns: A dictionary of column name to `numpy` array.
+    """
+
+    fields = ()
+    """`(name, dtype, extractor)` of each column."""
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_dicts(cls, items):
+        """
+        Build a table from API dictionaries. `items` is consumed once, so it
+        can be a generator of pages as they are downloaded.
+
+        :param items: An iterable of dictionaries.
+        :rtype: An instance of the table class.
+        """
+        if np is None:
+            raise ImportError("{0} requires numpy, install it with "
+                              "`pip install numpy`.".format(cls.__name__))
+        values = [[] for _ in cls.fields]
+        for item in items:
+            for column, (_, _, extract) in zip(values, cls.fields):
+                column.append(extract(item))
+        columns = OrderedDict()
+        for column, (name, dtype, _) in zip(values, cls.fields):
+            columns[name] = np.array(column, dtype=dtype)
+        return cls(columns)
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        return self.filter(key)
+
+    def __repr__(self):
+        return "<{0} {1} rows>".format(self.__class__.__name__, len(self))
+
+    def filter(self, mask):
+        """
+        The rows where `mask` is `True`.
+
+        :param mask: A boolean array, one value per row.
+        :rtype: A new table of the same class.
+        """
+        return self.__class__(OrderedDict(
+            (name, column[mask]) for name, column in self.columns.items()))
+
+    def sum(self, column):
+        """
+        The sum of a numeric column.
+
+        :rtype: `float` or `integer`.
+        """
+        return self.columns[column].sum().item()
+
+    def count_by(self, key):
+        """
+        The number of rows for each value of `key`.
+
+            >>> table.count_by('region')
+            {'ams2': 120, 'nyc3': 80}
+
+        :rtype: `dictionary`.
+        """
+        groups, counts = np.unique(self.columns[key], return_counts=True)
+        return dict(zip(groups.tolist(), counts.tolist()))
+
+    def sum_by(self, key, column):
+        """
+        The sum of `column` for each value of `key`.
+
+            >>> table.sum_by('size', 'price_monthly')
+            {'512mb': 600.0, '1gb': 800.0}
+
+        :rtype: `dictionary`.
+        """
+        groups, inverse = np.unique(self.columns[key], return_inverse=True)
+        sums = np.bincount(inverse.ravel(), weights=self.columns[column],
+                           minlength=len(groups))
+        return dict(zip(groups.tolist(), sums.tolist()))
+
+    def older_than(self, days, now=None):
+        """
+        The rows created more than `days` days ago.
+
+        :param days: Age in days.
+        :param now: A `numpy.datetime64` to measure age from, defaults to
+                    the current time.
+        :rtype: A new table of the same class.
+        """
+        if now is None:
+            now = np.datetime64('now', 's')
+        cutoff = now - np.timedelta64(int(days * 86400), 's')
+        return self.filter(self.columns['created_at'] < cutoff)
+
+
+class DropletTable(Table):
+    """A column oriented table of droplets."""
+
+    fields = (
+        ('id', 'int64', lambda d: d['id']),
+        ('name', 'U', lambda d: d['name']),
+        ('status', 'U', lambda d: d['status']),
+        ('region', 'U', lambda d: d['region']['slug']),
+        ('size', 'U', lambda d: d['size']['slug']),
+        ('vcpus', 'int32', lambda d: d['vcpus']),
+        ('memory', 'int64', lambda d: d['memory']),
+        ('disk', 'int64', lambda d: d['disk']),
+        ('price_hourly', 'float64', lambda d: d['size']['price_hourly']),
+        ('price_monthly', 'float64', lambda d: d['size']['price_monthly']),
+        ('created_at', 'datetime64[s]',
+         lambda d: _datetime64(d['created_at'])),
+    )
+
+
+class ImageTable(Table):
+    """A column oriented table of images."""
+
+    fields = (
+        ('id', 'int64', lambda i: i['id']),
+        ('name', 'U', lambda i: i['name']),
+        ('slug', 'U', lambda i: i['slug'] or ''),
+        ('distribution', 'U', lambda i: i['distribution']),
+        ('public', 'bool', lambda i: i['public']),
+        ('created_at', 'datetime64[s]',
+         lambda i: _datetime64(i['created_at'])),
+    )
@@ -34,6 +34,10 @@ long_desc = re.sub(r":[a-z]*:`", "`", long_desc)
 
 exec(open('batfish/__about__.py').read())
 
+install_requires = ['requests', 'click', ]
+if sys.version_info < (3, 2):
+    install_requires.append('futures')
+
 entry_points = {
     'console_scripts': [
         'batfish = batfish.cli:cli',
@@ -54,7 +58,9 @@ setup(name=__title__,
       license=__license__,
       platforms=['linux'],
       packages=find_packages(exclude=["*.tests"]),
-      install_requires=['requests', 'click', ],
+      install_requires=install_requires,
+      extras_require={'async': ['aiohttp; python_version >= "3.6"', ],
+                      'fast': ['orjson', ], 'table': ['numpy', ]},
       requires=['requests', 'click', ],
       provides=[__title__, ],
       keywords=['digital', 'ocean', 'shell', 'cli'],
@@ -70,6 +76,8 @@ setup(name=__title__,
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.3',
         'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: Implementation :: CPython',
         'Programming Language :: Python :: Implementation :: PyPy',
         'Topic :: Software Development :: Libraries :: Python Modules',
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import unittest
+
+from mock import patch
+
+try:
+    from aioresponses import aioresponses
+except ImportError:
+    aioresponses = None
+
+from batfish.models import Droplet
+
+
+@unittest.skipIf(aioresponses is None, "aiohttp/aioresponses not installed")
+class TestAsyncClient(unittest.TestCase):
+
+    def setUp(self):
+        from batfish.aio import AsyncClient
+        with patch('batfish.aio.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = AsyncClient()
+        self.url = "https://api.digitalocean.com/v2/droplets"
+
+    def run_with_client(self, coro):
+        async def run():
+            try:
+                return await coro
+            finally:
+                await self.cli.close()
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+    def test_get_json(self):
+        with aioresponses() as m:
+            m.get("https://api.digitalocean.com/v2/kura",
+                  body='{"message": "something"}')
+            j = self.run_with_client(self.cli.get('kura'))
+        self.assertEqual(j['message'], "something")
+
+    def test_droplets_pages(self):
+        next_url = "{0}?page=2&per_page=200".format(self.url)
+        first = {'droplets': [{'id': 1, 'name': 'test1'}],
+                 'links': {'pages': {'next': next_url}}}
+        second = {'droplets': [{'id': 2, 'name': 'test2'}]}
+        with aioresponses() as m:
+            m.get("{0}?per_page=200".format(self.url),
+                  body=json.dumps(first))
+            m.get(next_url, body=json.dumps(second))
+            droplets = self.run_with_client(self.cli.droplets())
+        self.assertEqual([d.name for d in droplets], ['test1', 'test2'])
+        self.assertTrue(all(isinstance(d, Droplet) for d in droplets))
+
+    def test_droplet_from_id_404(self):
+        with aioresponses() as m:
+            m.get("{0}/1".format(self.url), status=404, body='{}')
+            droplet = self.run_with_client(self.cli.droplet_from_id(1))
+        self.assertEqual(droplet, None)
+
+    def test_droplet_reboot(self):
+        with aioresponses() as m:
+            m.post("{0}/1/actions".format(self.url),
+                   body='{"action": {"id": 5}}')
+            j = self.run_with_client(self.cli.droplet_reboot(1))
+        self.assertEqual(j['action']['id'], 5)
@@ -0,0 +1,206 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import requests
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.cache import DiskCache, NameCache
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = DiskCache(os.path.join(self.path, 'cache'),
+                               ttls={'regions': 60}, max_bytes=100)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get_set(self):
+        self.assertEqual(self.cache.get('regions', 60), None)
+        self.cache.set('regions', [{'slug': 'nyc1'}])
+        self.assertEqual(self.cache.get('regions', 60), [{'slug': 'nyc1'}])
+        self.assertEqual(os.listdir(self.cache.path),
+                         [os.path.basename(self.cache._filename('regions'))])
+
+    def test_expired(self):
+        self.cache.set('regions', [])
+        old = time.time() - 120
+        os.utime(self.cache._filename('regions'), (old, old))
+        self.assertEqual(self.cache.get('regions', 60), None)
+
+    def test_ttl(self):
+        self.assertEqual(self.cache.ttl('regions'), 60)
+        self.assertEqual(self.cache.ttl('sizes'), DiskCache.ttls['sizes'])
+        self.assertEqual(self.cache.ttl('kura'), DiskCache.default_ttl)
+
+    def test_evicts_oldest(self):
+        self.cache.set('a', 'x' * 40)
+        old = time.time() - 120
+        os.utime(self.cache._filename('a'), (old, old))
+        self.cache.set('b', 'x' * 40)
+        self.cache.set('c', 'x' * 40)
+        self.assertEqual(self.cache.get('a', 600), None)
+        self.assertEqual(self.cache.get('c', 600), 'x' * 40)
+
+    def test_clear(self):
+        self.cache.set('a', 1)
+        self.cache.clear()
+        self.assertEqual(self.cache.get('a', 600), None)
+
+
+class TestClientCatalogCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client(cache=DiskCache(self.path))
+        self.url = "https://api.digitalocean.com/v2/regions"
+        responses.add(responses.GET, self.url,
+                      body='{"regions": [{"slug": "nyc1", "name": "NY 1"}]}',
+                      status=200, content_type="application/json")
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    @responses.activate
+    def test_regions_cached(self):
+        self.assertEqual(self.cli.regions[0].slug, "nyc1")
+        self.assertEqual(self.cli.region_from_slug("nyc").name, "NY 1")
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_regions_refresh(self):
+        self.cli.catalog('regions')
+        self.cli.catalog('regions', refresh=True)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_invalidate(self):
+        self.cli.catalog('regions')
+        self.cli.invalidate('regions')
+        self.cli.catalog('regions')
+        self.assertEqual(len(responses.calls), 2)
+
+
+class TestNameCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.names = NameCache(DiskCache(self.path), ttl=60)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get_set_forget(self):
+        self.assertEqual(self.names.get('droplets', 'web-1'), None)
+        self.names.set('droplets', 'web-1', 1)
+        self.names.set('droplets', 'web', 1)
+        self.names.set('droplets', 'db-1', 2)
+        self.assertEqual(self.names.get('droplets', 'web-1'), 1)
+        self.names.forget('droplets', 1)
+        self.assertEqual(self.names.get('droplets', 'web'), None)
+        self.assertEqual(self.names.get('droplets', 'db-1'), 2)
+
+    @patch('batfish.cache.time.time')
+    def test_expired(self, now):
+        now.return_value = 1000
+        self.names.set('images', 'ubuntu', 3)
+        now.return_value = 1061
+        self.assertEqual(self.names.get('images', 'ubuntu'), None)
+
+
+class TestClientNameCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.url = "https://api.digitalocean.com/v2/droplets"
+        responses.add(responses.GET, self.url,
+                      body='{"droplets": [{"id": 5, "name": "web-1"}]}',
+                      status=200, content_type="application/json")
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def client(self):
+        cache = DiskCache(self.path)
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            return Client(cache=cache, name_cache=NameCache(cache))
+
+    @responses.activate
+    def test_shared_between_clients(self):
+        self.assertEqual(self.client().droplet_id_from_name('web-1'), 5)
+        self.assertEqual(self.client().droplet_id_from_name('web-1'), 5)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_miss_rereads_listing(self):
+        url = "https://api.digitalocean.com/v2/images"
+        responses.add(responses.GET, url,
+                      body='{"images": [{"id": 1, "name": "ubuntu"}]}',
+                      status=200, content_type="application/json")
+        responses.add(responses.GET, "{0}/snap-1".format(url),
+                      body='{"id": "not_found"}', status=404,
+                      content_type="application/json")
+        responses.add(responses.GET, url,
+                      body='{"images": [{"id": 1, "name": "ubuntu"}, '
+                           '{"id": 2, "name": "snap-1"}]}',
+                      status=200, content_type="application/json")
+        cli = self.client()
+        self.assertEqual(cli.image_id_from_name('ubuntu'), 1)
+        self.assertEqual(cli.image_id_from_name('snap-1'), 2)
+        self.assertEqual(cli.catalog('images')[1]['name'], 'snap-1')
+
+    @responses.activate
+    def test_verify_renamed(self):
+        self.assertEqual(self.client().droplet_id_from_name('web-1'), 5)
+        responses.add(responses.GET, "{0}/5".format(self.url),
+                      body='{"droplet": {"id": 5, "name": "web-old"}}',
+                      status=200, content_type="application/json")
+        responses.add(responses.GET, self.url,
+                      body='{"droplets": [{"id": 5, "name": "web-old"}, '
+                           '{"id": 9, "name": "web-1"}]}',
+                      status=200, content_type="application/json")
+        cli = self.client()
+        self.assertEqual(cli.droplet_id_from_name('web-1', verify=True), 9)
+        self.assertEqual(cli.name_cache.get(cli._cache_key('droplets'),
+                                            'web-1'), 9)
+
+    @responses.activate
+    def test_verify_unchanged(self):
+        self.client().droplet_id_from_name('web-1')
+        responses.add(responses.GET, "{0}/5".format(self.url),
+                      body='{"droplet": {"id": 5, "name": "web-1"}}',
+                      status=200, content_type="application/json")
+        cli = self.client()
+        self.assertEqual(cli.droplet_id_from_name('web-1', verify=True), 5)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_prefix_not_cached(self):
+        cli = self.client()
+        self.assertEqual(cli.droplet_id_from_name('web'), 5)
+        key = cli._cache_key('droplets')
+        self.assertEqual(cli.name_cache.get(key, 'web'), None)
+        cli.droplet_id_from_name('WEB-1')
+        self.assertEqual(cli.name_cache.get(key, 'WEB-1'), 5)
+
+    @responses.activate
+    def test_forgotten_on_404(self):
+        cli = self.client()
+        cli.droplet_id_from_name('web-1')
+        responses.add(responses.POST, "{0}/5/actions".format(self.url),
+                      body='{"id": "not_found"}', status=404,
+                      content_type="application/json")
+        with self.assertRaises(requests.HTTPError):
+            cli.droplet_reboot(5)
+        self.assertEqual(cli.name_cache.get(cli._cache_key('droplets'),
+                                            'web-1'), None)
@@ -0,0 +1,75 @@
+import json
+import unittest
+
+import responses
+from click.testing import CliRunner
+from mock import patch
+
+from batfish.cli import cli
+
+
+class TestCliBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.url = "https://api.digitalocean.com/v2/droplets"
+        body = {'droplets': [{'id': 1, 'name': 'web-1'},
+                             {'id': 2, 'name': 'web-2'},
+                             {'id': 3, 'name': 'db-1'}]}
+        responses.add(responses.GET, self.url, body=json.dumps(body),
+                      status=200, content_type="application/json")
+        for i in (1, 2, 3):
+            responses.add(responses.POST,
+                          "{0}/{1}/actions".format(self.url, i),
+                          body=json.dumps({'action': {'id': 10 + i}}),
+                          status=200 if i != 2 else 422,
+                          content_type="application/json")
+
+    def invoke(self, args, **kwargs):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            return CliRunner().invoke(cli, ['--no-cache'] + args, **kwargs)
+
+    @responses.activate
+    def test_many_targets(self):
+        result = self.invoke(['droplet-power-on', '--droplet', 'web-1',
+                              '--droplet', 'db', '--from-file', '-',
+                              '--jobs', '2'],
+                             input="# comment\n2\nweb\nmail\n")
+        self.assertEqual(result.exit_code, 1)
+        lines = result.output.splitlines()
+        self.assertTrue(lines[0].startswith('web-1  1  ok'))
+        self.assertTrue(lines[1].startswith('db     3  ok'))
+        self.assertTrue('failed: 422' in lines[2])
+        self.assertTrue('ambiguous: web-1, web-2' in lines[3])
+        self.assertTrue('failed: not found' in lines[4])
+        self.assertEqual(lines[5], "2 succeeded, 3 failed")
+        listings = [c for c in responses.calls if c.request.method == 'GET']
+        self.assertEqual(len(listings), 1)
+
+    @responses.activate
+    def test_single_target(self):
+        result = self.invoke(['droplet-power-on', '--droplet', '1'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output.strip(), str({'action': {'id': 11}}))
+
+    def test_no_target(self):
+        result = self.invoke(['droplet-power-on'])
+        self.assertEqual(result.exit_code, 2)
+
+    @responses.activate
+    def test_single_target_ambiguous(self):
+        result = self.invoke(['droplet', '--droplet', 'web'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertTrue("'web' is ambiguous" in result.output)
+
+    @responses.activate
+    def test_image_not_found(self):
+        url = "https://api.digitalocean.com/v2/images"
+        responses.add(responses.GET, "{0}/nosuch".format(url),
+                      body='{"id": "not_found"}', status=404,
+                      content_type="application/json")
+        responses.add(responses.GET, url, body='{"images": []}', status=200,
+                      content_type="application/json")
+        result = self.invoke(['image', '--image', 'nosuch'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertTrue("No image named nosuch" in result.output)
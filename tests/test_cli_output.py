@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import unittest
+
+import responses
+from click.testing import CliRunner
+from mock import patch
+
+from batfish import output
+from batfish.cli import cli
+
+
+class TestOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [{'id': 1, 'name': 'a', 'regions': ['nyc1', 'ams1']},
+                      {'id': 2, 'name': 'b, c', 'regions': []}]
+
+    def render(self, fmt, fields=('id', 'name', 'regions')):
+        out = io.StringIO()
+        output.write(iter(self.items), output.image_columns, list(fields),
+                     fmt, out)
+        return out.getvalue()
+
+    def test_json(self):
+        self.assertEqual(json.loads(self.render('json'))[0],
+                         {'id': 1, 'name': 'a', 'regions': ['nyc1', 'ams1']})
+        out = io.StringIO()
+        output.write([], output.image_columns, ['id'], 'json', out)
+        self.assertEqual(json.loads(out.getvalue()), [])
+
+    def test_ndjson(self):
+        lines = self.render('ndjson', ['id']).splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         [{'id': 1}, {'id': 2}])
+
+    def test_csv_tsv(self):
+        self.assertEqual(self.render('csv'),
+                         'id,name,regions\n1,a,"nyc1,ams1"\n2,"b, c",\n')
+        self.assertEqual(self.render('tsv', ['id', 'name']),
+                         'id\tname\n1\ta\n2\tb, c\n')
+
+    def test_parse_fields(self):
+        self.assertEqual(output.parse_fields("id, name", output.image_columns),
+                         ['id', 'name'])
+        self.assertEqual(output.parse_fields(None, output.size_columns),
+                         list(output.size_columns))
+        with self.assertRaises(ValueError):
+            output.parse_fields("id,kura", output.image_columns)
+
+
+class TestCliOutput(unittest.TestCase):
+
+    @responses.activate
+    @patch('batfish.client.read_token_from_conf', return_value="test_token")
+    def test_droplets_csv(self, read_token):
+        package = os.path.join(os.path.dirname(__file__),
+                               'good_response.json')
+        with open(package) as f:
+            body = f.read()
+        responses.add(responses.GET,
+                      "https://api.digitalocean.com/v2/droplets",
+                      body=body, status=200,
+                      content_type="application/json")
+        result = CliRunner().invoke(cli, ['--no-cache', 'droplets',
+                                          '--format', 'csv',
+                                          '--fields', 'id,ip,region'])
+        self.assertEqual(result.exit_code, 0)
+        lines = result.output.splitlines()
+        droplet = json.loads(body)['droplets'][0]
+        self.assertEqual(lines[0], 'id,ip,region')
+        self.assertEqual(lines[1], '{0},1.1.1.2,{1}'.format(
+            droplet['id'], droplet['region']['slug']))
+
+    def test_unknown_field(self):
+        result = CliRunner().invoke(cli, ['sizes', '--format', 'json',
+                                          '--fields', 'kura'])
+        self.assertEqual(result.exit_code, 2)
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+import unittest
+
+from click.testing import CliRunner
+from mock import patch
+
+from batfish.cli import cli
+
+
+class TestCliStartup(unittest.TestCase):
+
+    @unittest.skipIf(sys.version_info < (3, 5),
+                     "batfish imports the client eagerly before Python 3.5")
+    def test_import_is_light(self):
+        code = ("import sys, batfish.cli; "
+                "print(','.join(m for m in ('requests', 'batfish.client') "
+                "if m in sys.modules))")
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.strip(), b'')
+
+    @patch('batfish.client.read_token_from_conf', return_value="test_token")
+    def test_client_not_built(self, read_token):
+        runner = CliRunner()
+        for args in (['--help'], ['--no-cache', 'sizes']):
+            result = runner.invoke(cli, args)
+            self.assertEqual(result.exit_code, 0)
+        self.assertFalse(read_token.called)
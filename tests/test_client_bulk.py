@@ -0,0 +1,60 @@
+import json
+import unittest
+
+import responses
+from requests import HTTPError
+from mock import patch
+
+from batfish import Client
+from batfish.models import Droplet
+
+
+class TestClientBulk(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/droplets/{0}/actions"
+
+    @responses.activate
+    def test_bulk_droplet_action(self):
+        for i in (1, 2, 3):
+            responses.add(responses.POST, self.url.format(i),
+                          body=json.dumps({'action': {'id': i * 10}}),
+                          status=200, content_type="application/json")
+        results = self.cli.bulk_droplet_action(
+            "reboot", [1, 2, Droplet({'id': 3})], max_workers=2)
+        self.assertEqual(sorted(results), [1, 2, 3])
+        for i, r in results.items():
+            self.assertEqual(r.droplet, i)
+            self.assertEqual(r.result['action']['id'], i * 10)
+            self.assertEqual(r.error, None)
+        body = json.loads(responses.calls[0].request.body)
+        self.assertEqual(body, {'type': 'reboot'})
+
+    @responses.activate
+    def test_bulk_droplet_action_errors(self):
+        responses.add(responses.POST, self.url.format(1),
+                      body='{"action": {"id": 10}}', status=200,
+                      content_type="application/json")
+        responses.add(responses.POST, self.url.format(2),
+                      body='{"id": "not_found"}', status=404,
+                      content_type="application/json")
+        results = self.cli.bulk_droplet_action("power_off", [1, 2])
+        self.assertEqual(results[1].error, None)
+        self.assertEqual(results[2].result, None)
+        self.assertTrue(isinstance(results[2].error, HTTPError))
+
+    @responses.activate
+    def test_bulk_droplet_image_action(self):
+        responses.add(responses.POST, self.url.format(1),
+                      body='{"action": {"id": 10}}', status=200,
+                      content_type="application/json")
+        self.cli.bulk_droplet_action("rebuild", [1], image=99)
+        body = json.loads(responses.calls[0].request.body)
+        self.assertEqual(body, {'type': 'rebuild', 'image': 99})
+
+    def test_bulk_droplet_action_unknown(self):
+        with self.assertRaises(NotImplementedError):
+            self.cli.bulk_droplet_action("explode", [1])
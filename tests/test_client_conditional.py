@@ -0,0 +1,97 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.cache import ConditionalCache
+
+
+class TestClientConditionalGet(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/kura"
+
+    @responses.activate
+    def test_get_not_modified(self):
+        responses.add(responses.GET, self.url, body='{"message": "one"}',
+                      status=200, content_type="application/json",
+                      headers={'ETag': '"abc"', 'Last-Modified':
+                               "Mon, 01 Sep 2014 00:00:00 GMT"})
+        responses.add(responses.GET, self.url, body='', status=304)
+        first = self.cli.get('kura')
+        second = self.cli.get('kura')
+        self.assertEqual(second, {'message': "one"})
+        self.assertTrue(first is second)
+        h = responses.calls[1].request.headers
+        self.assertEqual(h['If-None-Match'], '"abc"')
+        self.assertEqual(h['If-Modified-Since'],
+                         "Mon, 01 Sep 2014 00:00:00 GMT")
+
+    @responses.activate
+    def test_get_modified(self):
+        responses.add(responses.GET, self.url, body='{"message": "one"}',
+                      status=200, content_type="application/json",
+                      headers={'ETag': '"abc"'})
+        responses.add(responses.GET, self.url, body='{"message": "two"}',
+                      status=200, content_type="application/json",
+                      headers={'ETag': '"def"'})
+        self.cli.get('kura')
+        self.assertEqual(self.cli.get('kura'), {'message': "two"})
+        self.assertEqual(self.cli.conditional_cache.lookup(self.url).etag,
+                         '"def"')
+
+    @responses.activate
+    def test_get_custom_headers_not_conditional(self):
+        responses.add(responses.GET, self.url, body='{}', status=200,
+                      content_type="application/json",
+                      headers={'ETag': '"abc"'})
+        self.cli.get('kura')
+        self.cli.get('kura', headers={'Authorization': "Bearer other"})
+        self.assertFalse('If-None-Match' in responses.calls[1].request.headers)
+
+    @responses.activate
+    def test_later_pages_not_kept(self):
+        url = "https://api.digitalocean.com/v2/droplets"
+        for page in range(1, 4):
+            body = {'droplets': [{'id': page}], 'links': {'pages': {}}}
+            if page < 3:
+                body['links']['pages']['next'] = \
+                    "{0}?page={1}&per_page=1".format(url, page + 1)
+            responses.add(responses.GET, url, body=json.dumps(body),
+                          status=200, content_type="application/json",
+                          headers={'ETag': '"{0}"'.format(page)})
+        droplets = self.cli.paginate('droplets', 'droplets', per_page=1)
+        self.assertEqual([d['id'] for d in droplets], [1, 2, 3])
+        self.assertEqual(len(self.cli.conditional_cache), 1)
+        self.assertNotEqual(self.cli.conditional_cache.lookup(
+            "{0}?per_page=1".format(url)), None)
+
+    @responses.activate
+    def test_get_disabled(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            cli = Client(conditional=False)
+        responses.add(responses.GET, self.url, body='{}', status=200,
+                      content_type="application/json",
+                      headers={'ETag': '"abc"'})
+        cli.get('kura')
+        cli.get('kura')
+        self.assertFalse('If-None-Match' in responses.calls[1].request.headers)
+
+
+class TestConditionalCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = ConditionalCache(max_entries=2)
+        cache.store('a', {'ETag': '"a"'}, {})
+        cache.store('b', {'ETag': '"b"'}, {})
+        cache.lookup('a')
+        cache.store('c', {'ETag': '"c"'}, {})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.lookup('b'), None)
+        self.assertNotEqual(cache.lookup('a'), None)
@@ -0,0 +1,61 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.models import Droplet
+
+
+class TestClientFromIds(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.cli.per_page = 2
+        self.url = "https://api.digitalocean.com/v2/droplets"
+
+    def add_page(self, ids, page, total):
+        body = {'droplets': [{'id': i} for i in ids],
+                'meta': {'total': total}}
+        if page * 2 < total:
+            body['links'] = {'pages': {'next': "{0}?page={1}".format(
+                self.url, page + 1)}}
+        responses.add(responses.GET, self.url, body=json.dumps(body),
+                      status=200, content_type="application/json")
+
+    @responses.activate
+    def test_single_id(self):
+        responses.add(responses.GET, "{0}/1".format(self.url),
+                      body=json.dumps({'droplet': {'id': 1}}), status=200,
+                      content_type="application/json")
+        result = self.cli.droplets_from_ids([1, 1])
+        self.assertEqual(list(result), [1])
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_list_fetch(self):
+        self.add_page([1, 2], 1, 4)
+        self.add_page([3, 4], 2, 4)
+        result = self.cli.droplets_from_ids([1, 2, 3, Droplet({'id': 5})])
+        self.assertEqual(sorted(result), [1, 2, 3, 5])
+        self.assertEqual(result[3].id, 3)
+        self.assertEqual(result[5], None)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_per_id_fetch(self):
+        self.add_page([1, 2], 1, 20)
+        responses.add(responses.GET, "{0}/9".format(self.url),
+                      body=json.dumps({'droplet': {'id': 9}}), status=200,
+                      content_type="application/json")
+        responses.add(responses.GET, "{0}/10".format(self.url),
+                      body='{"id": "not_found"}', status=404,
+                      content_type="application/json")
+        result = self.cli.droplets_from_ids([1, 9, 10])
+        self.assertEqual(result[1].id, 1)
+        self.assertEqual(result[9].id, 9)
+        self.assertEqual(result[10], None)
+        self.assertEqual(len(responses.calls), 3)
@@ -0,0 +1,72 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.models import Action, Droplet
+
+
+def page(key, names, next_url=None):
+    j = {key: [{'id': i, 'name': n} for i, n in enumerate(names)]}
+    if next_url is not None:
+        j['links'] = {'pages': {'next': next_url}}
+    return json.dumps(j)
+
+
+class TestClientPagination(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/droplets"
+
+    def add_pages(self):
+        next_url = "{0}?page=2&per_page=2".format(self.url)
+        responses.add(responses.GET, next_url,
+                      body=page('droplets', ['test3']), status=200,
+                      content_type="application/json")
+        responses.add(responses.GET, "{0}?per_page=2".format(self.url),
+                      body=page('droplets', ['test1', 'test2'], next_url),
+                      status=200, content_type="application/json")
+
+    @responses.activate
+    def test_iter_droplets_follows_next(self):
+        self.add_pages()
+        droplets = list(self.cli.iter_droplets(per_page=2))
+        self.assertEqual([d.name for d in droplets],
+                         ['test1', 'test2', 'test3'])
+        self.assertTrue(all(isinstance(d, Droplet) for d in droplets))
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_iter_droplets_is_lazy(self):
+        self.add_pages()
+        droplets = self.cli.iter_droplets(per_page=2)
+        next(droplets)
+        next(droplets)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_droplets_uses_all_pages(self):
+        self.add_pages()
+        self.cli.per_page = 2
+        self.assertEqual(len(self.cli.droplets), 3)
+
+    @responses.activate
+    def test_iter_droplets_none(self):
+        responses.add(responses.GET, self.url, body="{}", status=200,
+                      content_type="application/json")
+        self.assertEqual(list(self.cli.iter_droplets()), [])
+
+    @responses.activate
+    def test_droplet_iter_actions(self):
+        url = "{0}/1/actions".format(self.url)
+        responses.add(responses.GET, url,
+                      body=page('actions', ['reboot', 'create']), status=200,
+                      content_type="application/json")
+        actions = list(Droplet({'id': 1}).iter_actions(self.cli))
+        self.assertEqual(len(actions), 2)
+        self.assertTrue(all(isinstance(a, Action) for a in actions))
@@ -0,0 +1,44 @@
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+
+
+class TestClientSession(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client(pool_connections=2, pool_maxsize=20)
+
+    def test_session_pool_size(self):
+        adapter = self.cli.session.get_adapter(self.cli.api_base)
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 20)
+
+    @responses.activate
+    def test_session_shared_by_verbs(self):
+        url = "https://api.digitalocean.com/v2/kura"
+        responses.add(responses.GET, url, body='{}', status=200,
+                      content_type="application/json")
+        responses.add(responses.POST, url, body='{}', status=200,
+                      content_type="application/json")
+        with patch.object(self.cli.session, 'request',
+                          wraps=self.cli.session.request) as request:
+            self.cli.get('kura')
+            self.cli.post('kura', {})
+        self.assertEqual(request.call_count, 2)
+
+    @responses.activate
+    def test_session_no_keep_alive(self):
+        url = "https://api.digitalocean.com/v2/kura"
+        responses.add(responses.GET, url, body='{}', status=200,
+                      content_type="application/json")
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            cli = Client(keep_alive=False)
+        cli.get('kura')
+        self.assertEqual(responses.calls[0].request.headers['Connection'],
+                         "close")
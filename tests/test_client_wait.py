@@ -0,0 +1,74 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.exceptions import ActionTimeout
+from batfish.models import Action
+
+
+def action(action_id, status):
+    return {'id': action_id, 'status': status, 'type': 'reboot'}
+
+
+class TestClientWaitForAction(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/actions"
+
+    @responses.activate
+    @patch('batfish.client.time.sleep')
+    def test_wait_for_action(self, sleep):
+        url = "{0}/5".format(self.url)
+        for status in ('in-progress', 'in-progress', 'completed'):
+            responses.add(responses.GET, url,
+                          body=json.dumps({'action': action(5, status)}),
+                          status=200, content_type="application/json")
+        a = self.cli.wait_for_action({'action': action(5, 'in-progress')},
+                                     interval=2, max_interval=2.5)
+        self.assertTrue(isinstance(a, Action))
+        self.assertEqual(a.status, 'completed')
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [2, 2.5])
+
+    @responses.activate
+    @patch('batfish.client.time.sleep')
+    def test_wait_for_actions_shares_listing(self, sleep):
+        first = [action(9, 'in-progress'), action(8, 'completed'),
+                 action(7, 'in-progress'), action(6, 'completed')]
+        second = [action(9, 'completed'), action(8, 'completed'),
+                  action(7, 'errored'), action(6, 'completed')]
+        for page in (first, second):
+            responses.add(responses.GET, self.url,
+                          body=json.dumps({'actions': page}), status=200,
+                          content_type="application/json")
+        done = self.cli.wait_for_actions([7, 8, Action(action(9, 'new'))])
+        self.assertEqual(sorted(done), [7, 8, 9])
+        self.assertEqual(done[7].status, 'errored')
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(sleep.call_count, 1)
+
+    @responses.activate
+    @patch('batfish.client.time.sleep')
+    def test_wait_for_action_timeout(self, sleep):
+        responses.add(responses.GET, "{0}/5".format(self.url),
+                      body=json.dumps({'action': action(5, 'in-progress')}),
+                      status=200, content_type="application/json")
+        with self.assertRaises(ActionTimeout) as e:
+            self.cli.wait_for_action(5, timeout=0)
+        self.assertEqual(e.exception.pending, set([5]))
+
+    @responses.activate
+    @patch('batfish.client.time.sleep')
+    def test_wait_for_created_droplet(self, sleep):
+        responses.add(responses.GET, "{0}/7".format(self.url),
+                      body=json.dumps({'action': action(7, 'completed')}),
+                      status=200, content_type="application/json")
+        created = {'droplet': {'id': 3},
+                   'links': {'actions': [{'id': 7, 'rel': 'create'}]}}
+        self.assertEqual(self.cli.wait_for_action(created).id, 7)
+        self.assertEqual(list(self.cli.wait_for_actions([created])), [7])
@@ -0,0 +1,84 @@
+import shutil
+import tempfile
+import unittest
+
+from mock import Mock, patch
+
+from batfish.cache import DiskCache
+from batfish.cli import cli, complete
+from batfish.completion import CompletionIndex
+from batfish.inventory import Inventory
+
+try:
+    from click.shell_completion import ShellComplete
+except ImportError:
+    ShellComplete = None
+
+
+class TestCompletionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = DiskCache(self.path)
+        self.index = CompletionIndex(self.cache)
+        self.index.save(CompletionIndex.snapshot(
+            droplets=[{'name': 'web-1'}, {'name': 'Web-2'}, {'name': 'db-1'}],
+            images=[{'name': 'Ubuntu 14.04', 'slug': 'ubuntu-14-04-x64'},
+                    {'name': 'backup', 'slug': None}],
+            regions=[{'slug': 'nyc1'}, {'slug': 'nyc2'}, {'slug': 'ams1'}]))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_complete(self):
+        index = CompletionIndex(self.cache)
+        self.assertEqual(index.complete('droplets', 'WEB'),
+                         ['web-1', 'Web-2'])
+        self.assertEqual(index.complete('images', 'ub'),
+                         ['Ubuntu 14.04', 'ubuntu-14-04-x64'])
+        self.assertEqual(index.complete('regions', ''),
+                         ['ams1', 'nyc1', 'nyc2'])
+        self.assertEqual(index.complete('droplets', 'mail'), [])
+
+    def test_no_snapshot(self):
+        self.index.clear()
+        index = CompletionIndex(self.cache)
+        self.assertEqual(index.complete('droplets', 'web'), [])
+        self.assertTrue(index.stale)
+
+    @patch('batfish.completion.subprocess.Popen')
+    def test_refresh_in_background(self, popen):
+        index = CompletionIndex(self.cache, max_age=0)
+        self.assertTrue(index.refresh_in_background())
+        self.assertFalse(index.refresh_in_background())
+        self.assertEqual(popen.call_count, 1)
+        self.assertEqual(popen.call_args[0][0][1:],
+                         ['-m', 'batfish.completion'])
+        self.assertFalse(CompletionIndex(self.cache).refresh_in_background())
+
+    def test_inventory_saves_snapshot(self):
+        client = Mock()
+        client.paginate.return_value = [{'id': 1, 'name': 'mail-1'}]
+        client.catalog.side_effect = lambda c: {
+            'images': [{'id': 2, 'name': 'Debian', 'slug': 'debian-7'}],
+            'regions': [{'slug': 'sfo1'}]}[c]
+        Inventory(client, completion=self.index).refresh()
+        index = CompletionIndex(self.cache)
+        self.assertEqual(index.complete('droplets', 'm'), ['mail-1'])
+        self.assertEqual(index.complete('images', 'de'),
+                         ['Debian', 'debian-7'])
+        self.assertEqual(index.complete('regions', 's'), ['sfo1'])
+
+    @unittest.skipIf(ShellComplete is None, "click 8 not installed")
+    @patch('batfish.completion.subprocess.Popen')
+    def test_cli_completion(self, popen):
+        with patch('batfish.cli.DiskCache', return_value=self.cache):
+            complete = ShellComplete(cli, {}, 'batfish', '_BATFISH_COMPLETE')
+            found = complete.get_completions(['droplet-reboot', '--droplet'],
+                                             'w')
+        self.assertEqual([c.value for c in found], ['web-1', 'Web-2'])
+        self.assertFalse(popen.called)
+
+    @patch('batfish.cli.shell_completion', None)
+    def test_cli_completion_needs_click_8(self):
+        self.assertEqual(complete('droplets'), {})
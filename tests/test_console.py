@@ -0,0 +1,57 @@
+import unittest
+
+from mock import Mock, patch
+
+from batfish.console import Batfish
+from batfish.exceptions import AmbiguousName
+from batfish.jobs import JobManager
+
+
+class TestConsoleNames(unittest.TestCase):
+
+    def setUp(self):
+        self.console = Batfish()
+        self.console.ctx = Mock()
+        self.console.inventory = Mock(loaded=True, error=None)
+        self.console.inventory.droplet.return_value = None
+        self.console.jobs = Mock()
+
+    @patch('batfish.console.print', create=True)
+    def test_ambiguous_name(self, out):
+        self.console.ctx.droplet_id_from_name.side_effect = AmbiguousName(
+            'web', ['web-1', 'web-2'])
+        self.assertFalse(self.console.onecmd('droplet web'))
+        self.assertTrue('ambiguous' in str(out.call_args[0][0]))
+
+    @patch('batfish.console.print', create=True)
+    def test_not_found(self, out):
+        self.console.ctx.droplet_id_from_name.return_value = None
+        self.console.onecmd('droplet_power_on mail')
+        self.assertFalse(self.console.ctx.droplet_power_on.called)
+        self.assertEqual(str(out.call_args[0][0]), "No droplet named mail")
+
+
+class TestConsoleOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.console = Batfish()
+        self.console.ctx = Mock()
+        self.console.inventory = Mock(loaded=True, error=None)
+        self.console.inventory.image.return_value = Mock(
+            id=7, slug=None, distribution='Ubuntu', region_names=['nyc1'])
+        self.console.inventory.image.return_value.name = 'snap-1'
+        self.console.jobs = JobManager(self.console.ctx)
+
+    def tearDown(self):
+        self.console.jobs.shutdown()
+
+    @patch('batfish.console.print', create=True)
+    def test_background_captures_output(self, out):
+        self.console.background('image snap-1')
+        self.console.jobs.wait(1)
+        self.assertFalse(any('snap-1 [id: 7]' in str(c[0][0])
+                             for c in out.call_args_list))
+        self.console.notify()
+        printed = [str(c[0][0]) for c in out.call_args_list]
+        self.assertTrue(printed[-2].startswith('[1] done'))
+        self.assertTrue(printed[-1].startswith('    snap-1 [id: 7]'))
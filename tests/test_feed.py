@@ -0,0 +1,61 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.models import Droplet
+
+
+def page(ids, next_url=None):
+    body = {'actions': [{'id': i, 'status': 'completed'} for i in ids]}
+    if next_url is not None:
+        body['links'] = {'pages': {'next': next_url}}
+    return json.dumps(body)
+
+
+class TestActionFeed(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/actions"
+
+    @responses.activate
+    def test_stops_at_cursor(self):
+        next_url = "{0}?page=2".format(self.url)
+        responses.add(responses.GET, self.url, status=200,
+                      body=page([12, 11, 10], next_url),
+                      content_type="application/json")
+        feed = self.cli.action_feed(cursor=10)
+        self.assertEqual([a.id for a in feed.poll()], [12, 11])
+        self.assertEqual(feed.cursor, 12)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_resumes(self):
+        responses.add(responses.GET, self.url, status=200,
+                      body=page([2, 1]), content_type="application/json")
+        responses.add(responses.GET, self.url, status=200,
+                      body=page([3, 2, 1]), content_type="application/json")
+        feed = self.cli.action_feed()
+        self.assertEqual([a.id for a in feed], [2, 1])
+        self.assertEqual([a.id for a in feed], [3])
+
+    @responses.activate
+    def test_cursor_kept_on_partial_read(self):
+        responses.add(responses.GET, self.url, status=200,
+                      body=page([2, 1]), content_type="application/json")
+        feed = self.cli.action_feed()
+        next(feed.poll())
+        self.assertEqual(feed.cursor, None)
+
+    @responses.activate
+    def test_droplet_feed(self):
+        url = "https://api.digitalocean.com/v2/droplets/5/actions"
+        responses.add(responses.GET, url, status=200, body=page([7]),
+                      content_type="application/json")
+        feed = Droplet({'id': 5}).action_feed(self.cli, cursor=6)
+        self.assertEqual([a.id for a in feed.poll()], [7])
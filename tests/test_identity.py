@@ -0,0 +1,60 @@
+import gc
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.identity import IdentityMap
+from batfish.models import Droplet, Image, Region
+
+
+class TestModelEquality(unittest.TestCase):
+
+    def test_eq_hash(self):
+        self.assertEqual(Droplet({'id': 1, 'name': 'a'}),
+                         Droplet({'id': 1, 'name': 'b'}))
+        self.assertNotEqual(Droplet({'id': 1}), Droplet({'id': 2}))
+        self.assertNotEqual(Droplet({'id': 1}), Image({'id': 1}))
+        self.assertEqual(len(set([Droplet({'id': 1}), Droplet({'id': 1}),
+                                  Image({'id': 1})])), 2)
+        self.assertEqual(Region({'slug': 'nyc1'}), Region({'slug': 'nyc1'}))
+
+    def test_no_key(self):
+        d = Droplet({})
+        self.assertEqual(d, d)
+        self.assertNotEqual(d, Droplet({}))
+
+
+class TestIdentityMap(unittest.TestCase):
+
+    def test_same_instance_refreshed(self):
+        identity_map = IdentityMap()
+        d1 = identity_map.get(Droplet, {'id': 1, 'status': 'new'})
+        d2 = identity_map.get(Droplet, {'id': 1, 'status': 'active'})
+        self.assertTrue(d1 is d2)
+        self.assertEqual(d1.status, 'active')
+        self.assertFalse(identity_map.get(Image, {'id': 1}) is d1)
+
+    def test_weak(self):
+        identity_map = IdentityMap()
+        identity_map.get(Droplet, {'id': 1})
+        gc.collect()
+        self.assertEqual(len(identity_map), 0)
+
+    @responses.activate
+    def test_client(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            cli = Client(identity_map=True)
+        url = "https://api.digitalocean.com/v2/droplets"
+        for status in ('new', 'active'):
+            responses.add(responses.GET, url, status=200,
+                          body=json.dumps({'droplets': [
+                              {'id': 1, 'status': status}]}),
+                          content_type="application/json")
+        first = cli.droplets
+        second = cli.droplets
+        self.assertTrue(first[0] is second[0])
+        self.assertEqual(first[0].status, 'active')
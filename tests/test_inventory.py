@@ -0,0 +1,53 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.inventory import Inventory
+
+
+class TestInventory(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/"
+        droplets = [{'id': 1, 'name': 'web-1'}, {'id': 2, 'name': 'Web-2'},
+                    {'id': 3, 'name': 'db-1'}]
+        images = [{'id': 10, 'name': 'base', 'slug': 'ubuntu-14-04-x64'}]
+        responses.add(responses.GET, self.url + "droplets",
+                      body=json.dumps({'droplets': droplets}), status=200,
+                      content_type="application/json")
+        responses.add(responses.GET, self.url + "images",
+                      body=json.dumps({'images': images}), status=200,
+                      content_type="application/json")
+        self.inventory = Inventory(self.cli, interval=0.01)
+
+    @responses.activate
+    def test_lookups(self):
+        self.assertEqual(self.inventory.age, None)
+        self.inventory.refresh()
+        self.assertTrue(self.inventory.loaded)
+        self.assertEqual(self.inventory.droplet('db').id, 3)
+        self.assertEqual(self.inventory.droplet('2').name, 'Web-2')
+        self.assertEqual(self.inventory.droplet('web'), None)
+        self.assertEqual(self.inventory.image('ubuntu').id, 10)
+        self.assertEqual(self.inventory.names('droplets', 'we'),
+                         ['Web-2', 'web-1'])
+        self.assertEqual(self.inventory.names('images'),
+                         ['base', 'ubuntu-14-04-x64'])
+        self.assertEqual(len(self.inventory.items('droplets')), 3)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_background(self):
+        self.inventory.start()
+        try:
+            self.assertTrue(self.inventory.wait(5))
+        finally:
+            self.inventory.stop()
+        self.assertTrue(self.inventory.age < 5)
+        self.assertEqual(self.inventory.error, None)
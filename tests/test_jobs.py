@@ -0,0 +1,87 @@
+import threading
+import unittest
+
+from mock import Mock
+
+from batfish.jobs import JobManager, action_ids
+from batfish.models import Action
+
+
+class TestJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Mock()
+        self.jobs = JobManager(self.client, max_workers=1, interval=0.01,
+                               max_interval=0.01)
+
+    def tearDown(self):
+        self.jobs.shutdown()
+
+    def test_action_ids(self):
+        self.assertEqual(action_ids({'action': {'id': 1}}), [1])
+        self.assertEqual(action_ids({'droplet': {},
+                                     'links': {'actions': [{'id': 2}]}}),
+                         [2])
+        self.assertEqual(action_ids(None), [])
+
+    def test_waits_for_actions(self):
+        statuses = iter(['in-progress', 'in-progress', 'completed'])
+        self.client._poll_actions.side_effect = lambda pending: [
+            Action({'id': i, 'status': next(statuses)}) for i in pending]
+        job = self.jobs.submit("snapshot", lambda: [{'action': {'id': 5}}])
+        self.jobs.wait(job.id)
+        self.assertEqual(job.status, 'done')
+        self.assertEqual(job.actions[5].status, 'completed')
+        self.assertEqual(self.client._poll_actions.call_count, 3)
+        self.assertEqual(self.jobs.finished(), [job])
+        self.assertEqual(self.jobs.finished(), [])
+
+    def test_waiting_jobs_share_polls(self):
+        release = threading.Event()
+
+        def poll(pending):
+            release.wait(5)
+            return [Action({'id': i, 'status': 'completed'})
+                    for i in pending]
+        self.client._poll_actions.side_effect = poll
+        jobs = [self.jobs.submit("snapshot",
+                                 lambda i=i: [{'action': {'id': i}}])
+                for i in range(10)]
+        for _ in range(500):
+            if all(j.status == 'waiting' for j in jobs):
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual([j.status for j in jobs], ['waiting'] * 10)
+        release.set()
+        for job in jobs:
+            self.assertEqual(self.jobs.wait(job.id, 5).status, 'done')
+        polled = set()
+        for call in self.client._poll_actions.call_args_list:
+            polled.update(call[0][0])
+        self.assertEqual(polled, set(range(10)))
+        self.assertTrue(self.client._poll_actions.call_count < 10)
+
+    def test_failed(self):
+        def fail():
+            raise ValueError("kura")
+        job = self.jobs.submit("fail", fail)
+        self.jobs.wait(job.id)
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(str(job.error), "kura")
+
+    def test_cancel(self):
+        self.client._poll_actions.return_value = [Action(
+            {'id': 5, 'status': 'in-progress'})]
+        release = threading.Event()
+        first = self.jobs.submit("first", lambda: release.wait(5) and [])
+        queued = self.jobs.submit("queued", lambda: [])
+        self.assertTrue(self.jobs.cancel(queued.id))
+        self.assertEqual(queued.status, 'cancelled')
+        release.set()
+        self.jobs.wait(first.id)
+        waiting = self.jobs.submit("waiting",
+                                   lambda: [{'action': {'id': 5}}])
+        self.assertTrue(self.jobs.cancel(waiting.id))
+        self.jobs.wait(waiting.id)
+        self.assertEqual(waiting.status, 'cancelled')
+        self.assertFalse(self.jobs.cancel(waiting.id))
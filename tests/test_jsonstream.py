@@ -0,0 +1,82 @@
+import json
+import os
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.jsonstream import iter_items, loads
+
+
+def chunked(text, size):
+    data = text.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonStream(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = {'droplets': [{'id': 1, 'name': u"café"},
+                                 {'id': 2, 'size': 1.5e3}, [], 12345],
+                    'links': {'pages': {'next': None}},
+                    'meta': {'total': 4}}
+
+    def test_loads_bytes(self):
+        self.assertEqual(loads(json.dumps(self.doc).encode('utf-8')),
+                         self.doc)
+
+    @patch('batfish.jsonstream._decode_bytes', True)
+    @patch('batfish.jsonstream._backend', json)
+    def test_loads_bytes_old_json(self):
+        data = json.dumps(self.doc, ensure_ascii=False).encode('utf-8')
+        with patch.object(json, 'loads', wraps=json.loads) as stdlib:
+            self.assertEqual(loads(data), self.doc)
+        self.assertTrue(isinstance(stdlib.call_args[0][0], type(u'')))
+
+    def test_iter_items_chunks(self):
+        text = json.dumps(self.doc, indent=2)
+        for size in (1, 2, 7, 4096):
+            rest = {}
+            items = list(iter_items(chunked(text, size), 'droplets', rest))
+            self.assertEqual(items, self.doc['droplets'])
+            self.assertEqual(rest, {'links': self.doc['links'],
+                                    'meta': self.doc['meta']})
+
+    def test_iter_items_missing_or_empty(self):
+        self.assertEqual(list(iter_items([b'{}'], 'droplets')), [])
+        self.assertEqual(list(iter_items([b'{"droplets": []}'],
+                                         'droplets')), [])
+        self.assertEqual(list(iter_items([b'{"droplets": 1}'],
+                                         'droplets')), [])
+
+    def test_iter_items_truncated(self):
+        with self.assertRaises(ValueError):
+            list(iter_items([b'{"droplets": [{"id": 1}, {"id"'],
+                            'droplets'))
+
+
+class TestClientStream(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.cli.chunk_size = 64
+        self.url = "https://api.digitalocean.com/v2/droplets"
+
+    @responses.activate
+    def test_iter_droplets_stream(self):
+        package = os.path.join(os.path.dirname(__file__),
+                               'good_response.json')
+        with open(package) as f:
+            body = json.load(f)
+        body['links'] = {'pages': {'next': "{0}?page=2".format(self.url)}}
+        responses.add(responses.GET, self.url, body=json.dumps(body),
+                      status=200, content_type="application/json")
+        responses.add(responses.GET, self.url,
+                      body=json.dumps({'droplets': [{'id': 99}]}),
+                      status=200, content_type="application/json")
+        ids = [d.id for d in self.cli.iter_droplets(stream=True)]
+        self.assertEqual(ids, [d['id'] for d in body['droplets']] + [99])
+        self.assertEqual(len(responses.calls), 2)
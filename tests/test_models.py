@@ -0,0 +1,63 @@
+import json
+import os
+import unittest
+from datetime import datetime
+
+from batfish.models import Action, Droplet, Image, Region, Size
+
+
+class TestModels(unittest.TestCase):
+
+    def setUp(self):
+        package = os.path.join(os.path.dirname(__file__),
+                               'good_response.json')
+        with open(package) as f:
+            self.data = json.load(f)['droplets'][0]
+
+    def test_droplet_fields(self):
+        droplet = Droplet(self.data)
+        self.assertEqual(droplet.id, self.data['id'])
+        self.assertEqual(droplet.cpus, self.data['vcpus'])
+        self.assertEqual(droplet.size.name, "512MB")
+        self.assertEqual(droplet.size.monthly, 5.0)
+        self.assertEqual(droplet.kernel.id, 140)
+        self.assertEqual(droplet.region_name, "Amsterdam 1")
+        self.assertEqual(droplet.created, datetime(2013, 8, 1, 15, 24, 52))
+        ipv4 = droplet.networks['ipv4'][0]
+        self.assertEqual(ipv4.ip,
+                         self.data['networks']['v4'][0]['ip_address'])
+
+    def test_droplet_decoded_once(self):
+        droplet = Droplet(self.data)
+        self.assertTrue(droplet.created is droplet.created)
+        self.assertTrue(droplet.networks is droplet.networks)
+        self.assertTrue(droplet.size is droplet.size)
+
+    def test_namedtuple_types_shared(self):
+        d1 = Droplet(self.data)
+        d2 = Droplet(self.data)
+        self.assertTrue(type(d1.size) is type(d2.size))
+        self.assertTrue(type(d1.kernel) is type(d2.kernel))
+        self.assertTrue(type(d1.networks['ipv4'][0]) is
+                        type(d2.networks['ipv4'][0]))
+
+    def test_slots(self):
+        for model in (Action({}), Droplet({}), Image({}), Region({}),
+                      Size({})):
+            self.assertFalse(hasattr(model, '__dict__'))
+
+    def test_raw_kept_on_request(self):
+        self.assertEqual(Droplet(self.data).raw, None)
+        self.assertTrue(Droplet(self.data, keep_raw=True).raw is self.data)
+
+    def test_missing_fields(self):
+        droplet = Droplet({'name': 'test1'})
+        self.assertEqual(droplet.name, 'test1')
+        self.assertEqual(droplet.created, None)
+        self.assertEqual(droplet.networks, None)
+
+    def test_action_dates(self):
+        action = Action({'started_at': '2014-01-07T23:19:49Z',
+                         'completed_at': None})
+        self.assertEqual(action.started, datetime(2014, 1, 7, 23, 19, 49))
+        self.assertEqual(action.completed, None)
@@ -0,0 +1,110 @@
+import threading
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.ratelimit import RateLimiter
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(burst=2, clock=self.clock.time,
+                                   sleep=self.clock.sleep)
+
+    def headers(self, remaining, reset):
+        return {'RateLimit-Limit': "5000",
+                'RateLimit-Remaining': str(remaining),
+                'RateLimit-Reset': str(reset)}
+
+    def test_no_headers_no_wait(self):
+        for _ in range(10):
+            self.assertEqual(self.limiter.acquire(), 0)
+        self.assertEqual(self.clock.slept, [])
+
+    def test_burst_then_paced(self):
+        self.limiter.update(self.headers(100, 1100))
+        self.assertEqual(self.limiter.acquire(), 0)
+        self.assertEqual(self.limiter.acquire(), 0)
+        self.assertAlmostEqual(self.limiter.acquire(), 1.0)
+        self.assertAlmostEqual(self.limiter.acquire(), 2.0)
+        self.assertEqual(self.limiter.remaining, 96)
+
+    def test_refill_over_time(self):
+        self.limiter.update(self.headers(100, 1100))
+        self.limiter.acquire()
+        self.limiter.acquire()
+        self.clock.now += 1
+        self.assertEqual(self.limiter.acquire(), 0)
+
+    def test_exhausted_waits_for_reset(self):
+        self.limiter.update(self.headers(0, 1030))
+        self.assertAlmostEqual(self.limiter.acquire(), 30.0)
+
+    def test_reset_restores_budget(self):
+        self.limiter.update(self.headers(0, 1030))
+        self.clock.now = 1031
+        self.assertEqual(self.limiter.acquire(), 0)
+        self.assertEqual(self.limiter.remaining, 5000)
+
+    def test_not_paced_above_reserve(self):
+        self.limiter.update(self.headers(4999, 4600))
+        waited = sum(self.limiter.acquire() for _ in range(300))
+        self.assertEqual(waited, 0)
+        self.assertEqual(self.limiter.remaining, 4699)
+
+    def test_paced_below_reserve(self):
+        self.limiter.update(self.headers(501, 4600))
+        self.assertEqual(self.limiter.acquire(), 0)
+        self.assertEqual(self.limiter.acquire(), 0)
+        self.assertEqual(self.limiter.acquire(), 0)
+        self.assertAlmostEqual(self.limiter.acquire(), 3600 / 500.0)
+
+    def test_ignores_missing_headers(self):
+        self.limiter.update({})
+        self.assertEqual(self.limiter.limit, None)
+
+    def test_thread_safe(self):
+        self.limiter.update(self.headers(5000, 1100))
+        threads = [threading.Thread(target=self.limiter.acquire)
+                   for _ in range(50)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.limiter.remaining, 4950)
+
+
+class TestClientRateLimit(unittest.TestCase):
+
+    @responses.activate
+    def test_client_reads_headers(self):
+        limiter = RateLimiter()
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            cli = Client(rate_limiter=limiter)
+        url = "https://api.digitalocean.com/v2/kura"
+        responses.add(responses.GET, url, body='{}', status=200,
+                      content_type="application/json",
+                      headers={'RateLimit-Limit': "5000",
+                               'RateLimit-Remaining': "4999",
+                               'RateLimit-Reset': "1415984218"})
+        cli.get('kura')
+        self.assertEqual(limiter.limit, 5000)
+        self.assertEqual(limiter.remaining, 4999)
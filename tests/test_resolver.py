@@ -0,0 +1,81 @@
+import json
+import unittest
+
+import responses
+from mock import Mock, patch
+
+from batfish import Client
+from batfish.exceptions import AmbiguousName
+from batfish.resolver import Index, Resolver
+
+
+class TestIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = Index([{'name': 'web-1'}, {'name': 'web-10'},
+                            {'name': 'Web-2'}, {'name': 'db-1'},
+                            {'name': None}], 'name')
+
+    def test_exact_wins(self):
+        match = self.index.resolve('web-1')
+        self.assertEqual(match.item, {'name': 'web-1'})
+        self.assertFalse(match.ambiguous)
+
+    def test_unique_prefix(self):
+        self.assertEqual(self.index.resolve('DB').item, {'name': 'db-1'})
+
+    def test_ambiguous_prefix(self):
+        match = self.index.resolve('web')
+        self.assertTrue(match.ambiguous)
+        self.assertEqual([c['name'] for c in match.candidates],
+                         ['web-1', 'web-10', 'Web-2'])
+
+    def test_no_match(self):
+        match = self.index.resolve('mail')
+        self.assertEqual(match.item, None)
+        self.assertFalse(match.ambiguous)
+
+    def test_keys(self):
+        self.assertEqual(self.index.keys('web-1'), ['web-1', 'web-10'])
+        self.assertEqual(len(self.index), 4)
+
+
+class TestResolver(unittest.TestCase):
+
+    def test_index_built_once(self):
+        loader = Mock(return_value=[{'name': 'web-1'}])
+        resolver = Resolver({'droplets': loader})
+        resolver.resolve('droplets', 'name', 'web')
+        resolver.resolve('droplets', 'name', 'web-1')
+        self.assertEqual(loader.call_count, 1)
+        resolver.invalidate('droplets')
+        resolver.resolve('droplets', 'name', 'web')
+        self.assertEqual(loader.call_count, 2)
+
+
+class TestClientResolve(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        body = {'droplets': [{'id': 1, 'name': 'web-1'},
+                             {'id': 2, 'name': 'web-2'},
+                             {'id': 3, 'name': 'db-1'}]}
+        responses.add(responses.GET,
+                      "https://api.digitalocean.com/v2/droplets",
+                      body=json.dumps(body), status=200,
+                      content_type="application/json")
+
+    @responses.activate
+    def test_droplet_from_name_single_download(self):
+        self.assertEqual(self.cli.droplet_from_name('web-1').id, 1)
+        self.assertEqual(self.cli.droplet_from_name('db').id, 3)
+        self.assertEqual(self.cli.droplet_from_name('mail'), None)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_droplet_from_name_ambiguous(self):
+        with self.assertRaises(AmbiguousName) as e:
+            self.cli.droplet_from_name('web')
+        self.assertEqual(e.exception.candidates, ['web-1', 'web-2'])
@@ -0,0 +1,97 @@
+import unittest
+
+import responses
+from requests import ConnectionError, HTTPError
+from mock import Mock, patch
+
+from batfish import Client
+from batfish.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_delay_is_capped_with_jitter(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=4)
+        for attempt in range(1, 10):
+            delay = policy.delay(attempt)
+            self.assertTrue(0 <= delay <= min(4, 2 ** (attempt - 1)))
+
+    def test_delay_honours_retry_after(self):
+        policy = RetryPolicy()
+        response = Mock(headers={'Retry-After': "7"})
+        self.assertEqual(policy.delay(1, response), 7.0)
+
+    def test_should_retry_idempotent_only(self):
+        policy = RetryPolicy()
+        response = Mock(status_code=503)
+        self.assertTrue(policy.should_retry('GET', 1, response=response))
+        self.assertFalse(policy.should_retry('POST', 1, response=response))
+        self.assertFalse(policy.should_retry('GET', 3, response=response))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after(None), None)
+        self.assertEqual(parse_retry_after("bogus"), None)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"),
+                         0.0)
+
+
+class TestClientRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = Mock()
+        self.sleep = Mock()
+        self.policy = RetryPolicy(on_retry=self.hook, sleep=self.sleep)
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client(retry=self.policy)
+        self.url = "https://api.digitalocean.com/v2/kura"
+
+    @responses.activate
+    def test_get_retries_then_succeeds(self):
+        responses.add(responses.GET, self.url, body='{}', status=502,
+                      content_type="application/json")
+        responses.add(responses.GET, self.url, body='{}', status=429,
+                      content_type="application/json",
+                      headers={'Retry-After': "2"})
+        responses.add(responses.GET, self.url, body='{"message": "ok"}',
+                      status=200, content_type="application/json")
+        self.assertEqual(self.cli.get('kura')['message'], "ok")
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.policy.retries, 2)
+        self.assertEqual(self.hook.call_count, 2)
+        self.sleep.assert_called_with(2.0)
+
+    @responses.activate
+    def test_get_gives_up(self):
+        responses.add(responses.GET, self.url, body='{}', status=500,
+                      content_type="application/json")
+        with self.assertRaises(HTTPError):
+            self.cli.get('kura')
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_post_not_retried(self):
+        responses.add(responses.POST, self.url, body='{}', status=503,
+                      content_type="application/json")
+        with self.assertRaises(HTTPError):
+            self.cli.post('kura', {})
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.policy.retries, 0)
+
+    @responses.activate
+    def test_connection_error_retried(self):
+        responses.add(responses.GET, self.url, body=ConnectionError())
+        responses.add(responses.GET, self.url, body='{}', status=200,
+                      content_type="application/json")
+        self.cli.get('kura')
+        self.assertEqual(self.policy.retries, 1)
+
+    def test_retried_response_closed(self):
+        failed = Mock(status_code=503, headers={})
+        ok = Mock(status_code=200, headers={})
+        with patch.object(self.cli.session, 'request',
+                          side_effect=[failed, ok]):
+            r = self.cli._request('GET', 'kura', {}, stream=True)
+        self.assertTrue(r is ok)
+        failed.close.assert_called_once_with()
+        self.assertFalse(ok.close.called)
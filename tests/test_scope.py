@@ -0,0 +1,63 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.models import Droplet, Image
+
+
+class TestScope(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/"
+        regions = [{'slug': 'nyc1', 'name': 'New York 1'},
+                   {'slug': 'ams1', 'name': 'Amsterdam 1'}]
+        responses.add(responses.GET, self.url + "regions",
+                      body=json.dumps({'regions': regions}), status=200,
+                      content_type="application/json")
+        responses.add(responses.GET, self.url + "images",
+                      body=json.dumps({'images': [{'id': 1, 'name': 'a'}]}),
+                      status=200, content_type="application/json")
+
+    @responses.activate
+    def test_image_regions_single_request(self):
+        images = [Image({'id': i, 'regions': ['nyc1', 'ams1', 'sfo1']})
+                  for i in range(50)]
+        with self.cli.scope() as scope:
+            for image in images:
+                regions = image.regions(scope)
+        self.assertEqual([r and r.slug for r in regions],
+                         ['nyc1', 'ams1', None])
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_image_regions_client(self):
+        image = Image({'id': 1, 'regions': ['nyc1', 'ams1']})
+        self.assertEqual([r.slug for r in image.regions(self.cli)],
+                         ['nyc1', 'ams1'])
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_image_regions_client_shares_listing(self):
+        for i in range(200):
+            image = Image({'id': i, 'regions': ['nyc1', 'kura']})
+            self.assertEqual(image.regions(self.cli)[1], None)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_droplet_image_fetched_once(self):
+        responses.add(responses.GET, self.url + "images/2",
+                      body=json.dumps({'image': {'id': 2, 'name': 'b'}}),
+                      status=200, content_type="application/json")
+        droplets = [Droplet({'id': i, 'image': {'id': 1 + i % 2}})
+                    for i in range(10)]
+        scope = self.cli.scope()
+        names = [d.image(scope).name for d in droplets]
+        self.assertEqual(names, ['a', 'b'] * 5)
+        self.assertEqual([c.request.url.split('?')[0][len(self.url):]
+                          for c in responses.calls], ['images', 'images/2'])
@@ -0,0 +1,59 @@
+import json
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+from batfish.sync import FleetSync
+
+
+class TestFleetSync(unittest.TestCase):
+
+    def setUp(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            self.cli = Client()
+        self.url = "https://api.digitalocean.com/v2/droplets"
+
+    def add(self, *droplets):
+        responses.add(responses.GET, self.url,
+                      body=json.dumps({'droplets': list(droplets)}),
+                      status=200, content_type="application/json")
+
+    @responses.activate
+    def test_changes(self):
+        self.add({'id': 1, 'name': 'web-1', 'status': 'new'},
+                 {'id': 2, 'name': 'web-2', 'status': 'active'})
+        self.add({'id': 1, 'name': 'web-1', 'status': 'active'},
+                 {'id': 3, 'name': 'web-3', 'status': 'new'})
+        first = self.cli.sync_droplets()
+        self.assertEqual([d.id for d in first.added], [1, 2])
+        self.assertEqual(len(first), 2)
+        state = json.loads(json.dumps(first.state))
+        second = self.cli.sync_droplets(state)
+        self.assertEqual([d.id for d in second.added], [3])
+        self.assertEqual(second.removed, [2])
+        self.assertEqual(len(second.changed), 1)
+        self.assertEqual(second.changed[0].droplet.status, 'active')
+        self.assertEqual(second.changed[0].fields, set(['status']))
+
+    @responses.activate
+    def test_unchanged_and_ignored(self):
+        self.add({'id': 1, 'name': 'web-1', 'locked': False})
+        self.add({'id': 1, 'name': 'web-1', 'locked': True})
+        fleet = FleetSync(self.cli, ignore=['locked'])
+        fleet.sync()
+        self.assertEqual(len(fleet.sync()), 0)
+
+    @responses.activate
+    def test_unchanged_fields_not_fingerprinted(self):
+        self.add({'id': 1, 'name': 'web-1'}, {'id': 2, 'name': 'web-2'})
+        self.add({'id': 1, 'name': 'web-1'}, {'id': 2, 'name': 'db-2'})
+        fleet = FleetSync(self.cli)
+        fleet.sync()
+        with patch.object(fleet, '_fingerprints',
+                          wraps=fleet._fingerprints) as fields:
+            changes = fleet.sync()
+        self.assertEqual(fields.call_count, 1)
+        self.assertEqual(changes.changed[0].fields, set(['name']))
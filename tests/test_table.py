@@ -0,0 +1,72 @@
+import json
+import os
+import unittest
+
+import responses
+from mock import patch
+
+from batfish import Client
+
+try:
+    import numpy as np
+    from batfish.table import DropletTable
+except ImportError:
+    np = None
+
+
+def droplet(droplet_id, region, size, price, created):
+    return {'id': droplet_id, 'name': "web-{0}".format(droplet_id),
+            'status': 'active', 'vcpus': 1, 'memory': 512, 'disk': 20,
+            'region': {'slug': region},
+            'size': {'slug': size, 'price_hourly': price / 672.0,
+                     'price_monthly': price},
+            'created_at': created}
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestDropletTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = DropletTable.from_dicts(iter([
+            droplet(1, 'ams2', '512mb', 5.0, '2014-01-01T00:00:00Z'),
+            droplet(2, 'nyc3', '1gb', 10.0, '2014-06-01T00:00:00Z'),
+            droplet(3, 'ams2', '1gb', 10.0, '2014-09-01T00:00:00Z'),
+        ]))
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table['id'].tolist(), [1, 2, 3])
+        self.assertEqual(self.table['created_at'].dtype,
+                         np.dtype('datetime64[s]'))
+
+    def test_filter(self):
+        ams = self.table[self.table['region'] == 'ams2']
+        self.assertEqual(ams['name'].tolist(), ['web-1', 'web-3'])
+        self.assertEqual(ams.sum('price_monthly'), 15.0)
+
+    def test_group_by(self):
+        self.assertEqual(self.table.count_by('size'), {'512mb': 1, '1gb': 2})
+        self.assertEqual(self.table.sum_by('region', 'price_monthly'),
+                         {'ams2': 15.0, 'nyc3': 10.0})
+
+    def test_older_than(self):
+        old = self.table.older_than(
+            30, now=np.datetime64('2014-09-15T00:00:00'))
+        self.assertEqual(old['id'].tolist(), [1, 2])
+
+    @responses.activate
+    def test_client_droplet_table(self):
+        with patch('batfish.client.read_token_from_conf',
+                   return_value="test_token"):
+            cli = Client()
+        package = os.path.join(os.path.dirname(__file__),
+                               'good_response.json')
+        with open(package) as f:
+            body = f.read()
+        responses.add(responses.GET,
+                      "https://api.digitalocean.com/v2/droplets",
+                      body=body, status=200,
+                      content_type="application/json")
+        table = cli.droplet_table()
+        self.assertEqual(table['id'].tolist(),
+                         [d['id'] for d in json.loads(body)['droplets']])